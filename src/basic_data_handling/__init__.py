@@ -1,9 +1,10 @@
-from . import (boolean_nodes, casting_nodes, comparison_nodes, control_flow_nodes,
+from . import (bitset_nodes, boolean_nodes, casting_nodes, comparison_nodes, control_flow_nodes,
                data_list_nodes, dict_nodes, float_nodes, int_nodes, list_nodes,
                math_nodes, math_formula_node, path_nodes, regex_nodes, set_nodes,
                string_nodes, time_nodes)
 
 NODE_CLASS_MAPPINGS = {}
+NODE_CLASS_MAPPINGS.update(bitset_nodes.NODE_CLASS_MAPPINGS)
 NODE_CLASS_MAPPINGS.update(boolean_nodes.NODE_CLASS_MAPPINGS)
 NODE_CLASS_MAPPINGS.update(casting_nodes.NODE_CLASS_MAPPINGS)
 NODE_CLASS_MAPPINGS.update(comparison_nodes.NODE_CLASS_MAPPINGS)
@@ -22,6 +23,7 @@ NODE_CLASS_MAPPINGS.update(string_nodes.NODE_CLASS_MAPPINGS)
 NODE_CLASS_MAPPINGS.update(time_nodes.NODE_CLASS_MAPPINGS)
 
 NODE_DISPLAY_NAME_MAPPINGS = {}
+NODE_DISPLAY_NAME_MAPPINGS.update(bitset_nodes.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(boolean_nodes.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(casting_nodes.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(comparison_nodes.NODE_DISPLAY_NAME_MAPPINGS)
@@ -0,0 +1,147 @@
+from collections.abc import Set
+from typing import Any, Callable, Iterable, Iterator
+
+from ._range_list import RangeList
+
+MAX_VALUE = 2**26 - 1  # limits a BITSET to 8 MiB, so a single large value can't allocate gigabytes
+
+# The positions of the set bits of every byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def _bit_count(bits: int) -> int:
+    return bits.bit_count() if hasattr(bits, "bit_count") else bin(bits).count("1")  # bit_count is Python 3.10+
+
+
+class BitSet(Set[int]):
+    """
+    An immutable SET of non-negative integers that stores one bit per possible value.
+
+    Bit i of a Python int is set when i is in the set, so a dense set of IDs, like
+    frame indices or dataset rows, needs 1 bit instead of about 60 bytes per element
+    and union, intersection and difference are single `|`, `&` and `& ~` operations
+    on the int that run over whole machine words. Values are limited to `MAX_VALUE`
+    (67,108,863), as the memory and the time to create the set depend on the largest
+    value and not on the number of elements.
+
+    It can be used like a read only `frozenset`: `len`, `in`, iteration in ascending
+    order, comparisons and the set operators all work, also together with normal SETs.
+    """
+    __slots__ = ("_bits",)
+
+    _bits: int
+
+    def __init__(self, values: Iterable[Any] = ()):
+        if isinstance(values, BitSet):
+            self._bits = values._bits
+        elif isinstance(values, (range, RangeList)):
+            self._bits = BitSet.from_range(values if isinstance(values, range) else values.range)._bits
+        else:
+            self._bits = BitSet._from_values(values)._bits
+
+    @classmethod
+    def _from_bits(cls, bits: int) -> "BitSet":
+        bitset = cls.__new__(cls)
+        bitset._bits = bits
+        return bitset
+
+    @classmethod
+    def _from_values(cls, values: Iterable[Any]) -> "BitSet":
+        values = values if isinstance(values, (list, tuple, set, frozenset, range, RangeList)) else list(values)
+        if not values:
+            return cls._from_bits(0)
+        try:
+            smallest, largest = min(values), max(values)
+            if smallest < 0 or largest > MAX_VALUE or any(not isinstance(value, int) for value in values):
+                raise ValueError
+        except (TypeError, ValueError):
+            raise ValueError(f"A BITSET can only hold INTs from 0 to {MAX_VALUE}") from None
+
+        buffer = bytearray(largest // 8 + 1)
+        for value in values:
+            buffer[value >> 3] |= 1 << (value & 7)
+        return cls._from_bits(int.from_bytes(buffer, "little"))
+
+    @classmethod
+    def from_range(cls, values: range) -> "BitSet":
+        """Creates the BitSet of a range, for a step of 1 without a loop over the values."""
+        if not values:
+            return cls._from_bits(0)
+        if values.step < 0:
+            values = values[::-1]
+        if values[0] < 0 or values[-1] > MAX_VALUE:
+            raise ValueError(f"A BITSET can only hold INTs from 0 to {MAX_VALUE}")
+        if values.step == 1:
+            return cls._from_bits(((1 << len(values)) - 1) << values[0])
+        return cls._from_values(values)
+
+    def __len__(self) -> int:
+        return _bit_count(self._bits)
+
+    def __contains__(self, value: Any) -> bool:
+        return isinstance(value, int) and value >= 0 and self._bits >> value & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_list())
+
+    def to_list(self) -> list[int]:
+        """Returns the values in ascending order, by looking up the set bits of each byte."""
+        data = self._bits.to_bytes((self._bits.bit_length() + 7) // 8, "little")
+        return [index * 8 + bit for index, byte in enumerate(data) if byte for bit in _BYTE_BITS[byte]]
+
+    def __repr__(self) -> str:
+        return f"BitSet({self.to_list()!r})"
+
+    def __reduce__(self) -> tuple[Callable[[int], "BitSet"], tuple[int]]:
+        return BitSet._from_bits, (self._bits,)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BitSet):
+            return self._bits == other._bits
+        return super().__eq__(other)
+
+    __hash__ = Set._hash  # equal to the hash of an equal frozenset
+
+    def __or__(self, other: Any) -> Any:
+        if isinstance(other, BitSet):
+            return BitSet._from_bits(self._bits | other._bits)
+        return super().__or__(other)
+
+    def __and__(self, other: Any) -> Any:
+        if isinstance(other, BitSet):
+            return BitSet._from_bits(self._bits & other._bits)
+        return super().__and__(other)
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, BitSet):
+            return BitSet._from_bits(self._bits & ~other._bits)
+        return super().__sub__(other)
+
+    def __xor__(self, other: Any) -> Any:
+        if isinstance(other, BitSet):
+            return BitSet._from_bits(self._bits ^ other._bits)
+        return super().__xor__(other)
+
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, BitSet):
+            return self._bits & ~other._bits == 0
+        return super().__le__(other)
+
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, BitSet):
+            return other._bits & ~self._bits == 0
+        return super().__ge__(other)
+
+    def isdisjoint(self, other: Any) -> bool:
+        if isinstance(other, BitSet):
+            return self._bits & other._bits == 0
+        return super().isdisjoint(other)
+
+    @classmethod
+    def _from_iterable(cls, values: Iterable[Any]) -> Any:
+        # Used by the operators of Set with other iterables, keep the result a BitSet when possible
+        values = list(values)
+        try:
+            return cls._from_values(values)
+        except ValueError:
+            return frozenset(values)
@@ -0,0 +1,47 @@
+from typing import Any, Iterable
+
+CAST_TYPES = {"INT": int, "FLOAT": float, "BOOLEAN": bool, "STRING": str}
+ERROR_POLICIES = ("raise", "default", "drop")
+
+_CAST_ERRORS = (ValueError, TypeError, OverflowError)
+_ARTICLES = {"INT": "an", "FLOAT": "a", "BOOLEAN": "a", "STRING": "a"}
+
+
+def cast_all(values: Iterable[Any], type_name: str, errors: str = "raise", default: Any = None) -> tuple[list[Any], list[int]]:
+    """
+    Casts all values to the type ("INT", "FLOAT", "BOOLEAN" or "STRING") in one call.
+
+    The whole input is first converted with a single `map` of the type, which runs
+    without any per item exception handling. Only when that fails the values are
+    converted one by one, and the values that can't be converted are handled by the
+    `errors` policy: "raise" raises a ValueError, "default" replaces them with
+    `default` (the zero value of the type when None) and "drop" leaves them out.
+
+    Returns the converted values and the indices of the values that failed.
+    """
+    if type_name not in CAST_TYPES:
+        raise ValueError(f"Unknown type '{type_name}', expected one of {', '.join(CAST_TYPES)}")
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"Unknown error policy '{errors}', expected one of {', '.join(ERROR_POLICIES)}")
+
+    convert = CAST_TYPES[type_name]
+    values = values if hasattr(values, "__len__") else list(values)  # iterated twice on errors
+    try:
+        return list(map(convert, values)), []
+    except _CAST_ERRORS:
+        pass
+
+    if default is None:
+        default = convert()
+    result: list[Any] = []
+    failed: list[int] = []
+    for index, value in enumerate(values):
+        try:
+            result.append(convert(value))
+        except _CAST_ERRORS:
+            if errors == "raise":
+                raise ValueError(f"Cannot convert {value} at index {index} to {_ARTICLES[type_name]} {type_name}.")
+            failed.append(index)
+            if errors == "default":
+                result.append(default)
+    return result, failed
@@ -0,0 +1,182 @@
+import pickle
+import weakref
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import RLock
+from typing import Any, Hashable, Optional
+
+try:
+    from comfy_execution.utils import get_executing_context  # type: ignore[import-not-found]
+except ImportError:
+    get_executing_context = None
+
+from ._range_list import RangeList
+
+DIGEST_SIZE = 16
+
+
+def _digest(value: Any) -> bytes:
+    hasher = blake2b(digest_size=DIGEST_SIZE)
+    _update(hasher, value)
+    return hasher.digest()
+
+
+def _update(hasher: blake2b, value: Any) -> None:
+    # Every value is prefixed by a type tag, so e.g. 1, 1.0, "1" and [1] all hash differently
+    if value is None or isinstance(value, bool):
+        hasher.update(b"c" + repr(value).encode())
+    elif isinstance(value, int):
+        hasher.update(b"i%d;" % value)
+    elif isinstance(value, float):
+        hasher.update(b"f" + value.hex().encode() + b";")
+    elif isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        hasher.update(b"s%d:" % len(data))
+        hasher.update(data)
+    elif isinstance(value, (bytes, bytearray)):
+        hasher.update(b"b%d:" % len(value))
+        hasher.update(value)
+    elif isinstance(value, (list, tuple, RangeList)):
+        hasher.update(b"l%d:" % len(value))
+        for item in value:
+            _update(hasher, item)
+    elif isinstance(value, dict):
+        # Equal DICTs must hash equal independent of their insertion order
+        hasher.update(b"d%d:" % len(value))
+        for pair_digest in sorted(_digest((key, item)) for key, item in value.items()):
+            hasher.update(pair_digest)
+    elif isinstance(value, (set, frozenset)):
+        hasher.update(b"S%d:" % len(value))
+        for item_digest in sorted(_digest(item) for item in value):
+            hasher.update(item_digest)
+    elif hasattr(value, "shape") and hasattr(value, "dtype") and _update_array(hasher, value):
+        pass  # NumPy arrays and torch tensors
+    else:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            hasher.update(b"p%d:" % len(data))
+        except Exception:
+            data = f"{type(value).__qualname__}:{value!r}".encode("utf-8", "surrogatepass")
+            hasher.update(b"r%d:" % len(data))
+        hasher.update(data)
+
+
+def _update_array(hasher: blake2b, value: Any) -> bool:
+    """Hashes the dtype, shape and raw data of an array, returns False when it has no raw data."""
+    if hasattr(value, "detach"):  # torch tensor
+        tensor = value.detach().cpu().contiguous()
+        header = f"{tensor.dtype}{tuple(tensor.shape)}"
+        try:
+            data = tensor.numpy()
+        except TypeError:  # dtypes that NumPy doesn't know, like bfloat16
+            import torch
+            data = tensor.view(torch.uint8).numpy()
+    else:
+        import numpy as np
+        if value.dtype.hasobject:
+            return False
+        data = np.ascontiguousarray(value)
+        header = f"{data.dtype.str}{data.shape}"
+
+    header_bytes = header.encode()
+    hasher.update(b"a%d:" % len(header_bytes))
+    hasher.update(header_bytes)
+    hasher.update(data)
+    return True
+
+
+def content_hash(value: Any) -> str:
+    """
+    Returns a stable hash of the content of a value as a hex string.
+
+    Equal LISTs, DICTs and SETs give the same hash, independent of the order of the
+    DICT and SET items, and the hash is the same in every process, so it can be used
+    as a cache key. The content is fed incrementally into a blake2b digest, so no
+    serialized copy of large containers is created.
+    """
+    return _digest(value).hex()
+
+
+class HashMemo:
+    """
+    Remembers the content hashes of containers and arrays by their identity.
+
+    A value that was already hashed within the same scope, e.g. by an earlier call of
+    a node in the same prompt, isn't hashed again. Values that support weak references,
+    like tensors and arrays, are only referenced weakly and forgotten when they are
+    freed. LISTs, DICTs and SETs don't support weak references, so they are referenced
+    until they are hashed with `release` set, the scope changes or more than `maxsize`
+    values are remembered, which keeps their id from being reused by another object
+    while it is remembered. Without a scope nothing is remembered. The values must not
+    be changed in place after they were hashed, which the nodes of this package never do.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._scope: Optional[Hashable] = None
+        self._entries: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+        self._lock = RLock()  # weak reference callbacks can run while the lock is held
+
+    def hash(self, value: Any, scope: Optional[Hashable] = None, release: bool = False) -> str:
+        if scope is None or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+            return content_hash(value)  # cheap to hash and ids of small values are reused
+
+        key = id(value)
+        with self._lock:
+            if scope != self._scope:
+                self._entries.clear()
+                self._scope = scope
+            entry = self._entries.get(key)
+            if entry is not None and self._referent(entry[0]) is value:
+                if release:
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                return entry[1]
+
+        digest = content_hash(value)
+        if release:
+            return digest
+        try:
+            reference: Any = weakref.ref(value, lambda ref: self._forget(key, ref))
+        except TypeError:
+            reference = value  # no weak references possible, keep it alive while it is remembered
+        with self._lock:
+            self._entries[key] = (reference, digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return digest
+
+    @staticmethod
+    def _referent(reference: Any) -> Any:
+        return reference() if isinstance(reference, weakref.ref) else reference
+
+    def _forget(self, key: int, reference: weakref.ref[Any]) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is reference:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _prompt_scope() -> Optional[Hashable]:
+    """Returns the id of the prompt that ComfyUI is executing, or None when it isn't known."""
+    if get_executing_context is None:
+        return None
+    context = get_executing_context()
+    return getattr(context, "prompt_id", None)
+
+
+PROMPT_HASHES = HashMemo()
+
+
+def prompt_content_hash(value: Any, release: bool = False) -> str:
+    """
+    Returns `content_hash(value)`, remembered by the identity of the value during the
+    current prompt, so a LIST, DICT, SET, data list or tensor that is used by several
+    calls is only hashed once. Set `release` on the last use to forget the value.
+    """
+    return PROMPT_HASHES.hash(value, _prompt_scope(), release)
+
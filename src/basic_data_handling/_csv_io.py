@@ -0,0 +1,90 @@
+import csv
+from itertools import chain, islice
+from typing import Any, Iterator, Optional
+
+
+def _column_indices(selection: str, header: Optional[list[str]]) -> Optional[list[int]]:
+    """Resolves comma separated column names or 0 based numbers, returns None for all columns."""
+    names = [name.strip() for name in selection.split(",") if name.strip()]
+    if not names:
+        return None
+    indices = []
+    for name in names:
+        if header is not None and name in header:
+            indices.append(header.index(name))
+        elif name.isdigit():
+            indices.append(int(name))
+        else:
+            raise ValueError(f"Unknown CSV column '{name}'")
+    return indices
+
+
+def infer_column(values: list[str]) -> list[Any]:
+    """
+    Converts a column of strings to INTs, FLOATs or BOOLEANs ("true"/"false") when all
+    of its values can be converted, otherwise the strings are returned unchanged.
+    """
+    for convert in (int, float):
+        try:
+            return list(map(convert, values))
+        except ValueError:
+            pass
+    if values and all(value.strip().lower() in ("true", "false") for value in values):
+        return [value.strip().lower() == "true" for value in values]
+    return values
+
+
+def read_csv_columns(
+    path: str,
+    columns: str = "",
+    has_header: bool = True,
+    delimiter: str = ",",
+    start: int = 0,
+    limit: int = -1,
+    infer_types: bool = True,
+    encoding: str = "utf-8",
+    max_columns: int = -1,
+) -> tuple[list[str], list[list[Any]]]:
+    """
+    Reads the selected columns of a CSV file in a single streaming pass.
+
+    The file is parsed row by row by the `csv` module and only the fields of the
+    selected columns of the rows in the range `start` to `start + limit` (all when
+    `limit` is negative) are kept, reading stops after the last row of the range.
+    `columns` are comma separated header names or 0 based column numbers, all columns
+    (but at most `max_columns` when it isn't negative) when empty. Column numbers must
+    be within the width of the header, or of the first row when there is no header.
+    Missing fields of short rows are empty strings.
+
+    Returns the names of the selected columns and the values of each column.
+    """
+    delimiter = delimiter.replace("\\t", "\t") or ","
+    with open(path, "r", encoding=encoding, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None) if has_header else None
+        indices = _column_indices(columns, header)
+        start = max(0, start)
+        rows: Iterator[list[str]] = islice(reader, start, None if limit < 0 else start + limit)
+
+        first = next(rows, None)
+        width = len(header) if header is not None else len(first or [])
+        if first is not None:
+            rows = chain([first], rows)
+        if indices is None:
+            indices = list(range(width if max_columns < 0 else min(width, max_columns)))
+        elif first is not None or header is not None:
+            for index in indices:
+                if index >= width:
+                    raise ValueError(f"CSV column {index} doesn't exist, the file has {width} columns")
+
+        values: list[list[Any]] = [[] for _ in indices]
+        for row in rows:
+            width = len(row)
+            for column, index in zip(values, indices):
+                column.append(row[index] if index < width else "")
+
+    names = [header[index] if header is not None and index < len(header) else str(index) for index in indices]
+    if infer_types:
+        values = [infer_column(column) for column in values]
+    return names, values
+
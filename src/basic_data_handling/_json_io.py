@@ -0,0 +1,165 @@
+import json
+import math
+import os
+import shutil
+import uuid
+from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator
+
+try:
+    import orjson  # optional, only used to speed up decoding and encoding
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ._range_list import RangeList
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+def _default(value: Any) -> Any:
+    """Encodes sequences that aren't a list, like the RangeList of the range nodes, as a JSON array."""
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # let json raise its error, it also accepts e.g. NaN
+    return json.loads(data)
+
+
+def _finite(value: Any) -> Any:
+    """Returns the value with all NaN and infinite floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Compact UTF-8 encoded JSON of a value. NaN and infinite floats are encoded as null,
+    like orjson does, as JSON has no representation for them.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bit, json can still encode those
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_default).encode("utf-8")
+    except ValueError:  # NaN or infinity
+        return json.dumps(_finite(value), ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+@contextmanager
+def atomic_writer(path: str, create_dirs: bool) -> Iterator[IO[bytes]]:
+    """
+    Opens a temporary file next to the path for writing, that replaces the file at the
+    path only when everything was written, so a failed save keeps an existing file.
+    """
+    if not path:
+        raise ValueError("No path specified")
+    directory = os.path.dirname(path)
+    if directory and create_dirs:
+        os.makedirs(directory, exist_ok=True)
+    temporary = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary, "xb", buffering=_BUFFER_SIZE) as f:
+            yield f
+        if os.path.exists(path):
+            shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(path: str) -> Any:
+    """Loads the JSON file at the path."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return _loads(data)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON in {path}: {e}") from None
+
+
+def iter_json_lines(path: str, start: int = 0, limit: int = -1) -> Iterator[Any]:
+    """
+    Yields the records of a JSON Lines file one by one, so only one line is in memory
+    at a time. Empty lines are skipped, `start` records are skipped and at most `limit`
+    records (all when negative) are read, without decoding the lines outside this range.
+    """
+    def lines() -> Iterator[tuple[int, bytes]]:
+        with open(path, "rb") as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield number, line
+
+    for number, line in islice(lines(), max(0, start), None if limit < 0 else max(0, start) + limit):
+        try:
+            yield _loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON in line {number} of {path}: {e}") from None
+
+
+def save_json(value: Any, path: str, indent: int = 0, create_dirs: bool = True) -> None:
+    """
+    Saves a value as a JSON file, compact when `indent` is 0.
+
+    The items of a compact LIST are encoded and written one by one, and indented JSON
+    is encoded piece by piece while it is written, so no string of the whole file is
+    created. Compact JSON is encoded by orjson when it is installed. NaN and infinite
+    floats are saved as null. The file is only replaced when the value could be encoded.
+    """
+    with atomic_writer(path, create_dirs) as f:
+        if indent <= 0 and isinstance(value, (list, tuple, RangeList)):
+            f.write(b"[")
+            for i, item in enumerate(value):
+                if i:
+                    f.write(b",")
+                f.write(_dumps(item))
+            f.write(b"]")
+        elif indent <= 0:
+            f.write(_dumps(value))
+        else:
+            try:
+                _write_indented(f, value, indent)
+            except ValueError:  # NaN or infinity, start again without them
+                f.seek(0)
+                f.truncate()
+                _write_indented(f, _finite(value), indent)
+
+
+def _write_indented(f: IO[bytes], value: Any, indent: int) -> None:
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent, allow_nan=False, default=_default)
+    for chunk in encoder.iterencode(value):
+        f.write(chunk.encode("utf-8"))
+
+
+def save_json_lines(values: Iterable[Any], path: str, create_dirs: bool = True) -> int:
+    """
+    Saves every value as one line of a JSON Lines file and returns the number of lines.
+    NaN and infinite floats are saved as null. The file is only replaced when all values
+    could be encoded.
+    """
+    count = 0
+    with atomic_writer(path, create_dirs) as f:
+        for value in values:
+            f.write(_dumps(value))
+            f.write(b"\n")
+            count += 1
+    return count
@@ -0,0 +1,131 @@
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+
+_private_directory: Optional[str] = None
+_private_directory_lock = Lock()
+
+
+def private_spill_directory() -> str:
+    """
+    Returns a directory for the spill files that only this process uses.
+
+    It is created by `tempfile.mkdtemp` on first use, so it is only accessible by the
+    current user (mode 0700) and its name can't be predicted by others, and it is
+    removed with its files when the process exits.
+    """
+    global _private_directory
+    with _private_directory_lock:
+        if _private_directory is None:
+            _private_directory = tempfile.mkdtemp(prefix="basic_data_handling_cache_")
+            atexit.register(shutil.rmtree, _private_directory, ignore_errors=True)
+        return _private_directory
+
+class _Spilled:
+    """Marks a value that was written to a pickle file instead of being kept in memory."""
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path
+
+
+class MemoCache:
+    """
+    A least recently used cache of values with an optional time to live.
+
+    Values whose pickled size is at least `spill_bytes` (when > 0) are written to a
+    pickle file in `directory` (by default a private directory of the process) and
+    only loaded again on a hit, so large values don't stay in memory. Spilled files
+    are removed when their entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 16, ttl: float = 0.0, spill_bytes: int = 0, directory: str = ""):
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = Lock()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.spill_bytes = spill_bytes
+        self.directory = directory
+
+    def configure(self, max_entries: int, ttl: float, spill_bytes: int) -> None:
+        with self._lock:
+            self.max_entries = max(0, max_entries)
+            self.ttl = ttl
+            self.spill_bytes = spill_bytes
+            self._evict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, stored = entry
+            if self.ttl > 0 and time.monotonic() - stored > self.ttl:
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+
+        if isinstance(value, _Spilled):
+            try:
+                with open(value.path, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                with self._lock:
+                    self._remove(key)
+                return default
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        """Checks for a value that isn't expired, without loading a spilled value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not (self.ttl > 0 and time.monotonic() - entry[1] > self.ttl)
+
+    def put(self, key: str, value: Any) -> None:
+        stored = self._spill(key, value) if self.spill_bytes > 0 else value
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (stored, time.monotonic())
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _spill(self, key: str, value: Any) -> Any:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return value  # values that can't be pickled stay in memory
+        if len(data) < self.spill_bytes:
+            return value
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+        directory = self.directory or private_spill_directory()
+        path = os.path.join(directory, f"{id(self):x}-{key}.pkl")  # unique per cache
+        with open(path, "wb") as f:
+            f.write(data)
+        return _Spilled(path)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        if isinstance(value, _Spilled):
+            try:
+                os.remove(value.path)
+            except OSError:
+                pass
@@ -0,0 +1,158 @@
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Union
+
+from ._regex_guard import has_group_reference
+
+# Number of scan stops at patterns that were already found, after which the scan
+# continues with an alternation of only the remaining patterns
+_WASTED_STOPS = 16
+
+
+class KeywordTrie:
+    """
+    Aho-Corasick automaton that finds which of many literal keywords occur in a text.
+
+    The text is scanned once, character by character, independent of the number of
+    keywords. Overlapping and nested keywords are all reported.
+    """
+
+    def __init__(self, keywords: tuple[str, ...], ignorecase: bool = False):
+        self.ignorecase = ignorecase
+        self.size = len(keywords)
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[list[int]] = [[]]
+
+        for index, keyword in enumerate(keywords):
+            if ignorecase:
+                keyword = keyword.casefold()
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Breadth first calculation of the failure links. The outputs of the
+        # failure state are merged, so that a scan only has to look at one list.
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> set[int]:
+        """Returns the indices of all keywords that occur in the text."""
+        if self.ignorecase:
+            text = text.casefold()
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set(output[0])  # empty keywords are always found
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+                if len(found) == self.size:
+                    break
+        return found
+
+
+@lru_cache(maxsize=256)
+def _alternation(patterns: tuple[str, ...], indices: tuple[int, ...], flags: int, named: bool) -> re.Pattern[str]:
+    """Compiles the patterns at the indices into one alternation, with a named group per pattern when `named`."""
+    if named:
+        return re.compile("|".join(f"(?P<_pattern_{index}>{patterns[index]})" for index in indices), flags)
+    return re.compile("|".join(f"(?:{patterns[index]})" for index in indices), flags)
+
+
+def _combinable(pattern: str, flags: int) -> bool:
+    """
+    Whether the pattern keeps its meaning in an alternation with other patterns. References
+    to groups and named groups would refer to or clash with the groups of the other
+    patterns, and inline global flags would apply to all patterns.
+    """
+    compiled = re.compile(pattern, flags)  # raises re.error for invalid patterns
+    return not compiled.groupindex and compiled.flags == re.compile("", flags).flags and not has_group_reference(pattern, flags)
+
+
+class PatternAlternation:
+    """
+    Finds which of many regular expressions match somewhere in a text.
+
+    The patterns are combined into a single alternation that is used to scan the
+    text. Where it matches, an alternation with a named group for each pattern tells
+    from the group name the first pattern that matches there, and only the patterns
+    after it that weren't found yet are tried at the same position. Both alternations
+    are compiled once per set of patterns. When found patterns keep stopping the scan,
+    it continues with an alternation of the remaining patterns.
+
+    The scan doesn't use the named groups, as an alternation of capturing groups can't
+    skip ahead to the possible first characters of the patterns and is much slower.
+
+    Patterns that can't be combined, as they use backreferences, conditionals, named
+    groups or inline global flags, are searched on their own.
+    """
+
+    def __init__(self, patterns: tuple[str, ...], flags: int = 0):
+        self.size = len(patterns)
+        self._patterns = patterns
+        self._flags = flags
+        self._compiled = [re.compile(pattern, flags) for pattern in patterns]
+        combinable = [_combinable(pattern, flags) for pattern in patterns]
+        self._combined = tuple(index for index in range(self.size) if combinable[index])
+        self._separate = [index for index in range(self.size) if not combinable[index]]
+        self._scan = re.compile("|".join(f"(?:{patterns[index]})" for index in self._combined), flags)
+        self._named = re.compile("|".join(f"(?P<_pattern_{index}>{patterns[index]})" for index in self._combined), flags)
+
+    def find(self, text: str) -> set[int]:
+        """Returns the indices of all patterns that match in the text."""
+        compiled = self._compiled
+        found = {index for index in self._separate if compiled[index].search(text)}
+        remaining = self._combined
+        scan, named = self._scan, self._named
+        position = wasted = 0
+        while remaining and position <= len(text):
+            match = scan.search(text, position)
+            if match is None:
+                break
+            position = match.start()
+            hit = named.match(text, position)
+            first = int(hit.lastgroup[9:]) if hit is not None and hit.lastgroup is not None else -1
+            new = {index for index in remaining if index == first or index > first and compiled[index].match(text, position)}
+            if new:
+                found.update(new)
+                remaining = tuple(index for index in remaining if index not in new)
+            if first in found and first not in new:
+                wasted += 1
+                if wasted == _WASTED_STOPS:
+                    scan = _alternation(self._patterns, remaining, self._flags, False)
+                    named = _alternation(self._patterns, remaining, self._flags, True)
+                    wasted = 0
+            position += 1
+        return found
+
+
+@lru_cache(maxsize=128)
+def build_matcher(patterns: tuple[str, ...], literal: bool, flags: int = 0) -> Union[KeywordTrie, PatternAlternation]:
+    """
+    Returns the (cached) matcher for a set of patterns.
+
+    The tuple of patterns is the cache key, so a matcher for the same pattern set
+    is only built once.
+    """
+    if literal:
+        return KeywordTrie(patterns, bool(flags & re.IGNORECASE))
+    return PatternAlternation(patterns, flags)
@@ -0,0 +1,79 @@
+from collections.abc import Sequence
+from typing import Any, Iterator, Union
+
+
+class RangeList(Sequence[int]):
+    """
+    A read only LIST of evenly spaced integers that doesn't store its items.
+
+    It behaves like the list created by `list(range(start, stop, step))` for
+    all the read access the nodes are doing: `len`, indexing, iteration,
+    `in`, `index` and `count` run in O(1) (or O(n) for iteration) without
+    materializing the items and slicing returns again a RangeList.
+    `copy` and concatenation return a normal list, so all nodes that modify a
+    LIST keep working unchanged.
+    """
+    __slots__ = ("_range",)
+
+    def __init__(self, start: int, stop: int, step: int = 1):
+        self._range = range(start, stop, step)
+
+    @classmethod
+    def from_range(cls, r: range) -> "RangeList":
+        return cls(r.start, r.stop, r.step)
+
+    @property
+    def range(self) -> range:
+        return self._range
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return RangeList.from_range(self._range[index])
+        return self._range[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._range)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._range)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._range
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RangeList):
+            return self._range == other._range
+        if isinstance(other, (list, range)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self._range, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # mutable sequences like list aren't hashable either
+
+    def __add__(self, other: Any) -> list[Any]:
+        return list(self._range) + list(other)
+
+    def __radd__(self, other: Any) -> list[Any]:
+        return list(other) + list(self._range)
+
+    def __repr__(self) -> str:
+        # Printed like the list it replaces, e.g. by "to STRING" or string formatting
+        return repr(list(self._range))
+
+    def count(self, value: Any) -> int:
+        return self._range.count(value)
+
+    def index(self, value: Any, start: int = 0, stop: int = 2**63) -> int:
+        start, stop, _ = slice(start, stop).indices(len(self._range))
+        try:
+            position = self._range.index(value)
+        except ValueError:
+            raise ValueError(f"{value!r} is not in list") from None
+        if not start <= position < stop:
+            raise ValueError(f"{value!r} is not in list")
+        return position
+
+    def copy(self) -> list[int]:
+        return list(self._range)
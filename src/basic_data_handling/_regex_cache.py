@@ -0,0 +1,78 @@
+import re
+from collections import OrderedDict
+from threading import Lock
+
+DEFAULT_MAXSIZE = 1024
+
+
+class RegexCache:
+    """
+    A least recently used cache of compiled regular expressions.
+
+    The patterns are keyed by (pattern, flags) so the compile cost is only paid
+    once per distinct pattern. Unlike the small internal cache of the `re` module
+    its size can be configured and the hits and misses are counted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self._cache: OrderedDict[tuple[str, int], re.Pattern[str]] = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern: str, flags: int = 0) -> re.Pattern[str]:
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = re.compile(pattern, flags)  # raises re.error for invalid patterns, which is not cached
+
+        with self._lock:
+            self._cache[key] = compiled
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = max(0, maxsize)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+PATTERN_CACHE = RegexCache()
+
+
+def regex_flags(ignorecase: bool = False, multiline: bool = False, dotall: bool = False, verbose: bool = False) -> int:
+    """Combines the flag inputs of a node into the `re` flags value."""
+    flags = 0
+    if ignorecase:
+        flags |= re.IGNORECASE
+    if multiline:
+        flags |= re.MULTILINE
+    if dotall:
+        flags |= re.DOTALL
+    if verbose:
+        flags |= re.VERBOSE
+    return flags
+
+
+def compile_pattern(pattern: str, ignorecase: bool = False, multiline: bool = False,
+                    dotall: bool = False, verbose: bool = False) -> re.Pattern[str]:
+    """Returns the compiled pattern for the flag inputs of a node from the shared cache."""
+    return PATTERN_CACHE.get(pattern, regex_flags(ignorecase, multiline, dotall, verbose))
@@ -0,0 +1,160 @@
+import multiprocessing
+import re
+import sys
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, cast
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse  # type: ignore[import-not-found]  # no type stubs for the private modules
+    import re._constants as sre_constants  # type: ignore[import-not-found]
+else:
+    import sre_parse
+    import sre_constants
+
+from ._regex_cache import PATTERN_CACHE
+
+
+def _search_groups(compiled: re.Pattern[str], string: str) -> list[Any]:
+    match = compiled.search(string)
+    return list(match.groups()) if match else []
+
+
+def _search_groupdict(compiled: re.Pattern[str], string: str) -> dict[str, Any]:
+    match = compiled.search(string)
+    return match.groupdict() if match else {}
+
+
+# Operation name -> function(compiled pattern, string, *args). The results must be
+# picklable as they are sent back from the worker process.
+REGEX_OPERATIONS: dict[str, Callable[..., Any]] = {
+    "findall": lambda compiled, string: compiled.findall(string),
+    "groupdict": _search_groupdict,
+    "groups": _search_groups,
+    "split": lambda compiled, string: compiled.split(string),
+    "sub": lambda compiled, string, repl, count: compiled.sub(repl, string, count),
+    "test": lambda compiled, string: compiled.search(string) is not None,
+}
+
+
+def has_nested_quantifier(pattern: str, flags: int = 0) -> bool:
+    """
+    Returns True when an unbounded quantifier (`*`, `+` or `{n,}`) is nested inside
+    another unbounded quantifier, like in `(a+)+` or `(\\w+\\s?)*`.
+
+    These patterns are the usual cause of catastrophic backtracking, where the
+    matching time grows exponentially with the length of the string.
+    Possessive quantifiers and atomic groups don't backtrack and are ignored.
+    """
+    repeats = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+    maxrepeat = sre_constants.MAXREPEAT
+
+    def walk(items: Any, inside_repeat: bool) -> bool:
+        for op, av in items:
+            if op in repeats:
+                _, high, sub = av
+                unbounded = high == maxrepeat
+                if unbounded and inside_repeat:
+                    return True
+                if walk(sub, inside_repeat or unbounded):
+                    return True
+            elif op == sre_constants.SUBPATTERN:
+                if walk(av[-1], inside_repeat):
+                    return True
+            elif op == sre_constants.BRANCH:
+                if any(walk(alternative, inside_repeat) for alternative in av[1]):
+                    return True
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                if walk(av[1], inside_repeat):
+                    return True
+        return False
+
+    return walk(sre_parse.parse(pattern, flags), False)
+
+
+def has_group_reference(pattern: str, flags: int = 0) -> bool:
+    """
+    Returns True when the pattern refers to one of its groups, with a backreference
+    like `\\1` or `(?P=name)` or a conditional like `(?(1)a|b)`.
+    """
+    references = (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS)
+
+    def walk(items: Any) -> bool:
+        for op, av in items:
+            if op in references:
+                return True
+            for value in av if isinstance(av, (tuple, list)) else (av,):
+                subpatterns = value if isinstance(value, list) else (value,)
+                if any(isinstance(sub, sre_parse.SubPattern) and walk(sub) for sub in subpatterns):
+                    return True
+        return False
+
+    return walk(sre_parse.parse(pattern, flags))
+
+
+def _worker(connection: Connection, operation: str, pattern: str, flags: int, strings: list[str], args: tuple[Any, ...]) -> None:
+    try:
+        compiled = PATTERN_CACHE.get(pattern, flags)
+        function = REGEX_OPERATIONS[operation]
+        connection.send((True, [function(compiled, string, *args) for string in strings]))
+    except Exception as e:
+        connection.send((False, e))
+    finally:
+        connection.close()
+
+
+def _process_context() -> BaseContext:
+    # Forking the multithreaded ComfyUI process directly (CUDA, torch threads) can deadlock
+    # the child, so the workers are forked from a clean forkserver process where it exists,
+    # otherwise the platform default (spawn on Windows) is used
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+
+def _run_in_process(operation: str, pattern: str, flags: int, strings: list[str], args: tuple[Any, ...], timeout: float) -> list[Any]:
+    context = _process_context()
+    receiver, sender = context.Pipe(duplex=False)
+    worker_args = (sender, operation, pattern, flags, strings, args)
+    process = context.Process(target=_worker, args=worker_args, daemon=True)  # type: ignore[attr-defined]  # only on the concrete contexts
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError(f"The regular expression {pattern!r} did not finish within {timeout} seconds and was stopped. "
+                               f"It is most likely causing catastrophic backtracking.")
+        try:
+            success, result = receiver.recv()
+        except EOFError:
+            raise RuntimeError(f"The worker process for the regular expression {pattern!r} ended unexpectedly")
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    if not success:
+        raise result
+    return cast(list[Any], result)
+
+
+def run_regex(operation: str, pattern: str, strings: list[str], args: tuple[Any, ...] = (), flags: int = 0,
+              timeout: float = 0.0, check_pattern: bool = False) -> list[Any]:
+    """
+    Runs a regex operation for every string and returns the list of results.
+
+    With `check_pattern` the pattern is rejected when it contains nested unbounded
+    quantifiers. With a `timeout` > 0 the matching runs in a separate process that is
+    killed when it doesn't finish within `timeout` seconds, so a pathological pattern
+    can't block the ComfyUI worker. Starting the process costs a few milliseconds,
+    so all strings of a data list are processed by the same process.
+    """
+    compiled = PATTERN_CACHE.get(pattern, flags)  # raises re.error for invalid patterns
+    if check_pattern and has_nested_quantifier(pattern, flags):
+        raise ValueError(f"The regular expression {pattern!r} contains nested quantifiers (like `(a+)+`) "
+                         f"that can cause catastrophic backtracking")
+    if timeout > 0:
+        return _run_in_process(operation, pattern, flags, strings, args, timeout)
+
+    function = REGEX_OPERATIONS[operation]
+    return [function(compiled, string, *args) for string in strings]
@@ -0,0 +1,31 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Mapping
+
+
+@lru_cache(maxsize=128)
+def _build_replacer(items: tuple[tuple[str, str], ...]) -> Callable[[str], str]:
+    table = dict(items)
+    if not table:
+        return str
+    if all(len(old) == 1 for old in table):
+        translation = str.maketrans(table)
+        return lambda string: string.translate(translation)
+
+    # Longer keys first, so the alternation prefers the longest match at each position
+    alternation = re.compile("|".join(re.escape(old) for old in sorted(table, key=len, reverse=True)))
+    lookup = table.__getitem__
+    return lambda string: alternation.sub(lambda match: lookup(match.group()), string)
+
+
+def build_replacer(replacements: Mapping[Any, Any]) -> Callable[[str], str]:
+    """
+    Returns a function that does all replacements of the mapping in a single pass.
+
+    At each position the longest matching key is replaced and the replaced text isn't
+    scanned again, so the replacements don't affect each other. When all keys are
+    single characters `str.translate` is used. Empty keys are ignored. The replacer is
+    cached for the content of the mapping, so the same DICT is only compiled once.
+    """
+    items = tuple((str(old), str(new)) for old, new in replacements.items() if old != "")
+    return _build_replacer(items)
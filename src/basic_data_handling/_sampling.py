@@ -0,0 +1,89 @@
+import random
+from itertools import islice
+from math import exp, floor, log
+from typing import Any, Iterable
+
+UNSEEDED = -1  # seed value that selects the free running per node RNG
+_END = object()
+
+
+def node_rng(node: Any, seed: int = UNSEEDED) -> random.Random:
+    """
+    Returns the random number generator to use for a node execution.
+
+    A seed >= 0 creates a fresh generator, so the result only depends on the
+    seed and the inputs and is reproducible. The UNSEEDED value returns a
+    generator that is stored on the node instance and keeps its state between
+    runs. The global `random` module state is never touched.
+    """
+    if seed is not None and seed >= 0:
+        return random.Random(seed)
+    rng = getattr(node, "_rng", None)
+    if rng is None:
+        rng = random.Random()
+        node._rng = rng
+    return rng
+
+
+def seed_change_key(seed: int = UNSEEDED) -> Any:
+    """
+    Value for `IS_CHANGED` of seeded nodes: a seeded run is cacheable while
+    an unseeded run must always be recalculated.
+    """
+    if seed is not None and seed >= 0:
+        return seed
+    return float("NaN")  # Not equal to anything -> trigger recalculation
+
+
+def sample_indices(n: int, k: int, rng: random.Random) -> list[int]:
+    """
+    Returns `k` distinct random indices out of `range(n)` in random order.
+
+    This is a sparse Fisher-Yates shuffle that only remembers the swapped
+    positions, so time and memory are O(k) and not O(n).
+    """
+    k = max(0, min(k, n))
+    swapped: dict[int, int] = {}
+    result = []
+    for i in range(k):
+        j = rng.randrange(i, n)
+        result.append(swapped.get(j, j))
+        swapped[j] = swapped.get(i, i)
+    return result
+
+
+def reservoir_sample(iterable: Iterable[Any], k: int, rng: random.Random) -> list[Any]:
+    """
+    Returns `k` random items from an iterable of unknown length in a single pass.
+
+    Uses the reservoir "Algorithm L" which needs O(k) memory and only draws
+    O(k * log(n / k)) random numbers, as most items are skipped without
+    looking at them.
+    """
+    if k <= 0:
+        return []
+    iterator = iter(iterable)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k:
+        rng.shuffle(reservoir)
+        return reservoir
+
+    w = exp(log(1.0 - rng.random()) / k)
+    while True:
+        skip = floor(log(1.0 - rng.random()) / log(1.0 - w)) if w < 1.0 else 0
+        item = next(islice(iterator, skip, None), _END)
+        if item is _END:
+            break
+        reservoir[rng.randrange(k)] = item
+        w *= exp(log(1.0 - rng.random()) / k)
+    rng.shuffle(reservoir)
+    return reservoir
+
+
+def random_item(iterable: Iterable[Any], length: int, rng: random.Random) -> Any:
+    """
+    Returns a random item of a sized iterable (like a SET or the keys of a DICT)
+    without copying it into a list first.
+    """
+    return next(islice(iterable, rng.randrange(length), None))
+
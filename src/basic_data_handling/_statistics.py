@@ -0,0 +1,60 @@
+from math import sqrt
+from typing import Any, Iterable, Optional
+
+
+def streaming_statistics(values: Iterable[Any], sample: bool = False) -> tuple[int, Any, Any, Any, Optional[float], Optional[float]]:
+    """
+    Calculates count, sum, min, max, mean and standard deviation in a single pass.
+
+    The mean and variance are updated with Welford's algorithm and floats are
+    summed with Neumaier's compensated summation, so long lists don't lose
+    precision. As long as only integers are seen the sum stays an exact int.
+    With `sample` set the standard deviation uses Bessel's correction (n - 1).
+
+    Returns (count, sum, min, max, mean, stddev) where min, max, mean and stddev
+    are None for an empty input.
+    """
+    count = 0
+    int_sum = 0
+    float_sum = 0.0
+    compensation = 0.0
+    is_float = False
+    minimum: Any = None
+    maximum: Any = None
+    mean = 0.0
+    m2 = 0.0
+
+    for value in values:
+        if isinstance(value, str) or not isinstance(value, (int, float)):
+            raise ValueError(f"Cannot calculate statistics of non-numeric value {value!r}")
+
+        count += 1
+        if count == 1:
+            minimum = maximum = value
+        elif value < minimum:
+            minimum = value
+        elif value > maximum:
+            maximum = value
+
+        if isinstance(value, float):
+            is_float = True
+            t = float_sum + value
+            if abs(float_sum) >= abs(value):
+                compensation += (float_sum - t) + value
+            else:
+                compensation += (value - t) + float_sum
+            float_sum = t
+        else:
+            int_sum += value
+
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+
+    if count == 0:
+        return 0, 0, None, None, None, None
+
+    total = float_sum + compensation + int_sum if is_float else int_sum
+    divisor = count - 1 if sample else count
+    stddev = sqrt(m2 / divisor) if divisor > 0 else 0.0
+    return count, total, minimum, maximum, mean, stddev
@@ -0,0 +1,105 @@
+import string
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Optional, Union
+
+import _string  # type: ignore[import-not-found]  # the C helpers that string.Formatter uses to split field names
+
+MISSING_POLICIES = ("error", "empty", "default", "keep")
+
+_CONVERSIONS: dict[str, Callable[[Any], str]] = {"s": str, "r": repr, "a": ascii}
+
+
+class _Field(NamedTuple):
+    name: str  # the full field name, e.g. "user.name" or "items[0]"
+    key: str  # the key that is looked up in the mapping
+    path: tuple[tuple[bool, Any], ...]  # (is_attribute, name or index) of the following accessors
+    conversion: Optional[str]
+    spec: Union[str, "CompiledTemplate"]
+    placeholder: str  # the original text of the replacement field
+
+
+class CompiledTemplate:
+    """
+    A format string template that is parsed once into a plan of literal text and fields.
+
+    It renders like `template.format_map(mapping)`, including attribute and index
+    access, conversions and (nested) format specs, but doesn't parse the template
+    again for every mapping. Positional fields like `{}` or `{0}` are not supported
+    as the values only come from a mapping.
+
+    With the `missing` policy a field whose key is not in the mapping can raise a
+    KeyError ("error"), be replaced by an empty string ("empty") or by a default
+    string ("default"), or be kept as the placeholder text ("keep").
+    """
+    __slots__ = ("template", "fields", "_plan")
+
+    template: str
+    fields: tuple[str, ...]
+    _plan: tuple[Union[str, _Field], ...]
+
+    def __init__(self, template: str):
+        self.template = template
+        plan: list[Union[str, _Field]] = []
+        fields: dict[str, None] = {}
+
+        for literal, field_name, spec, conversion in string.Formatter().parse(template):
+            if literal:
+                plan.append(literal)
+            if field_name is None:
+                continue
+            key, path = _string.formatter_field_name_split(field_name)
+            if not isinstance(key, str) or key == "":
+                raise ValueError(f"The template uses the positional field {{{field_name}}}, only named fields are supported")
+            if conversion is not None and conversion not in _CONVERSIONS:
+                raise ValueError(f"Unknown conversion specifier {conversion!r} for the field {field_name!r}")
+
+            fields[key] = None
+            compiled_spec: Union[str, CompiledTemplate] = spec or ""
+            if spec and "{" in spec:
+                nested = CompiledTemplate(spec)
+                fields.update(dict.fromkeys(nested.fields))
+                compiled_spec = nested
+
+            placeholder = "{" + field_name + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}"
+            plan.append(_Field(field_name, key, tuple(path), conversion, compiled_spec, placeholder))
+
+        self.fields = tuple(fields)
+        self._plan = tuple(plan)
+
+    def render(self, mapping: Mapping[str, Any], missing: str = "error", default: str = "") -> str:
+        parts: list[str] = []
+        append = parts.append
+        for part in self._plan:
+            if isinstance(part, str):
+                append(part)
+                continue
+
+            try:
+                value = mapping[part.key]
+                for is_attribute, name in part.path:
+                    value = getattr(value, name) if is_attribute else value[name]
+            except LookupError:
+                if missing == "error":
+                    raise KeyError(part.name) from None
+                append(default if missing == "default" else part.placeholder if missing == "keep" else "")
+                continue
+
+            if part.conversion:
+                value = _CONVERSIONS[part.conversion](value)
+            spec = part.spec
+            if isinstance(spec, CompiledTemplate):
+                spec = spec.render(mapping, missing, default)
+            append(format(value, spec))
+        return "".join(parts)
+
+    def render_all(self, mappings: Iterable[Mapping[str, Any]], missing: str = "error", default: str = "") -> list[str]:
+        if missing not in MISSING_POLICIES:
+            raise ValueError(f"Unknown missing key policy {missing!r}, expected one of {', '.join(MISSING_POLICIES)}")
+        render = self.render
+        return [render(mapping, missing, default) for mapping in mappings]
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> CompiledTemplate:
+    """Returns the (cached) compiled template, so each distinct template is only parsed once."""
+    return CompiledTemplate(template)
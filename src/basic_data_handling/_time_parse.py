@@ -0,0 +1,109 @@
+import datetime
+import re
+from functools import lru_cache
+from typing import Callable, Optional
+
+ISO_FORMAT = "ISO-8601"
+
+# Directive -> (regex of the fixed width field, datetime argument)
+_FAST_DIRECTIVES = {
+    "Y": ("([0-9]{4})", "year"),
+    "m": ("([0-9]{2})", "month"),
+    "d": ("([0-9]{2})", "day"),
+    "H": ("([0-9]{2})", "hour"),
+    "M": ("([0-9]{2})", "minute"),
+    "S": ("([0-9]{2})", "second"),
+    "f": ("([0-9]{1,6})", "microsecond"),
+}
+
+_DATETIME_ARGUMENTS = ["year", "month", "day", "hour", "minute", "second", "microsecond"]
+
+# datetime called with the int fields of a match, typed loosely as the number of fields depends on the format
+_new_datetime: Callable[..., datetime.datetime] = datetime.datetime
+
+
+def _parse_iso(time_string: str) -> datetime.datetime:
+    if time_string.endswith(("Z", "z")):  # fromisoformat only accepts "Z" from Python 3.11 on
+        time_string = time_string[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(time_string)
+
+
+def _compile_fast_parser(format_string: str) -> Optional[tuple[Callable[[str], Optional[re.Match[str]]], list[str]]]:
+    """
+    Translates a format that only uses zero padded numeric directives into a regex and
+    the datetime arguments of its groups. Returns None for any other format.
+    """
+    pattern: list[str] = []
+    arguments: list[str] = []
+    position = 0
+    while position < len(format_string):
+        char = format_string[position]
+        if char != "%":
+            pattern.append(re.escape(char))
+            position += 1
+            continue
+        directive = format_string[position + 1:position + 2]
+        if directive == "%":
+            pattern.append("%")
+        elif directive in _FAST_DIRECTIVES and _FAST_DIRECTIVES[directive][1] not in arguments:
+            group, argument = _FAST_DIRECTIVES[directive]
+            pattern.append(group)
+            arguments.append(argument)
+        else:
+            return None
+        position += 2
+    return re.compile("".join(pattern)).fullmatch, arguments
+
+
+@lru_cache(maxsize=64)
+def build_parser(format_string: str) -> Callable[[str], datetime.datetime]:
+    """
+    Returns a (cached) function that parses a string with the format into a datetime.
+
+    The special format "ISO-8601" uses `datetime.fromisoformat`. Formats that only use
+    %Y, %m, %d, %H, %M, %S, %f and literal text, like "%Y-%m-%d %H:%M:%S", are matched by
+    a precompiled regex and converted directly. Strings that don't fit this fast path, like
+    not zero padded numbers, and all other formats are parsed by `datetime.strptime`, so
+    the results and errors are the same as with strptime.
+    """
+    if format_string == ISO_FORMAT:
+        return _parse_iso
+
+    strptime = datetime.datetime.strptime
+    fast = _compile_fast_parser(format_string)
+    if fast is None:
+        return lambda time_string: strptime(time_string, format_string)
+
+    fullmatch, arguments = fast
+    if 3 <= len(arguments) < 7 and arguments == _DATETIME_ARGUMENTS[:len(arguments)]:
+        # The groups are already the positional arguments of datetime, like for "%Y-%m-%d %H:%M:%S"
+        def parse_positional(time_string: str) -> datetime.datetime:
+            match = fullmatch(time_string)
+            if match is not None:
+                try:
+                    return _new_datetime(*map(int, match.groups()))
+                except ValueError:
+                    pass  # let strptime raise its error for invalid dates
+            return strptime(time_string, format_string)
+
+        return parse_positional
+
+    microsecond = arguments.index("microsecond") if "microsecond" in arguments else None
+    defaults = {"year": 1900, "month": 1, "day": 1}  # the same defaults as strptime
+
+    def parse(time_string: str) -> datetime.datetime:
+        match = fullmatch(time_string)
+        if match is not None:
+            values = match.groups()
+            fields = dict(defaults)
+            for argument, value in zip(arguments, values):
+                fields[argument] = int(value)
+            if microsecond is not None:
+                fields["microsecond"] = int(values[microsecond].ljust(6, "0"))
+            try:
+                return _new_datetime(**fields)
+            except ValueError:
+                pass  # let strptime raise its error for invalid dates
+        return strptime(time_string, format_string)
+
+    return parse
@@ -0,0 +1,354 @@
+from typing import Any, Optional
+from inspect import cleandoc
+
+try:
+    from comfy.comfy_types.node_typing import IO, ComfyNodeABC
+except:
+    class IO:
+        BOOLEAN = "BOOLEAN"
+        INT = "INT"
+        FLOAT = "FLOAT"
+        STRING = "STRING"
+        NUMBER = "FLOAT,INT"
+        ANY = "*"
+    ComfyNodeABC = object
+
+from ._bitset import MAX_VALUE, BitSet
+from ._dynamic_input import ContainsDynamicDict
+
+
+class BitSetCreate(ComfyNodeABC):
+    """
+    Creates a new BITSET from INT items.
+
+    A BITSET is a compact SET of non-negative INTs, like frame indices or dataset
+    row IDs, that stores one bit per possible value. The list of items is dynamically
+    extended based on the number of inputs provided.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "optional": ContainsDynamicDict({
+                "item_0": (IO.INT, {"_dynamic": "number", "widgetType": "STRING"}),
+            })
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "create_bitset"
+
+    def create_bitset(self, **kwargs: Any) -> tuple[BitSet]:
+        values = [int(value) for value in list(kwargs.values())[:-1]]
+        return (BitSet(values),)
+
+
+class BitSetCreateFromRange(ComfyNodeABC):
+    """
+    Creates a BITSET containing a sequence of numbers.
+
+    This node takes the same start, stop and step parameters as the data list range node.
+    With a step of 1 the BITSET is created directly, without going through the numbers.
+    All numbers of the range must be from 0 to 67,108,863, also for a negative step.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "start": (IO.INT, {"default": 0, "min": 0, "max": MAX_VALUE}),
+                "stop": (IO.INT, {"default": 10, "min": 0, "max": MAX_VALUE + 1}),
+            },
+            "optional": {
+                "step": (IO.INT, {"default": 1}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "create_range"
+
+    def create_range(self, stop: int, start: int = 0, step: int = 1) -> tuple[BitSet]:
+        if step == 0:
+            raise ValueError("Step cannot be zero")
+        return (BitSet.from_range(range(start, stop, step)),)
+
+
+class BitSetContains(ComfyNodeABC):
+    """
+    Checks if a BITSET contains a specified INT.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset": ("BITSET", {}),
+                "value": (IO.INT, {"default": 0}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "contains"
+
+    def contains(self, bitset: BitSet, value: int) -> tuple[bool]:
+        return (value in bitset,)
+
+
+class BitSetDifference(ComfyNodeABC):
+    """
+    Returns the difference between two BITSETs.
+
+    This node returns a new BITSET containing the INTs in the first BITSET but not in
+    the second one, calculated on whole machine words.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset1": ("BITSET", {}),
+                "bitset2": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "difference"
+
+    def difference(self, bitset1: BitSet, bitset2: BitSet) -> tuple[BitSet]:
+        return (bitset1 - bitset2,)
+
+
+class BitSetIntersection(ComfyNodeABC):
+    """
+    Returns the intersection of two or more BITSETs.
+
+    This node returns a new BITSET containing only the INTs present in all input
+    BITSETs, calculated on whole machine words.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset1": ("BITSET", {}),
+                "bitset2": ("BITSET", {}),
+            },
+            "optional": {
+                "bitset3": ("BITSET", {}),
+                "bitset4": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "intersection"
+
+    def intersection(
+        self, bitset1: BitSet, bitset2: BitSet, bitset3: Optional[BitSet] = None, bitset4: Optional[BitSet] = None
+    ) -> tuple[BitSet]:
+        result = bitset1 & bitset2
+        for other in (bitset3, bitset4):
+            if other is not None:
+                result = result & other
+        return (result,)
+
+
+class BitSetLength(ComfyNodeABC):
+    """
+    Returns the number of INTs in a BITSET.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT,)
+    RETURN_NAMES = ("length",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "length"
+
+    def length(self, bitset: BitSet) -> tuple[int]:
+        return (len(bitset),)
+
+
+class BitSetSymmetricDifference(ComfyNodeABC):
+    """
+    Returns the symmetric difference between two BITSETs.
+
+    This node returns a new BITSET containing the INTs in either BITSET but not in
+    both, calculated on whole machine words.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset1": ("BITSET", {}),
+                "bitset2": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "symmetric_difference"
+
+    def symmetric_difference(self, bitset1: BitSet, bitset2: BitSet) -> tuple[BitSet]:
+        return (bitset1 ^ bitset2,)
+
+
+class BitSetUnion(ComfyNodeABC):
+    """
+    Returns the union of two or more BITSETs.
+
+    This node returns a new BITSET containing all INTs from all the input BITSETs,
+    calculated on whole machine words.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset1": ("BITSET", {}),
+                "bitset2": ("BITSET", {}),
+            },
+            "optional": {
+                "bitset3": ("BITSET", {}),
+                "bitset4": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "union"
+
+    def union(self, bitset1: BitSet, bitset2: BitSet, bitset3: Optional[BitSet] = None, bitset4: Optional[BitSet] = None) -> tuple[BitSet]:
+        result = bitset1 | bitset2
+        for other in (bitset3, bitset4):
+            if other is not None:
+                result = result | other
+        return (result,)
+
+
+class BitSetFromDataList(ComfyNodeABC):
+    """
+    Converts a ComfyUI data list of INTs into a BITSET.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": (IO.INT, {"forceInput": True}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+    INPUT_IS_LIST = True
+
+    def convert(self, **kwargs: list[Any]) -> tuple[BitSet]:
+        values = kwargs.get('list', [])
+        return (BitSet([int(value) for value in values]),)
+
+
+class BitSetFromSet(ComfyNodeABC):
+    """
+    Converts a SET of non-negative INTs into a BITSET.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "set": ("SET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("BITSET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+
+    def convert(self, set: set[int]) -> tuple[BitSet]:
+        return (BitSet(set),)
+
+
+class BitSetToDataList(ComfyNodeABC):
+    """
+    Converts a BITSET into a ComfyUI data list of its INTs in ascending order.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT,)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+    OUTPUT_IS_LIST = (True,)
+
+    def convert(self, bitset: BitSet) -> tuple[list[int]]:
+        return (bitset.to_list(),)
+
+
+class BitSetToSet(ComfyNodeABC):
+    """
+    Converts a BITSET into a SET.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "bitset": ("BITSET", {}),
+            }
+        }
+
+    RETURN_TYPES = ("SET",)
+    CATEGORY = "Basic/BITSET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+
+    def convert(self, bitset: BitSet) -> tuple[set[int]]:
+        return (set(bitset.to_list()),)
+
+
+NODE_CLASS_MAPPINGS = {
+    "Basic data handling: BitSetCreate": BitSetCreate,
+    "Basic data handling: BitSetCreateFromRange": BitSetCreateFromRange,
+    "Basic data handling: BitSetContains": BitSetContains,
+    "Basic data handling: BitSetDifference": BitSetDifference,
+    "Basic data handling: BitSetIntersection": BitSetIntersection,
+    "Basic data handling: BitSetLength": BitSetLength,
+    "Basic data handling: BitSetSymmetricDifference": BitSetSymmetricDifference,
+    "Basic data handling: BitSetUnion": BitSetUnion,
+    "Basic data handling: BitSetFromDataList": BitSetFromDataList,
+    "Basic data handling: BitSetFromSet": BitSetFromSet,
+    "Basic data handling: BitSetToDataList": BitSetToDataList,
+    "Basic data handling: BitSetToSet": BitSetToSet,
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "Basic data handling: BitSetCreate": "create BITSET",
+    "Basic data handling: BitSetCreateFromRange": "create BITSET from range",
+    "Basic data handling: BitSetContains": "contains",
+    "Basic data handling: BitSetDifference": "difference",
+    "Basic data handling: BitSetIntersection": "intersection",
+    "Basic data handling: BitSetLength": "length",
+    "Basic data handling: BitSetSymmetricDifference": "symmetric difference",
+    "Basic data handling: BitSetUnion": "union",
+    "Basic data handling: BitSetFromDataList": "convert data list to BITSET",
+    "Basic data handling: BitSetFromSet": "convert SET to BITSET",
+    "Basic data handling: BitSetToDataList": "convert to data list",
+    "Basic data handling: BitSetToSet": "convert to SET",
+}
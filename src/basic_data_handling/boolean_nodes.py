@@ -1,5 +1,5 @@
 from inspect import cleandoc
-from typing import Any
+from typing import Any, Hashable, Optional
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -13,9 +13,49 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._content_hash import _prompt_scope
 from ._dynamic_input import ContainsDynamicDict
 
 
+class _RequestedInputs:
+    """
+    The lazy inputs that a node requested during the current prompt. ComfyUI passes the
+    inputs that aren't evaluated yet as None, so only this tells that an input that is
+    None was already evaluated, to None.
+    """
+
+    def __init__(self) -> None:
+        self._scope: Optional[Hashable] = None
+        self._names: set[str] = set()
+
+    def names(self) -> set[str]:
+        scope = _prompt_scope()
+        if scope != self._scope:  # a new prompt, e.g. after one that failed before the node was executed
+            self._scope = scope
+            self._names = set()
+        return self._names
+
+    def clear(self) -> None:
+        self._names = set()
+
+
+def _first_needed_item(kwargs: dict[str, Any], deciding_value: bool, requested: set[str]) -> list[str]:
+    """
+    Returns the first not yet evaluated `item_X` input in order of X and adds it to the
+    requested inputs, or nothing when an evaluated input before it already decides the
+    result, i.e. is truthy for OR or falsy for AND.
+    """
+    items = sorted((key for key in kwargs if key.startswith("item_")), key=lambda key: int(key[5:]))
+    for key in items:
+        value = kwargs[key]
+        if value is None and key not in requested:
+            requested.add(key)
+            return [key]
+        if bool(value) == deciding_value:
+            return []
+    return []
+
+
 class BooleanAnd(ComfyNodeABC):
     """
     Returns the logical AND result of two boolean values.
@@ -166,6 +206,8 @@ class GenericOr(ComfyNodeABC):
     This node takes a dynamic number of inputs and returns their logical N/OR result.
     Note that values are evaluated according Python's rules. I.e. an empty string is
     `false`, an integer 0 is also `false`, etc.
+    The inputs are evaluated lazily one after the other and evaluation stops at the
+    first `true` value, so the nodes connected to the remaining inputs are not executed.
     """
     @classmethod
     def INPUT_TYPES(cls):
@@ -174,7 +216,7 @@ class GenericOr(ComfyNodeABC):
                 "invert": (IO.BOOLEAN, {"default": False}),
             },
             "optional": ContainsDynamicDict({
-                "item_0": (IO.ANY, {"_dynamic": "number", "widgetType": "STRING"}),
+                "item_0": (IO.ANY, {"_dynamic": "number", "widgetType": "STRING", "lazy": True}),
             })
         }
 
@@ -183,7 +225,14 @@ class GenericOr(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "or_operation"
 
-    def or_operation(self, invert: bool, **kwargs: list[Any]) -> tuple[bool]:
+    def __init__(self) -> None:
+        self._requested = _RequestedInputs()
+
+    def check_lazy_status(self, invert: bool = False, **kwargs: Any) -> list[str]:
+        return _first_needed_item(kwargs, True, self._requested.names())
+
+    def or_operation(self, invert: bool, **kwargs: Any) -> tuple[bool]:
+        self._requested.clear()
         return (any(kwargs.values()) ^ invert,)
 
 
@@ -194,6 +243,8 @@ class GenericAnd(ComfyNodeABC):
     This node takes a dynamic number of inputs and returns their logical N/AND result.
     Note that values are evaluated according Python's rules. I.e. an empty string is
     `false`, an integer 0 is also `false`, etc.
+    The inputs are evaluated lazily one after the other and evaluation stops at the
+    first `false` value, so the nodes connected to the remaining inputs are not executed.
     """
     @classmethod
     def INPUT_TYPES(cls):
@@ -202,7 +253,7 @@ class GenericAnd(ComfyNodeABC):
                 "invert": (IO.BOOLEAN, {"default": False}),
             },
             "optional": ContainsDynamicDict({
-                "item_0": (IO.ANY, {"_dynamic": "number", "widgetType": "STRING", "default": "True"}),
+                "item_0": (IO.ANY, {"_dynamic": "number", "widgetType": "STRING", "default": "True", "lazy": True}),
             })
         }
 
@@ -211,7 +262,14 @@ class GenericAnd(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "and_operation"
 
-    def and_operation(self, invert: bool, **kwargs: list[Any]) -> tuple[bool]:
+    def __init__(self) -> None:
+        self._requested = _RequestedInputs()
+
+    def check_lazy_status(self, invert: bool = False, **kwargs: Any) -> list[str]:
+        return _first_needed_item(kwargs, False, self._requested.names())
+
+    def and_operation(self, invert: bool, **kwargs: Any) -> tuple[bool]:
+        self._requested.clear()
         return (all(kwargs.values()) ^ invert,)
 
 
@@ -13,6 +13,10 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._bulk_cast import CAST_TYPES, ERROR_POLICIES, cast_all
+from ._range_list import RangeList
+
+
 class CastToBoolean(ComfyNodeABC):
     """
     Converts any input to a BOOLEAN. Follows standard Python truthy/falsy rules.
@@ -125,7 +129,7 @@ class CastToList(ComfyNodeABC):
     FUNCTION = "convert_to_list"
 
     def convert_to_list(self, input: Any) -> tuple[list]:
-        if isinstance(input, list):
+        if isinstance(input, (list, RangeList)):
             return (input,)
         return ([input],)
 
@@ -151,7 +155,7 @@ class CastToSet(ComfyNodeABC):
     def convert_to_set(self, input: Any) -> tuple[set]:
         if isinstance(input, set):
             return (input,)
-        return ({input,} if not isinstance(input, list) else set(input),)
+        return ({input,} if not isinstance(input, (list, RangeList)) else set(input),)
 
 
 class CastToString(ComfyNodeABC):
@@ -175,6 +179,81 @@ class CastToString(ComfyNodeABC):
         return (str(input),)
 
 
+class CastDataListItems(ComfyNodeABC):
+    """
+    Converts every item of a data list to an INT, FLOAT, BOOLEAN or STRING in a single call.
+
+    The conversion follows the same rules as the single value cast nodes. The on_error
+    parameter decides what happens with items that can't be converted: "raise" stops
+    with an error, "default" replaces them with the default value (or 0, 0.0, False or ""
+    when it isn't connected) and "drop" leaves them out. The indices of the items that
+    failed are returned as a data list as well.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "values": (IO.ANY, {"forceInput": True}),
+                "type": (list(CAST_TYPES), {"default": "INT"}),
+                "on_error": (list(ERROR_POLICIES), {"default": "raise"}),
+            },
+            "optional": {
+                "default": (IO.ANY, {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.INT)
+    RETURN_NAMES = ("values", "failed_indices")
+    CATEGORY = "Basic/cast"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert_items"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True, True)
+
+    def convert_items(self, **kwargs: list[Any]) -> tuple[list[Any], list[int]]:
+        return cast_all(
+            kwargs.get('values', []),
+            kwargs.get('type', ["INT"])[0],
+            kwargs.get('on_error', ["raise"])[0],
+            kwargs.get('default', [None])[0],
+        )
+
+
+class CastListItems(ComfyNodeABC):
+    """
+    Converts every item of a LIST to an INT, FLOAT, BOOLEAN or STRING in a single call.
+
+    The conversion follows the same rules as the single value cast nodes. The on_error
+    parameter decides what happens with items that can't be converted: "raise" stops
+    with an error, "default" replaces them with the default value (or 0, 0.0, False or ""
+    when it isn't connected) and "drop" leaves them out. The indices of the items that
+    failed are returned as a LIST as well.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": ("LIST",),
+                "type": (list(CAST_TYPES), {"default": "INT"}),
+                "on_error": (list(ERROR_POLICIES), {"default": "raise"}),
+            },
+            "optional": {
+                "default": (IO.ANY, {}),
+            }
+        }
+
+    RETURN_TYPES = ("LIST", "LIST")
+    RETURN_NAMES = ("list", "failed_indices")
+    CATEGORY = "Basic/cast"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert_items"
+
+    def convert_items(
+        self, list: list[Any], type: str = "INT", on_error: str = "raise", default: Any = None
+    ) -> tuple[list[Any], list[int]]:
+        return cast_all(list, type, on_error, default)
+
+
 NODE_CLASS_MAPPINGS = {
     "Basic data handling: CastToBoolean": CastToBoolean,
     "Basic data handling: CastToDict": CastToDict,
@@ -183,6 +262,8 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: CastToList": CastToList,
     "Basic data handling: CastToSet": CastToSet,
     "Basic data handling: CastToString": CastToString,
+    "Basic data handling: CastDataListItems": CastDataListItems,
+    "Basic data handling: CastListItems": CastListItems,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
@@ -193,4 +274,6 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: CastToList": "to LIST",
     "Basic data handling: CastToSet": "to SET",
     "Basic data handling: CastToString": "to STRING",
+    "Basic data handling: CastDataListItems": "data list items to type",
+    "Basic data handling: CastListItems": "LIST items to type",
 }
@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, Callable
 from inspect import cleandoc
+import operator
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -13,6 +14,83 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+_COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+_NUMPY_MIN_LENGTH = 32  # below this converting to an array costs more than it saves
+_NUMBER_TYPES = {bool, int, float}
+_MAX_EXACT_INT = 2**53  # larger INTs lose precision when they are compared as float64
+
+
+def _exact_number(value: Any) -> bool:
+    """Whether a single value is compared the same by NumPy as by Python."""
+    return isinstance(value, float) or isinstance(value, int) and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+
+
+def _numeric_array(values: list[Any]) -> Any:
+    """
+    Returns the values as a NumPy array if NumPy is available and they are all numbers
+    that NumPy compares the same as Python, otherwise None.
+    """
+    if len(values) < _NUMPY_MIN_LENGTH:
+        return None
+    types = set(map(type, values))
+    if not types <= _NUMBER_TYPES:
+        return None  # e.g. STRINGs, checked before the conversion that would be thrown away
+    if int in types:
+        if float in types:
+            exact = all(-_MAX_EXACT_INT <= value <= _MAX_EXACT_INT for value in values if type(value) is int)
+        else:
+            exact = -_MAX_EXACT_INT <= min(values) and max(values) <= _MAX_EXACT_INT
+        if not exact:
+            return None
+    try:
+        import numpy as np
+        array = np.asarray(values)
+    except (ImportError, ValueError, TypeError, OverflowError):
+        return None
+    return array if array.ndim == 1 and array.dtype.kind in "biuf" else None
+
+
+def _broadcast(values: list[Any], others: list[Any], name: str) -> Any:
+    """Returns the single value of others to compare every value with, or the list for pairwise comparison."""
+    if len(others) == 1:
+        return others[0]
+    if len(others) == len(values):
+        return others
+    raise ValueError(f"{name} must be a single value or a data list with the same length as the values "
+                     f"({len(values)}), but it has {len(others)} values")
+
+
+def _compare_all(compare: Callable[[Any, Any], Any], values: list[Any], other: Any) -> list[bool]:
+    """
+    Compares every value with other, which is either a single value or a list of the same length.
+
+    For numbers NumPy is used when it is available, so long data lists are compared in one vectorized operation.
+    """
+    array = _numeric_array(values)
+    if array is not None:
+        if isinstance(other, list):
+            other_array = _numeric_array(other)
+        else:
+            other_array = other if _exact_number(other) else None
+        if other_array is not None:
+            try:
+                result: list[bool] = compare(array, other_array).tolist()
+                return result
+            except (TypeError, OverflowError):
+                pass  # fall back to the Python comparison
+    if isinstance(other, list):
+        return [bool(compare(value, other_value)) for value, other_value in zip(values, other)]
+    return [bool(compare(value, other)) for value in values]
+
+
 class Equal(ComfyNodeABC):
     """
     Checks if two values are equal.
@@ -325,6 +403,127 @@ class StringComparison(ComfyNodeABC):
             raise ValueError(f"Unknown operator: {operator}")
 
 
+class DataListCompare(ComfyNodeABC):
+    """
+    Compares every value of a data list with a value, in a single call.
+
+    This node does the same as the comparison nodes (==, !=, >, <, >=, <=) for a whole
+    data list and returns a data list of BOOLEANs that can be used directly by
+    "filter" or "filter select". The value to compare with is used for every element,
+    or when it is a data list with the same length, the elements are compared pairwise.
+    Long data lists of numbers are compared in one vectorized NumPy operation.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "values": (IO.ANY, {"forceInput": True}),
+                "operator": (list(_COMPARISON_OPERATORS.keys()), {"default": ">"}),
+                "value2": (IO.NUMBER, {"widgetType": "FLOAT", "default": 0}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    RETURN_NAMES = ("result",)
+    CATEGORY = "Basic/comparison"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "compare"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    @classmethod
+    def VALIDATE_INPUTS(cls, input_types: dict[str, str]) -> bool:
+        return True
+
+    def compare(self, **kwargs: list[Any]) -> tuple[list[bool]]:
+        values = kwargs.get('values', [])
+        compare = _COMPARISON_OPERATORS[kwargs.get('operator', [">"])[0]]
+        return (_compare_all(compare, values, _broadcast(values, kwargs.get('value2', [0]), "value2")),)
+
+
+class DataListNumberInRange(ComfyNodeABC):
+    """
+    Checks for every number of a data list if it is within a specified range, in a single call.
+
+    This node does the same as "in range" for a whole data list and returns a data list
+    of BOOLEANs that can be used directly by "filter" or "filter select".
+    Long data lists are checked in one vectorized NumPy operation.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "values": (IO.NUMBER, {"forceInput": True}),
+                "min_value": ("FLOAT", {"default": 0}),
+                "max_value": ("FLOAT", {"default": 100}),
+            },
+            "optional": {
+                "include_min": (IO.BOOLEAN, {"default": True}),
+                "include_max": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    RETURN_NAMES = ("in_range",)
+    CATEGORY = "Basic/comparison"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "check_range"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def check_range(self, **kwargs: list[Any]) -> tuple[list[bool]]:
+        values = kwargs.get('values', [])
+        min_value = kwargs.get('min_value', [0])[0]
+        max_value = kwargs.get('max_value', [100])[0]
+        above_min = operator.ge if kwargs.get('include_min', [True])[0] else operator.gt
+        below_max = operator.le if kwargs.get('include_max', [True])[0] else operator.lt
+
+        array = _numeric_array(values)
+        if array is not None:
+            return ((above_min(array, min_value) & below_max(array, max_value)).tolist(),)
+        return ([above_min(value, min_value) and below_max(value, max_value) for value in values],)
+
+
+class DataListStringComparison(ComfyNodeABC):
+    """
+    Compares every string of a data list with a string, in a single call.
+
+    This node does the same as "string compare" for a whole data list and returns a data
+    list of BOOLEANs that can be used directly by "filter" or "filter select".
+    The string to compare with is used for every element, or when it is a data list
+    with the same length, the elements are compared pairwise.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": ("STRING", {"forceInput": True}),
+                "string2": ("STRING", {"default": ""}),
+                "operator": (list(_COMPARISON_OPERATORS.keys()), {"default": "=="}),
+            },
+            "optional": {
+                "case_sensitive": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    RETURN_NAMES = ("result",)
+    CATEGORY = "Basic/comparison"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "compare"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def compare(self, **kwargs: list[Any]) -> tuple[list[bool]]:
+        strings = kwargs.get('strings', [])
+        others = kwargs.get('string2', [""])
+        if not kwargs.get('case_sensitive', [True])[0]:
+            strings = [string.lower() for string in strings]
+            others = [string.lower() for string in others]
+        compare = _COMPARISON_OPERATORS[kwargs.get('operator', ["=="])[0]]
+        return (_compare_all(compare, strings, _broadcast(strings, others, "string2")),)
+
+
 NODE_CLASS_MAPPINGS = {
     "Basic data handling: Equal": Equal,
     "Basic data handling: NotEqual": NotEqual,
@@ -336,6 +535,9 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: NumberInRange": NumberInRange,
     "Basic data handling: CompareLength": CompareLength,
     "Basic data handling: StringComparison": StringComparison,
+    "Basic data handling: DataListCompare": DataListCompare,
+    "Basic data handling: DataListNumberInRange": DataListNumberInRange,
+    "Basic data handling: DataListStringComparison": DataListStringComparison,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
@@ -349,4 +551,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: NumberInRange": "in range",
     "Basic data handling: CompareLength": "compare length",
     "Basic data handling: StringComparison": "string compare",
+    "Basic data handling: DataListCompare": "compare each (data list)",
+    "Basic data handling: DataListNumberInRange": "in range each (data list)",
+    "Basic data handling: DataListStringComparison": "string compare each (data list)",
 }
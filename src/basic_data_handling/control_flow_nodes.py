@@ -1,4 +1,5 @@
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Optional
 from inspect import cleandoc
 
 try:
@@ -15,7 +16,49 @@ except:
     ComfyNodeABC = object
     ExecutionBlocker = lambda x: x
 
+from ._content_hash import content_hash, prompt_content_hash
 from ._dynamic_input import ContainsDynamicDict
+from ._memo_cache import MemoCache
+
+# The caches of all "cache" nodes by node id, so they survive between prompts. As node ids
+# are only unique within one workflow, the signature of the graph connected to the value
+# input is part of the keys of the values, so the values of a node are limited by its
+# max_entries also when it is used in several workflows.
+_MEMO_CACHES: "OrderedDict[str, MemoCache]" = OrderedDict()
+_MAX_MEMO_CACHES = 64
+_MISS = object()
+
+
+def _upstream_signature(prompt: Optional[dict[str, Any]], node_id: str, input_name: str) -> str:
+    """
+    Returns the content hash of the class types and inputs of all nodes in the prompt
+    that the input of the node depends on, or "" when the prompt isn't known.
+    """
+    if not prompt or node_id not in prompt:
+        return ""
+    link = prompt[node_id].get("inputs", {}).get(input_name)
+    pending = [link[0]] if isinstance(link, list) and len(link) == 2 else []
+    upstream = {}
+    while pending:
+        current = str(pending.pop())
+        if current in upstream or current not in prompt:
+            continue
+        node = prompt[current]
+        inputs = node.get("inputs", {})
+        upstream[current] = (node.get("class_type"), inputs)
+        pending.extend(value[0] for value in inputs.values() if isinstance(value, list) and len(value) == 2)
+    return content_hash(upstream)
+
+
+def _memo_cache(store_key: str) -> MemoCache:
+    cache = _MEMO_CACHES.get(store_key)
+    if cache is None:
+        cache = _MEMO_CACHES[store_key] = MemoCache()
+        while len(_MEMO_CACHES) > _MAX_MEMO_CACHES:
+            _MEMO_CACHES.popitem(last=False)[1].clear()  # removes its spilled files
+    else:
+        _MEMO_CACHES.move_to_end(store_key)
+    return cache
 
 
 class IfElse(ComfyNodeABC):
@@ -210,6 +253,151 @@ class SwitchCase(ComfyNodeABC):
         return (kwargs.get("default"),)
 
 
+class SwitchKey(ComfyNodeABC):
+    """
+    Implements a switch/case selection by key in the workflow.
+
+    This node takes a key (a STRING or an INT) and multiple pairs of a case key and a
+    case value. It returns the value of the first case whose key equals the key, or
+    the default value when no case matches. INT keys are compared with the text of
+    the case keys, so the key 3 selects the case with the key "3".
+
+    The case keys are indexed once and only the selected case value (or the default)
+    is evaluated, so the other branches are not executed and also switches with many
+    cases select their value with a single lookup.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "key": ("STRING,INT", {"widgetType": "STRING", "default": ""}),
+            },
+            "optional": ContainsDynamicDict({
+                "case_key_0": (IO.STRING, {"default": "", "_dynamic": "number", "_dynamicGroup": 0}),
+                "case_value_0": (IO.ANY, {"lazy": True, "_dynamic": "number", "_dynamicGroup": 0}),
+                "default": (IO.ANY, {"lazy": True}),
+            })
+        }
+
+    RETURN_TYPES = (IO.ANY,)
+    RETURN_NAMES = ("result",)
+    CATEGORY = "Basic/flow control"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "execute"
+
+    def __init__(self) -> None:
+        self._case_keys: tuple[tuple[str, Any], ...] = ()
+        self._index: dict[str, str] = {}
+
+    def _selected_input(self, key: Any, kwargs: dict[str, Any]) -> str:
+        """Returns the name of the input that provides the result for the key."""
+        case_keys = tuple([(name, value) for name, value in kwargs.items() if name.startswith("case_key_")])
+        if case_keys != self._case_keys:
+            # Only built again when the case keys change, e.g. not between check_lazy_status and execute
+            index: dict[str, str] = {}
+            for name, value in sorted(case_keys, key=lambda item: int(item[0][9:])):
+                index.setdefault(str(value), f"case_value_{name[9:]}")
+            self._case_keys = case_keys
+            self._index = index
+
+        name = self._index.get(str(key), "default")
+        return name if name in kwargs else "default"
+
+    def check_lazy_status(self, key: Any, **kwargs: Any) -> list[str]:
+        name = self._selected_input(key, kwargs)
+        if name in kwargs and kwargs[name] is None:
+            return [name]
+        return []
+
+    def execute(self, key: Any, **kwargs: Any) -> tuple[Any]:
+        return (kwargs.get(self._selected_input(key, kwargs)),)
+
+
+class Cache(ComfyNodeABC):
+    """
+    Caches the value of an expensive part of the workflow across prompts.
+
+    The value is stored under a key that is calculated from the content of the
+    key inputs. When the key inputs have a value that was seen before, the cached
+    value is returned and the nodes connected to the value input are not executed.
+    Without key inputs the node caches a single value.
+
+    The cache keeps up to max_entries values and drops the least recently used one
+    when it is full. With a ttl (in seconds) > 0 a value expires after that time.
+    Values that need at least spill_mb megabytes when pickled are written to a
+    temporary file instead of being kept in memory (0 to keep everything in memory).
+    Set clear to empty the cache of this node. A value is only returned for the same
+    nodes connected to the value input, so a different workflow that reuses the node
+    id doesn't get the values of this one.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "value": (IO.ANY, {"lazy": True}),
+            },
+            "optional": ContainsDynamicDict({
+                "key_0": (IO.ANY, {"_dynamic": "number"}),
+                "max_entries": (IO.INT, {"default": 16, "min": 1}),
+                "ttl": (IO.FLOAT, {"default": 0.0, "min": 0.0}),
+                "spill_mb": (IO.FLOAT, {"default": 0.0, "min": 0.0}),
+                "clear": (IO.BOOLEAN, {"default": False}),
+            }),
+            "hidden": {
+                "unique_id": "UNIQUE_ID",
+                "prompt": "PROMPT",
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.BOOLEAN)
+    RETURN_NAMES = ("value", "hit")
+    CATEGORY = "Basic/flow control"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "execute"
+
+    # The prompt and the signature of the graph connected to the value input in it, that is
+    # calculated by check_lazy_status and used again by execute
+    _upstream: Optional[tuple[Optional[dict[str, Any]], str]] = None
+
+    def _signature(self, unique_id: str, prompt: Optional[dict[str, Any]], release: bool) -> str:
+        if self._upstream is None or self._upstream[0] is not prompt:
+            self._upstream = (prompt, _upstream_signature(prompt, unique_id, "value"))
+        signature = self._upstream[1]
+        if release:
+            self._upstream = None
+        return signature
+
+    def _cache_and_key(self, kwargs: dict[str, Any], release: bool = False) -> tuple[MemoCache, str]:
+        unique_id = str(kwargs.get("unique_id", ""))
+        signature = self._signature(unique_id, kwargs.get("prompt"), release)
+        cache = _memo_cache(unique_id)
+        cache.configure(kwargs.get("max_entries", 16), kwargs.get("ttl", 0.0), int(kwargs.get("spill_mb", 0.0) * 1024 * 1024))
+        if kwargs.get("clear", False):
+            cache.clear()
+
+        keys = sorted((int(name[4:]), value) for name, value in kwargs.items() if name.startswith("key_") and name[4:].isdigit())
+        # check_lazy_status and execute get the same key values, so they are hashed only once per prompt
+        # and released again by execute
+        return cache, content_hash([signature, [prompt_content_hash(value, release) for _, value in keys]])
+
+    def check_lazy_status(self, value: Any = None, **kwargs: Any) -> list[str]:
+        cache, key = self._cache_and_key(kwargs)
+        if key in cache:
+            return []  # a hit, the value input doesn't need to be evaluated
+        return ["value"] if value is None else []
+
+    def execute(self, value: Any = None, **kwargs: Any) -> tuple[Any, bool]:
+        cache, key = self._cache_and_key(kwargs, release=True)
+        cached = cache.get(key, _MISS)
+        if cached is not _MISS:
+            return cached, True
+        if value is None:
+            # The cached value expired after check_lazy_status, it can't be evaluated anymore
+            return ExecutionBlocker(None), False
+        cache.put(key, value)
+        return value, False
+
+
 class ContinueFlow(ComfyNodeABC):
     """
     Conditionally enable or disable a flow.
@@ -372,6 +560,8 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: IfElse": IfElse,
     "Basic data handling: IfElifElse": IfElifElse,
     "Basic data handling: SwitchCase": SwitchCase,
+    "Basic data handling: SwitchKey": SwitchKey,
+    "Basic data handling: Cache": Cache,
     "Basic data handling: ContinueFlow": ContinueFlow,
     "Basic data handling: FlowSelect": FlowSelect,
     "Basic data handling: ForceCalculation": ForceCalculation,
@@ -383,6 +573,8 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: IfElse": "if/else",
     "Basic data handling: IfElifElse": "if/elif/.../else",
     "Basic data handling: SwitchCase": "switch/case",
+    "Basic data handling: SwitchKey": "switch/case (key)",
+    "Basic data handling: Cache": "cache",
     "Basic data handling: ContinueFlow": "continue flow",
     "Basic data handling: FlowSelect": "flow select",
     "Basic data handling: ForceCalculation": "force calculation",
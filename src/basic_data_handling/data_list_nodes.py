@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 from inspect import cleandoc
 
 try:
@@ -14,6 +14,9 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._range_list import RangeList
+from ._sampling import UNSEEDED, node_rng, sample_indices, seed_change_key
+from ._statistics import streaming_statistics
 
 INT_MAX = 2**15-1 # the computer can do more but be nice to the eyes
 
@@ -265,6 +268,43 @@ class DataListAppend(ComfyNodeABC):
         return (result,)
 
 
+class DataListChunk(ComfyNodeABC):
+    """
+    Splits a data list into LISTs of a fixed size.
+
+    This node takes a data list and a chunk size and returns a data list where each
+    item is a LIST with up to `size` elements. The last LIST is shorter when the
+    length of the data list isn't a multiple of `size`.
+
+    Use this to feed a long data list in batches to nodes that can process a whole
+    LIST at once, as ComfyUI then calls them once per chunk and not once per item.
+    "unchunk" reverses this operation.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": (IO.ANY, {}),
+                "size": (IO.INT, {"default": 256, "min": 1}),
+            }
+        }
+
+    RETURN_TYPES = ("LIST",)
+    RETURN_NAMES = ("chunks",)
+    CATEGORY = "Basic/Data List"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "chunk"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def chunk(self, **kwargs: list[Any]) -> tuple[list[list[Any]]]:
+        input_list = kwargs.get('list', [])
+        size = kwargs.get('size', [256])[0]
+        if size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        return ([list(input_list[i:i + size]) for i in range(0, len(input_list), size)],)
+
+
 class DataListContains(ComfyNodeABC):
     """
     Checks if a list contains a specified value.
@@ -760,12 +800,18 @@ class DataListPopRandom(ComfyNodeABC):
 
     This node takes a list as input and returns the list with the random element removed
     and the removed element itself. If the list is empty, it returns None for the element.
+
+    With a seed of -1 a new random element is picked on every run. Any other seed
+    makes the selection reproducible.
     """
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "list": (IO.ANY, {}),
+            },
+            "optional": {
+                "seed": (IO.INT, {"default": -1, "min": -1}),
             }
         }
 
@@ -778,14 +824,14 @@ class DataListPopRandom(ComfyNodeABC):
     OUTPUT_IS_LIST = (True, False)
 
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("NaN")  # Not equal to anything -> trigger recalculation
+    def IS_CHANGED(cls, **kwargs: list[Any]) -> Any:
+        return seed_change_key(kwargs.get('seed', [UNSEEDED])[0])
 
     def pop_random_element(self, **kwargs: list[Any]) -> tuple[list[Any], Any]:
-        from random import randrange
+        rng = node_rng(self, kwargs.get('seed', [UNSEEDED])[0])
         input_list = kwargs.get('list', []).copy()
         if input_list:
-            random_element = input_list.pop(randrange(len(input_list)))
+            random_element = input_list.pop(rng.randrange(len(input_list)))
             return input_list, random_element
         return input_list, None
 
@@ -796,6 +842,7 @@ class DataListRange(ComfyNodeABC):
 
     This node generates a sequence of numbers similar to Python's range() function.
     It takes start, stop, and step parameters to define the sequence.
+    The numbers are only calculated when they are accessed.
     """
     @classmethod
     def INPUT_TYPES(cls):
@@ -815,10 +862,10 @@ class DataListRange(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     OUTPUT_IS_LIST = (True,)
 
-    def create_range(self, stop: int, start: int = 0, step: int = 1) -> tuple[list[int]]:
+    def create_range(self, stop: int, start: int = 0, step: int = 1) -> tuple[RangeList]:
         if step == 0:
             raise ValueError("Step cannot be zero")
-        return (list(range(start, stop, step)),)
+        return (RangeList(start, stop, step),)
 
 
 class DataListRemove(ComfyNodeABC):
@@ -883,6 +930,50 @@ class DataListReverse(ComfyNodeABC):
         return (result,)
 
 
+class DataListSample(ComfyNodeABC):
+    """
+    Returns random items of a list without replacement.
+
+    This node takes a list and the number of items to pick and returns a new list
+    with `count` distinct random elements. When the list is shorter than `count`
+    all elements are returned in a random order.
+    The selection only touches the picked elements, so sampling a few items
+    out of a very long list is cheap.
+
+    With a seed of -1 a new selection is made on every run. Any other seed
+    makes the selection reproducible.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": (IO.ANY, {}),
+                "count": (IO.INT, {"default": 1, "min": 0}),
+            },
+            "optional": {
+                "seed": (IO.INT, {"default": -1, "min": -1}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY,)
+    RETURN_NAMES = ("list",)
+    CATEGORY = "Basic/Data List"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "sample"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs: list[Any]) -> Any:
+        return seed_change_key(kwargs.get('seed', [UNSEEDED])[0])
+
+    def sample(self, **kwargs: list[Any]) -> tuple[list[Any]]:
+        rng = node_rng(self, kwargs.get('seed', [UNSEEDED])[0])
+        input_list = kwargs.get('list', [])
+        count = kwargs.get('count', [1])[0]
+        return ([input_list[i] for i in sample_indices(len(input_list), count, rng)],)
+
+
 class DataListSetItem(ComfyNodeABC):
     """
     Sets an item at a specified position in a list.
@@ -944,12 +1035,11 @@ class DataListShuffle(ComfyNodeABC):
     OUTPUT_IS_LIST = (True,)
 
     def shuffle_list(self, **kwargs: list[Any]) -> tuple[list[Any]]:
-        import random
+        from random import Random
         input_list = kwargs.get('list', [])
         seed = kwargs.get('seed', [0])[0]
-        random.seed(seed)
         result = input_list.copy()
-        random.shuffle(result)
+        Random(seed).shuffle(result)
         return (result,)
 
 
@@ -1024,6 +1114,38 @@ class DataListSort(ComfyNodeABC):
         return (result,)
 
 
+class DataListStatistics(ComfyNodeABC):
+    """
+    Calculates count, sum, min, max, mean and standard deviation of a data list of numbers.
+
+    The result is calculated in a single pass, so this node replaces separate
+    length, sum, min and max nodes. The standard deviation can be calculated
+    for the whole population or, with Bessel's correction, for a sample.
+    For an empty data list min, max, mean and stddev are None.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": (IO.NUMBER, {}),
+            },
+            "optional": {
+                "stddev": (["population", "sample"], {"default": "population"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT, IO.NUMBER, IO.NUMBER, IO.NUMBER, IO.FLOAT, IO.FLOAT)
+    RETURN_NAMES = ("count", "sum", "min", "max", "mean", "stddev")
+    CATEGORY = "Basic/Data List"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "statistics"
+    INPUT_IS_LIST = True
+
+    def statistics(self, **kwargs: list[Any]) -> tuple[int, Any, Any, Any, Optional[float], Optional[float]]:
+        sample = kwargs.get('stddev', ["population"])[0] == "sample"
+        return streaming_statistics(kwargs.get('list', []), sample)
+
+
 class DataListSum(ComfyNodeABC):
     """
     Sum all elements of the data list.
@@ -1055,6 +1177,34 @@ class DataListSum(ComfyNodeABC):
         return int(result), float(result)
 
 
+class DataListUnchunk(ComfyNodeABC):
+    """
+    Flattens a data list of LISTs into a single data list.
+
+    This node takes a data list where each item is a LIST (like the output of
+    "chunk") and returns one data list with all elements of all LISTs in order.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "chunks": ("LIST", {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY,)
+    RETURN_NAMES = ("list",)
+    CATEGORY = "Basic/Data List"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "unchunk"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def unchunk(self, **kwargs: list[Any]) -> tuple[list[Any]]:
+        from itertools import chain
+        return (list(chain.from_iterable(kwargs.get('chunks', []))),)
+
+
 class DataListZip(ComfyNodeABC):
     """
     Combines multiple lists element-wise.
@@ -1158,6 +1308,7 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: DataListAll": DataListAll,
     "Basic data handling: DataListAny": DataListAny,
     "Basic data handling: DataListAppend": DataListAppend,
+    "Basic data handling: DataListChunk": DataListChunk,
     "Basic data handling: DataListContains": DataListContains,
     "Basic data handling: DataListCount": DataListCount,
     "Basic data handling: DataListEnumerate": DataListEnumerate,
@@ -1177,11 +1328,14 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: DataListRange": DataListRange,
     "Basic data handling: DataListRemove": DataListRemove,
     "Basic data handling: DataListReverse": DataListReverse,
+    "Basic data handling: DataListSample": DataListSample,
     "Basic data handling: DataListSetItem": DataListSetItem,
     "Basic data handling: DataListShuffle": DataListShuffle,
     "Basic data handling: DataListSlice": DataListSlice,
     "Basic data handling: DataListSort": DataListSort,
+    "Basic data handling: DataListStatistics": DataListStatistics,
     "Basic data handling: DataListSum": DataListSum,
+    "Basic data handling: DataListUnchunk": DataListUnchunk,
     "Basic data handling: DataListZip": DataListZip,
     "Basic data handling: DataListToList": DataListToList,
     "Basic data handling: DataListToSet": DataListToSet,
@@ -1197,6 +1351,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: DataListAll": "all",
     "Basic data handling: DataListAny": "any",
     "Basic data handling: DataListAppend": "append",
+    "Basic data handling: DataListChunk": "chunk",
     "Basic data handling: DataListContains": "contains",
     "Basic data handling: DataListCount": "count",
     "Basic data handling: DataListEnumerate": "enumerate",
@@ -1216,11 +1371,14 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: DataListRange": "range",
     "Basic data handling: DataListRemove": "remove",
     "Basic data handling: DataListReverse": "reverse",
+    "Basic data handling: DataListSample": "sample",
     "Basic data handling: DataListSetItem": "set item",
     "Basic data handling: DataListShuffle": "shuffle",
     "Basic data handling: DataListSlice": "slice",
     "Basic data handling: DataListSort": "sort",
+    "Basic data handling: DataListStatistics": "statistics",
     "Basic data handling: DataListSum": "sum",
+    "Basic data handling: DataListUnchunk": "unchunk",
     "Basic data handling: DataListZip": "zip",
     "Basic data handling: DataListToList": "convert to LIST",
     "Basic data handling: DataListToSet": "convert to SET",
@@ -14,6 +14,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._sampling import UNSEEDED, node_rng, random_item, seed_change_key
 
 
 class DictCreate(ComfyNodeABC):
@@ -719,12 +720,18 @@ class DictPopRandom(ComfyNodeABC):
     This node takes a dictionary as input, removes a random key-value pair,
     and returns the modified dictionary along with the removed key and value.
     If the dictionary is empty, it returns empty values.
+
+    With a seed of -1 a new random pair is picked on every run. Any other seed
+    makes the selection reproducible.
     """
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "input_dict": ("DICT", {}),
+            },
+            "optional": {
+                "seed": ("INT", {"default": -1, "min": -1}),
             }
         }
 
@@ -735,15 +742,15 @@ class DictPopRandom(ComfyNodeABC):
     FUNCTION = "pop_random"
 
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("NaN")  # Not equal to anything -> trigger recalculation
+    def IS_CHANGED(cls, seed: int = UNSEEDED, **kwargs: Any) -> Any:
+        return seed_change_key(seed)
 
-    def pop_random(self, input_dict: dict) -> tuple[dict, str, Any, bool]:
-        import random
+    def pop_random(self, input_dict: dict[str, Any], seed: int = UNSEEDED) -> tuple[dict[str, Any], str, Any, bool]:
+        rng = node_rng(self, seed)
         result = input_dict.copy()
         try:
             if result:
-                random_key = random.choice(list(result.keys()))
+                random_key = random_item(result, len(result), rng)
                 random_value = result.pop(random_key)
                 return result, random_key, random_value, True
             else:
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 from inspect import cleandoc
 
 try:
@@ -14,6 +14,9 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._range_list import RangeList
+from ._sampling import UNSEEDED, node_rng, sample_indices, seed_change_key
+from ._statistics import streaming_statistics
 
 INT_MAX = 2**15-1 # the computer can do more but be nice to the eyes
 
@@ -595,12 +598,18 @@ class ListPopRandom(ComfyNodeABC):
 
     This node takes a LIST as input and returns the LIST with the random element removed
     and the removed element itself. If the LIST is empty, it returns None for the element.
+
+    With a seed of -1 a new random element is picked on every run. Any other seed
+    makes the selection reproducible.
     """
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "list": ("LIST", {}),
+            },
+            "optional": {
+                "seed": ("INT", {"default": -1, "min": -1}),
             }
         }
 
@@ -611,14 +620,14 @@ class ListPopRandom(ComfyNodeABC):
     FUNCTION = "pop_random_element"
 
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("NaN")  # Not equal to anything -> trigger recalculation
+    def IS_CHANGED(cls, seed: int = UNSEEDED, **kwargs: Any) -> Any:
+        return seed_change_key(seed)
 
-    def pop_random_element(self, list: list[Any]) -> tuple[list[Any], Any]:
-        import random
+    def pop_random_element(self, list: list[Any], seed: int = UNSEEDED) -> tuple[list[Any], Any]:
+        rng = node_rng(self, seed)
         result = list.copy()
         if result:
-            random_index = random.randrange(len(result))
+            random_index = rng.randrange(len(result))
             random_element = result.pop(random_index)
             return result, random_element
         return result, None
@@ -630,6 +639,10 @@ class ListRange(ComfyNodeABC):
 
     This node generates a LIST of numbers similar to Python's range() function.
     It takes start, stop, and step parameters to define the sequence.
+
+    The numbers are not stored but calculated when they are accessed. So getting
+    the length, an item or a slice of even a very long range is cheap. Nodes that
+    modify the LIST turn it into a regular LIST.
     """
     @classmethod
     def INPUT_TYPES(cls):
@@ -648,10 +661,10 @@ class ListRange(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "create_range"
 
-    def create_range(self, start: int, stop: int, step: int = 1) -> tuple[list[int]]:
+    def create_range(self, start: int, stop: int, step: int = 1) -> tuple[RangeList]:
         if step == 0:
             raise ValueError("Step cannot be zero")
-        return (list(range(start, stop, step)),)
+        return (RangeList(start, stop, step),)
 
 
 class ListRemove(ComfyNodeABC):
@@ -711,6 +724,45 @@ class ListReverse(ComfyNodeABC):
         return (result,)
 
 
+class ListSample(ComfyNodeABC):
+    """
+    Returns random items of a LIST without replacement.
+
+    This node takes a LIST and the number of items to pick and returns a new LIST
+    with `count` distinct random elements. When the LIST is shorter than `count`
+    all elements are returned in a random order.
+    The selection only touches the picked elements, so sampling a few items
+    out of a very long LIST is cheap.
+
+    With a seed of -1 a new selection is made on every run. Any other seed
+    makes the selection reproducible.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": ("LIST", {}),
+                "count": ("INT", {"default": 1, "min": 0}),
+            },
+            "optional": {
+                "seed": ("INT", {"default": -1, "min": -1}),
+            }
+        }
+
+    RETURN_TYPES = ("LIST",)
+    CATEGORY = "Basic/LIST"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "sample"
+
+    @classmethod
+    def IS_CHANGED(cls, seed: int = UNSEEDED, **kwargs: Any) -> Any:
+        return seed_change_key(seed)
+
+    def sample(self, list: list[Any], count: int, seed: int = UNSEEDED) -> tuple[list[Any]]:
+        rng = node_rng(self, seed)
+        return ([list[i] for i in sample_indices(len(list), count, rng)],)
+
+
 class ListSetItem(ComfyNodeABC):
     """
     Sets an item at a specified position in a LIST.
@@ -763,10 +815,9 @@ class ListShuffle(ComfyNodeABC):
     FUNCTION = "shuffle_list"
 
     def shuffle_list(self, list: list[Any], seed: int) -> tuple[list[Any]]:
-        import random
-        random.seed(seed)
+        from random import Random
         result = list.copy()
-        random.shuffle(result)
+        Random(seed).shuffle(result)
         return (result,)
 
 
@@ -835,6 +886,36 @@ class ListSort(ComfyNodeABC):
             return (list.copy(),)
 
 
+class ListStatistics(ComfyNodeABC):
+    """
+    Calculates count, sum, min, max, mean and standard deviation of a LIST of numbers.
+
+    The result is calculated in a single pass, so this node replaces separate
+    length, sum, min and max nodes. The standard deviation can be calculated
+    for the whole population or, with Bessel's correction, for a sample.
+    For an empty LIST min, max, mean and stddev are None.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "list": ("LIST", {}),
+            },
+            "optional": {
+                "stddev": (["population", "sample"], {"default": "population"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT, IO.NUMBER, IO.NUMBER, IO.NUMBER, IO.FLOAT, IO.FLOAT)
+    RETURN_NAMES = ("count", "sum", "min", "max", "mean", "stddev")
+    CATEGORY = "Basic/LIST"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "statistics"
+
+    def statistics(self, list: list[Any], stddev: str = "population") -> tuple[int, Any, Any, Any, Optional[float], Optional[float]]:
+        return streaming_statistics(list, stddev == "sample")
+
+
 class ListSum:
     """
     Sum all elements of the list.
@@ -938,10 +1019,12 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: ListRange": ListRange,
     "Basic data handling: ListRemove": ListRemove,
     "Basic data handling: ListReverse": ListReverse,
+    "Basic data handling: ListSample": ListSample,
     "Basic data handling: ListSetItem": ListSetItem,
     "Basic data handling: ListShuffle": ListShuffle,
     "Basic data handling: ListSlice": ListSlice,
     "Basic data handling: ListSort": ListSort,
+    "Basic data handling: ListStatistics": ListStatistics,
     "Basic data handling: ListSum": ListSum,
     "Basic data handling: ListToDataList": ListToDataList,
     "Basic data handling: ListToSet": ListToSet,
@@ -973,10 +1056,12 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: ListRange": "range",
     "Basic data handling: ListRemove": "remove",
     "Basic data handling: ListReverse": "reverse",
+    "Basic data handling: ListSample": "sample",
     "Basic data handling: ListSetItem": "set item",
     "Basic data handling: ListShuffle": "shuffle",
     "Basic data handling: ListSlice": "slice",
     "Basic data handling: ListSort": "sort",
+    "Basic data handling: ListStatistics": "statistics",
     "Basic data handling: ListSum": "sum",
     "Basic data handling: ListToDataList": "convert to Data List",
     "Basic data handling: ListToSet": "convert to SET",
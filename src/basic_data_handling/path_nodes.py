@@ -1,3 +1,4 @@
+from typing import Any
 from inspect import cleandoc
 import os
 import glob
@@ -24,6 +25,10 @@ except:
 
     get_output_directory = get_input_directory
 
+from ._content_hash import content_hash
+from ._csv_io import read_csv_columns
+from ._json_io import iter_json_lines, load_json, save_json, save_json_lines
+
 
 # helper functions:
 
@@ -350,34 +355,10 @@ class PathGlob(ComfyNodeABC):
     FUNCTION = "glob_paths"
     OUTPUT_IS_LIST = (True,)
 
-    # Class variable to store the last matched paths
-    _last_matched_paths = {}
-
     @classmethod
     def IS_CHANGED(s, pattern: str, recursive: bool = False):
-        # Get current paths
-        current_paths = glob.glob(pattern, recursive=recursive)
-
-        # Create a key for this specific pattern and recursive setting
-        key = f"{pattern}_{recursive}"
-
-        # If we haven't seen this pattern before, store it and trigger recalculation
-        if key not in s._last_matched_paths:
-            s._last_matched_paths[key] = current_paths
-            return float("NaN")
-
-        # Compare with previous paths
-        previous_paths = s._last_matched_paths[key]
-        if previous_paths != current_paths:
-            # Update stored paths and trigger recalculation
-            s._last_matched_paths[key] = current_paths
-            return float("NaN")
-
-        # No changes, return a consistent value
-        import hashlib
-        m = hashlib.md5()
-        m.update(str(current_paths).encode())
-        return m.hexdigest()
+        # Recalculate exactly when the set of matching paths changed
+        return content_hash(glob.glob(pattern, recursive=recursive))
 
     def glob_paths(self, pattern: str, recursive: bool = False) -> tuple[list[str]]:
         return (glob.glob(pattern, recursive=recursive),)
@@ -714,6 +695,141 @@ class PathLoadStringFile(ComfyNodeABC):
             return ("", False)
 
 
+class PathLoadJSON(ComfyNodeABC):
+    """
+    Loads a JSON file and returns its content, e.g. a DICT or a LIST.
+
+    When the file doesn't exist None is returned and exists is False. A file that
+    isn't valid JSON raises an error. orjson is used for decoding when it is installed.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "path": (IO.STRING, {"default": ""}),
+            },
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.BOOLEAN)
+    RETURN_NAMES = ("value", "exists")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "load_json"
+
+    @classmethod
+    def IS_CHANGED(cls, path: str) -> float:
+        try:
+            if os.path.exists(path):
+                return os.path.getmtime(path)
+        except Exception:
+            pass
+        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+
+    def load_json(self, path: str) -> tuple[Any, bool]:
+        if not os.path.isfile(path):
+            return (None, False)
+        return (load_json(path), True)
+
+
+class PathLoadJSONLines(ComfyNodeABC):
+    """
+    Loads a JSON Lines file, with one JSON value per line, as a data list.
+
+    The file is read and decoded line by line, so the whole file is never held in memory
+    as a string. With start and limit only a range of the records is returned, the lines
+    outside of it aren't decoded. A negative limit returns all records after start.
+    Empty lines are skipped. orjson is used for decoding when it is installed.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "start": (IO.INT, {"default": 0, "min": 0}),
+                "limit": (IO.INT, {"default": -1, "min": -1}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.BOOLEAN)
+    RETURN_NAMES = ("records", "exists")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "load_json_lines"
+    OUTPUT_IS_LIST = (True, False)
+
+    @classmethod
+    def IS_CHANGED(cls, path: str, **kwargs: Any) -> float:
+        try:
+            if os.path.exists(path):
+                return os.path.getmtime(path)
+        except Exception:
+            pass
+        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+
+    def load_json_lines(self, path: str, start: int = 0, limit: int = -1) -> tuple[list[Any], bool]:
+        if not os.path.isfile(path):
+            return ([], False)
+        return (list(iter_json_lines(path, start, limit)), True)
+
+
+class PathLoadCSV(ComfyNodeABC):
+    """
+    Loads up to 5 columns of a CSV file, each as a data list.
+
+    The file is parsed row by row in a single pass, so it is never held in memory as
+    a whole and only the values of the selected columns are kept. The columns are
+    selected by a comma separated list of header names or 0 based column numbers,
+    when empty the first 5 columns are used. With start and limit only a range of the
+    rows is read, a negative limit reads all rows after start. With infer_types a
+    column whose values are all integers, numbers or true/false becomes a data list
+    of INTs, FLOATs or BOOLEANs, otherwise it stays a data list of STRINGs.
+    Use "\\t" as delimiter for tab separated files.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "columns": (IO.STRING, {"default": ""}),
+                "has_header": (IO.BOOLEAN, {"default": True}),
+                "delimiter": (IO.STRING, {"default": ","}),
+                "start": (IO.INT, {"default": 0, "min": 0}),
+                "limit": (IO.INT, {"default": -1, "min": -1}),
+                "infer_types": (IO.BOOLEAN, {"default": True}),
+                "encoding": (IO.STRING, {"default": "utf-8"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.ANY, IO.ANY, IO.ANY, IO.ANY, "LIST", IO.INT)
+    RETURN_NAMES = ("column_1", "column_2", "column_3", "column_4", "column_5", "column names", "row count")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "load_csv"
+    OUTPUT_IS_LIST = (True, True, True, True, True, False, False)
+
+    @classmethod
+    def IS_CHANGED(cls, path: str, **kwargs: Any) -> float:
+        try:
+            if os.path.exists(path):
+                return os.path.getmtime(path)
+        except Exception:
+            pass
+        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+
+    def load_csv(self, path: str, columns: str = "", has_header: bool = True, delimiter: str = ",", start: int = 0,
+                 limit: int = -1, infer_types: bool = True, encoding: str = "utf-8") -> tuple[Any, ...]:
+        outputs = len(self.RETURN_NAMES) - 2
+        names, values = read_csv_columns(path, columns, has_header, delimiter, start, limit, infer_types, encoding, outputs)
+        if len(values) > outputs:
+            raise ValueError(f"At most {outputs} CSV columns can be loaded at once, got {len(values)}")
+        row_count = len(values[0]) if values else 0
+        return (*values, *([[]] * (outputs - len(values))), names, row_count)
+
+
 class PathLoadImageRGB(ComfyNodeABC):
     """
     Loads an image from a file path and returns only the RGB channels.
@@ -967,6 +1083,83 @@ class PathSaveStringFile(ComfyNodeABC):
             return (False,)
 
 
+class PathSaveJSON(ComfyNodeABC):
+    """
+    Saves a value, e.g. a DICT or a LIST, as a JSON file.
+
+    With indent set to 0 the JSON is written compact, otherwise it is indented by
+    that number of spaces. The JSON is written while it is encoded, the items of a
+    large LIST one by one, so no string of the whole file is created. orjson is used
+    for the compact encoding when it is installed.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "value": (IO.ANY, {}),
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "indent": (IO.INT, {"default": 2, "min": 0, "max": 16}),
+                "create_dirs": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    RETURN_NAMES = ("success",)
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "save_json"
+    OUTPUT_NODE = True
+
+    def save_json(self, value: Any, path: str, indent: int = 2, create_dirs: bool = True) -> tuple[bool]:
+        try:
+            save_json(value, path, indent, create_dirs)
+            print(f"Basic data handling: Successfully saved JSON to {path}")
+            return (True,)
+        except Exception as e:
+            print(f"Basic data handling: Error saving JSON file: {e}")
+            return (False,)
+
+
+class PathSaveJSONLines(ComfyNodeABC):
+    """
+    Saves every item of a data list as one line of a JSON Lines file.
+
+    The items are encoded and written one by one. orjson is used for the encoding
+    when it is installed.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "records": (IO.ANY, {}),
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "create_dirs": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN, IO.INT)
+    RETURN_NAMES = ("success", "count")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "save_json_lines"
+    INPUT_IS_LIST = True
+    OUTPUT_NODE = True
+
+    def save_json_lines(self, **kwargs: list[Any]) -> tuple[bool, int]:
+        path = kwargs.get('path', [""])[0]
+        try:
+            count = save_json_lines(kwargs.get('records', []), path, kwargs.get('create_dirs', [True])[0])
+            print(f"Basic data handling: Successfully saved {count} JSON lines to {path}")
+            return (True, count)
+        except Exception as e:
+            print(f"Basic data handling: Error saving JSON Lines file: {e}")
+            return (False, 0)
+
+
 class PathSaveImageRGB(ComfyNodeABC):
     """
     Saves an image to a file.
@@ -1230,11 +1423,16 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: PathSplit": PathSplit,
     "Basic data handling: PathSplitExt": PathSplitExt,
     "Basic data handling: PathLoadStringFile": PathLoadStringFile,
+    "Basic data handling: PathLoadJSON": PathLoadJSON,
+    "Basic data handling: PathLoadJSONLines": PathLoadJSONLines,
+    "Basic data handling: PathLoadCSV": PathLoadCSV,
     "Basic data handling: PathLoadImageRGB": PathLoadImageRGB,
     "Basic data handling: PathLoadImageRGBA": PathLoadImageRGBA,
     "Basic data handling: PathLoadMaskFromAlpha": PathLoadMaskFromAlpha,
     "Basic data handling: PathLoadMaskFromGreyscale": PathLoadMaskFromGreyscale,
     "Basic data handling: PathSaveStringFile": PathSaveStringFile,
+    "Basic data handling: PathSaveJSON": PathSaveJSON,
+    "Basic data handling: PathSaveJSONLines": PathSaveJSONLines,
     "Basic data handling: PathSaveImageRGB": PathSaveImageRGB,
     "Basic data handling: PathSaveImageRGBA": PathSaveImageRGBA,
 }
@@ -1263,11 +1461,16 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: PathSplit": "split",
     "Basic data handling: PathSplitExt": "splitext",
     "Basic data handling: PathLoadStringFile": "load STRING from file",
+    "Basic data handling: PathLoadJSON": "load JSON from file",
+    "Basic data handling: PathLoadJSONLines": "load JSON Lines from file",
+    "Basic data handling: PathLoadCSV": "load CSV columns from file",
     "Basic data handling: PathLoadImageRGB": "load IMAGE from file (RGB)",
     "Basic data handling: PathLoadImageRGBA": "load IMAGE+MASK from file (RGBA)",
     "Basic data handling: PathLoadMaskFromAlpha": "load MASK from alpha channel",
     "Basic data handling: PathLoadMaskFromGreyscale": "load MASK from greyscale/red",
     "Basic data handling: PathSaveStringFile": "save STRING to file",
+    "Basic data handling: PathSaveJSON": "save JSON to file",
+    "Basic data handling: PathSaveJSONLines": "save JSON Lines to file",
     "Basic data handling: PathSaveImageRGB": "save IMAGE to file",
     "Basic data handling: PathSaveImageRGBA": "save IMAGE+MASK to file",
 }
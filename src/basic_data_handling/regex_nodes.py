@@ -1,5 +1,5 @@
 from inspect import cleandoc
-import re
+from typing import Any, Iterable
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -13,6 +13,165 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._multi_match import build_matcher
+from ._regex_cache import DEFAULT_MAXSIZE, PATTERN_CACHE, regex_flags
+from ._regex_guard import run_regex
+
+# Optional inputs shared by all regex nodes to set the flags of the pattern
+REGEX_FLAG_INPUTS = {
+    "ignorecase": (IO.BOOLEAN, {"default": False}),
+    "multiline": (IO.BOOLEAN, {"default": False}),
+    "dotall": (IO.BOOLEAN, {"default": False}),
+    "verbose": (IO.BOOLEAN, {"default": False}),
+}
+
+# Optional inputs of the regex nodes that guard against catastrophic backtracking:
+# a time budget in seconds (0 = unlimited) and a static check for nested quantifiers
+REGEX_OPTION_INPUTS = {
+    **REGEX_FLAG_INPUTS,
+    "timeout": (IO.FLOAT, {"default": 0.0, "min": 0.0, "step": 0.1}),
+    "check_pattern": (IO.BOOLEAN, {"default": False}),
+}
+
+
+def _run(operation: str, pattern: str, strings: list[str], args: tuple[Any, ...] = (),
+         timeout: float = 0.0, check_pattern: bool = False, **flags: bool) -> list[Any]:
+    """Runs a regex operation with the optional inputs of a node for every string."""
+    return run_regex(operation, pattern, strings, args, regex_flags(**flags), timeout, check_pattern)
+
+
+def _run_from_list_inputs(operation: str, kwargs: dict[str, list[Any]], args: tuple[Any, ...] = ()) -> list[Any]:
+    """Runs a regex operation for a node with INPUT_IS_LIST, where every input is a list."""
+    options = {name: kwargs[name][0] for name in REGEX_OPTION_INPUTS if name in kwargs}
+    return _run(operation, kwargs.get('pattern', [""])[0], kwargs.get('strings', []), args, **options)
+
+
+class RegexCacheInfo(ComfyNodeABC):
+    """
+    Reports and configures the cache of compiled regular expressions.
+
+    All regex nodes share one cache of compiled patterns, keyed by the pattern and
+    its flags, so each distinct pattern is only compiled once. This node returns the
+    number of cache hits and misses, the number of cached patterns and the
+    maximum cache size. A changed max_size resizes the cache and `clear` empties
+    it and resets the counters.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "optional": {
+                "max_size": ("INT", {"default": DEFAULT_MAXSIZE, "min": 0}),
+                "clear": (IO.BOOLEAN, {"default": False}),
+                "trigger": (IO.ANY, {}),
+            }
+        }
+
+    RETURN_TYPES = ("INT", "INT", "INT", "INT")
+    RETURN_NAMES = ("hits", "misses", "size", "max_size")
+    CATEGORY = "Basic/STRING/regex"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "cache_info"
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs: Any) -> float:
+        return float("NaN")  # The statistics change with every run of any regex node
+
+    def cache_info(self, max_size: int = DEFAULT_MAXSIZE, clear: bool = False, trigger: Any = None) -> tuple[int, int, int, int]:
+        if clear:
+            PATTERN_CACHE.clear()
+        if max_size != PATTERN_CACHE.maxsize:
+            PATTERN_CACHE.resize(max_size)
+        return PATTERN_CACHE.hits, PATTERN_CACHE.misses, len(PATTERN_CACHE), PATTERN_CACHE.maxsize
+
+
+class RegexDataListFindall(ComfyNodeABC):
+    """
+    Returns all non-overlapping matches of a pattern for every string of a data list.
+
+    The pattern is compiled once and applied to the whole data list in a single call.
+    The result is a data list with a LIST of matches for each input string.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "pattern": (IO.STRING, {}),
+            },
+            "optional": REGEX_OPTION_INPUTS,
+        }
+
+    RETURN_TYPES = ("LIST",)
+    CATEGORY = "Basic/STRING/regex"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "findall"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def findall(self, **kwargs: list[Any]) -> tuple[list[list[str]]]:
+        return (_run_from_list_inputs("findall", kwargs),)
+
+
+class RegexDataListSub(ComfyNodeABC):
+    """
+    Substitutes matches of the pattern in every string of a data list with a replacement string.
+
+    The pattern is compiled once and applied to the whole data list in a single call.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "pattern": (IO.STRING, {}),
+                "repl": (IO.STRING, {}),
+                "count": ("INT", {"default": 0}),  # 0 means replace all occurrences
+            },
+            "optional": REGEX_OPTION_INPUTS,
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    CATEGORY = "Basic/STRING/regex"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "sub"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def sub(self, **kwargs: list[Any]) -> tuple[list[str]]:
+        repl = kwargs.get('repl', [""])[0]
+        count = kwargs.get('count', [0])[0]
+        return (_run_from_list_inputs("sub", kwargs, (repl, count)),)
+
+
+class RegexDataListTest(ComfyNodeABC):
+    """
+    Tests whether a regex pattern matches any part of every string of a data list.
+
+    The pattern is compiled once and applied to the whole data list in a single call.
+    The result is a data list of BOOLEANs that can be used directly by "filter"
+    or "filter select".
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "pattern": (IO.STRING, {}),
+            },
+            "optional": REGEX_OPTION_INPUTS,
+        }
+
+    RETURN_TYPES = ("BOOLEAN",)
+    CATEGORY = "Basic/STRING/regex"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "test"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def test(self, **kwargs: list[Any]) -> tuple[list[bool]]:
+        return (_run_from_list_inputs("test", kwargs),)
+
+
 class RegexFindallDataList(ComfyNodeABC):
     """
     Returns all non-overlapping matches of a pattern in the string as a list of strings.
@@ -23,7 +182,8 @@ class RegexFindallDataList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = (IO.STRING,)
@@ -32,8 +192,8 @@ class RegexFindallDataList(ComfyNodeABC):
     FUNCTION = "findall"
     OUTPUT_IS_LIST = (True,)
 
-    def findall(self, pattern: str, string: str) -> tuple[list[str]]:
-        return (re.findall(pattern, string),)
+    def findall(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("findall", pattern, [string], **options)[0],)
 
 
 class RegexFindallList(ComfyNodeABC):
@@ -46,7 +206,8 @@ class RegexFindallList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = ("LIST",)
@@ -54,8 +215,8 @@ class RegexFindallList(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "findall"
 
-    def findall(self, pattern: str, string: str) -> tuple[list[str]]:
-        return (re.findall(pattern, string),)
+    def findall(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("findall", pattern, [string], **options)[0],)
 
 
 class RegexGroupDict(ComfyNodeABC):
@@ -69,7 +230,8 @@ class RegexGroupDict(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = ("DICT",)
@@ -77,11 +239,51 @@ class RegexGroupDict(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "groupdict"
 
-    def groupdict(self, pattern: str, string: str) -> tuple[dict]:
-        match = re.search(pattern, string)
-        if match:
-            return (match.groupdict(),)
-        return ({},)
+    def groupdict(self, pattern: str, string: str, **options: Any) -> tuple[dict[str, Any]]:
+        return (_run("groupdict", pattern, [string], **options)[0],)
+
+
+class RegexMatchPatternSet(ComfyNodeABC):
+    """
+    Checks which of many patterns occur in the string in a single scan.
+
+    This node takes a LIST or SET of patterns and returns a LIST of the patterns that
+    were found, whether any was found and how many were found. Instead of testing
+    each pattern on its own the patterns are combined into one matcher that is
+    cached, so repeated runs with the same patterns don't need to build it again.
+
+    In "literal" mode the patterns are plain text (like the "in (contains)" node) and
+    are searched with a keyword trie. In "regex" mode they are regular expressions
+    that are combined into one alternation. Patterns with backreferences, conditionals,
+    named groups or inline flags are searched on their own, which is slower.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "string": (IO.STRING, {}),
+                "patterns": ("LIST,SET", {}),
+                "mode": (["literal", "regex"], {"default": "literal"}),
+            },
+            "optional": REGEX_FLAG_INPUTS,
+        }
+
+    RETURN_TYPES = ("LIST", IO.BOOLEAN, IO.INT)
+    RETURN_NAMES = ("matched", "any", "count")
+    CATEGORY = "Basic/STRING/regex"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "match"
+
+    def match(self, string: str, patterns: Iterable[str], mode: str = "literal", **flags: bool) -> tuple[list[str], bool, int]:
+        if isinstance(patterns, set):
+            patterns = sorted(patterns)
+        unique = tuple(dict.fromkeys(patterns))  # remove duplicates but keep the order
+        if not unique:
+            return [], False, 0
+        matcher = build_matcher(unique, mode == "literal", regex_flags(**flags))
+        found = matcher.find(string)
+        matched = [pattern for index, pattern in enumerate(unique) if index in found]
+        return matched, len(matched) > 0, len(matched)
 
 
 class RegexSearchGroupsDataList(ComfyNodeABC):
@@ -95,7 +297,8 @@ class RegexSearchGroupsDataList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = (IO.STRING,)
@@ -104,11 +307,8 @@ class RegexSearchGroupsDataList(ComfyNodeABC):
     FUNCTION = "search_groups"
     OUTPUT_IS_LIST = (True,)
 
-    def search_groups(self, pattern: str, string: str) -> tuple[list[str]]:
-        match = re.search(pattern, string)
-        if match:
-            return (list(match.groups()),)
-        return ([],)
+    def search_groups(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("groups", pattern, [string], **options)[0],)
 
 
 class RegexSearchGroupsList(ComfyNodeABC):
@@ -122,7 +322,8 @@ class RegexSearchGroupsList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = ("LIST",)
@@ -130,11 +331,8 @@ class RegexSearchGroupsList(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "search_groups"
 
-    def search_groups(self, pattern: str, string: str) -> tuple[list[str]]:
-        match = re.search(pattern, string)
-        if match:
-            return (list(match.groups()),)
-        return ([],)
+    def search_groups(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("groups", pattern, [string], **options)[0],)
 
 
 class RegexSplitDataList(ComfyNodeABC):
@@ -147,7 +345,8 @@ class RegexSplitDataList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = (IO.STRING,)
@@ -156,8 +355,8 @@ class RegexSplitDataList(ComfyNodeABC):
     FUNCTION = "split"
     OUTPUT_IS_LIST = (True,)
 
-    def split(self, pattern: str, string: str) -> tuple[list[str]]:
-        return (re.split(pattern, string),)
+    def split(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("split", pattern, [string], **options)[0],)
 
 
 class RegexSplitList(ComfyNodeABC):
@@ -170,7 +369,8 @@ class RegexSplitList(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = ("LIST",)
@@ -178,8 +378,8 @@ class RegexSplitList(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "split"
 
-    def split(self, pattern: str, string: str) -> tuple[list[str]]:
-        return (re.split(pattern, string),)
+    def split(self, pattern: str, string: str, **options: Any) -> tuple[list[str]]:
+        return (_run("split", pattern, [string], **options)[0],)
 
 
 class RegexSub(ComfyNodeABC):
@@ -194,7 +394,8 @@ class RegexSub(ComfyNodeABC):
                 "pattern": (IO.STRING, {}),
                 "repl": (IO.STRING, {}),
                 "count": ("INT", {"default": 0}),  # 0 means replace all occurrences
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = (IO.STRING,)
@@ -202,8 +403,8 @@ class RegexSub(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "sub"
 
-    def sub(self, pattern: str, repl: str, string: str, count: int = 0) -> tuple[str]:
-        return (re.sub(pattern, repl, string, count),)
+    def sub(self, pattern: str, repl: str, string: str, count: int = 0, **options: Any) -> tuple[str]:
+        return (_run("sub", pattern, [string], (repl, count), **options)[0],)
 
 
 class RegexTest(ComfyNodeABC):
@@ -217,7 +418,8 @@ class RegexTest(ComfyNodeABC):
             "required": {
                 "string": (IO.STRING, {}),
                 "pattern": (IO.STRING, {}),
-            }
+            },
+            "optional": REGEX_OPTION_INPUTS,
         }
 
     RETURN_TYPES = ("BOOLEAN",)
@@ -225,15 +427,19 @@ class RegexTest(ComfyNodeABC):
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "test"
 
-    def test(self, pattern: str, string: str) -> tuple[bool]:
-        match = re.search(pattern, string)
-        return (match is not None,)
+    def test(self, pattern: str, string: str, **options: Any) -> tuple[bool]:
+        return (_run("test", pattern, [string], **options)[0],)
 
 
 NODE_CLASS_MAPPINGS = {
+    "Basic data handling: RegexCacheInfo": RegexCacheInfo,
+    "Basic data handling: RegexDataListFindall": RegexDataListFindall,
+    "Basic data handling: RegexDataListSub": RegexDataListSub,
+    "Basic data handling: RegexDataListTest": RegexDataListTest,
     "Basic data handling: RegexFindallDataList": RegexFindallDataList,
     "Basic data handling: RegexFindallList": RegexFindallList,
     "Basic data handling: RegexGroupDict": RegexGroupDict,
+    "Basic data handling: RegexMatchPatternSet": RegexMatchPatternSet,
     "Basic data handling: RegexSearchGroupsDataList": RegexSearchGroupsDataList,
     "Basic data handling: RegexSearchGroupsList": RegexSearchGroupsList,
     "Basic data handling: RegexSplitDataList": RegexSplitDataList,
@@ -243,9 +449,14 @@ NODE_CLASS_MAPPINGS = {
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
+    "Basic data handling: RegexCacheInfo": "pattern cache info",
+    "Basic data handling: RegexDataListFindall": "find all in each (data list)",
+    "Basic data handling: RegexDataListSub": "substitute in each (data list)",
+    "Basic data handling: RegexDataListTest": "test each (data list)",
     "Basic data handling: RegexFindallDataList": "find all (data list)",
     "Basic data handling: RegexFindallList": "find all (LIST)",
     "Basic data handling: RegexGroupDict": "search named groups",
+    "Basic data handling: RegexMatchPatternSet": "match pattern set",
     "Basic data handling: RegexSearchGroupsDataList": "search groups (data list)",
     "Basic data handling: RegexSearchGroupsList": "search groups (LIST)",
     "Basic data handling: RegexSplitDataList": "split (data list)",
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 from inspect import cleandoc
 
 try:
@@ -14,6 +14,23 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._sampling import UNSEEDED, node_rng, random_item, reservoir_sample, seed_change_key
+from ._statistics import streaming_statistics
+
+
+def _dynamic_sets(kwargs: dict[str, Optional[set[Any]]]) -> list[set[Any]]:
+    """Returns the connected dynamic "set_X" inputs in the order of their numbers."""
+    numbered = sorted((int(name[4:]), value) for name, value in kwargs.items()
+                      if name.startswith("set_") and name[4:].isdigit() and value is not None)
+    return [value for _, value in numbered]
+
+
+def _many_sets_inputs() -> dict[str, Any]:
+    return {
+        "required": ContainsDynamicDict({
+            "set_0": ("SET", {"_dynamic": "number"}),
+        })
+    }
 
 
 class SetCreate(ComfyNodeABC):
@@ -505,12 +522,18 @@ class SetPopRandom(ComfyNodeABC):
 
     This node takes a SET as input and returns the SET with a random element removed
     and the removed element itself. If the SET is empty, it returns None for the element.
+
+    With a seed of -1 a new random element is picked on every run. Any other seed
+    makes the selection reproducible for the same SET.
     """
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "set": ("SET", {}),
+            },
+            "optional": {
+                "seed": ("INT", {"default": -1, "min": -1}),
             }
         }
 
@@ -521,19 +544,57 @@ class SetPopRandom(ComfyNodeABC):
     FUNCTION = "pop_random_element"
 
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("NaN")  # Not equal to anything -> trigger recalculation
+    def IS_CHANGED(cls, seed: int = UNSEEDED, **kwargs: Any) -> Any:
+        return seed_change_key(seed)
 
-    def pop_random_element(self, set: set[Any]) -> tuple[set[Any], Any]:
-        import random
+    def pop_random_element(self, set: set[Any], seed: int = UNSEEDED) -> tuple[set[Any], Any]:
+        rng = node_rng(self, seed)
         result = set.copy()
         if result:
-            random_element = random.choice(list(result))
+            random_element = random_item(result, len(result), rng)
             result.remove(random_element)
             return result, random_element
         return result, None
 
 
+class SetSample(ComfyNodeABC):
+    """
+    Returns random elements of a SET without replacement.
+
+    This node takes a SET and the number of elements to pick and returns a LIST
+    with `count` distinct random elements. When the SET is smaller than `count`
+    all elements are returned in a random order.
+    The SET is sampled in a single pass without copying it.
+
+    With a seed of -1 a new selection is made on every run. Any other seed
+    makes the selection reproducible for the same SET.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "set": ("SET", {}),
+                "count": ("INT", {"default": 1, "min": 0}),
+            },
+            "optional": {
+                "seed": ("INT", {"default": -1, "min": -1}),
+            }
+        }
+
+    RETURN_TYPES = ("LIST",)
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "sample"
+
+    @classmethod
+    def IS_CHANGED(cls, seed: int = UNSEEDED, **kwargs: Any) -> Any:
+        return seed_change_key(seed)
+
+    def sample(self, set: set[Any], count: int, seed: int = UNSEEDED) -> tuple[list[Any]]:
+        rng = node_rng(self, seed)
+        return (reservoir_sample(set, count, rng),)
+
+
 class SetRemove(ComfyNodeABC):
     """
     Removes an item from a SET.
@@ -566,6 +627,36 @@ class SetRemove(ComfyNodeABC):
             return result, False
 
 
+class SetStatistics(ComfyNodeABC):
+    """
+    Calculates count, sum, min, max, mean and standard deviation of a SET of numbers.
+
+    The result is calculated in a single pass, so this node replaces separate
+    length, sum, min and max nodes. The standard deviation can be calculated
+    for the whole population or, with Bessel's correction, for a sample.
+    For an empty SET min, max, mean and stddev are None.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "set": ("SET", {}),
+            },
+            "optional": {
+                "stddev": (["population", "sample"], {"default": "population"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT, IO.NUMBER, IO.NUMBER, IO.NUMBER, IO.FLOAT, IO.FLOAT)
+    RETURN_NAMES = ("count", "sum", "min", "max", "mean", "stddev")
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "statistics"
+
+    def statistics(self, set: set[Any], stddev: str = "population") -> tuple[int, Any, Any, Any, Optional[float], Optional[float]]:
+        return streaming_statistics(set, stddev == "sample")
+
+
 class SetSum(ComfyNodeABC):
     """
     Calculates the sum of all elements in a SET.
@@ -664,6 +755,113 @@ class SetUnion(ComfyNodeABC):
         return (result,)
 
 
+class SetUnionMany(ComfyNodeABC):
+    """
+    Returns the union of any number of SETs.
+
+    This node takes a dynamic number of SETs and returns a new SET containing all
+    elements from all of them. The result is a copy of the largest SET that is
+    extended by the others, without creating intermediate SETs.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return _many_sets_inputs()
+
+    RETURN_TYPES = ("SET",)
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "union"
+
+    def union(self, **kwargs: Optional[set[Any]]) -> tuple[set[Any]]:
+        sets = _dynamic_sets(kwargs)
+        if not sets:
+            return (set(),)
+        largest = max(range(len(sets)), key=lambda i: len(sets[i]))
+        return (sets[largest].union(*sets[:largest], *sets[largest + 1:]),)
+
+
+class SetIntersectionMany(ComfyNodeABC):
+    """
+    Returns the intersection of any number of SETs.
+
+    This node takes a dynamic number of SETs and returns a new SET containing only
+    elements present in all of them. The SETs are intersected from the smallest to
+    the largest, so each step only checks the elements that are still left, and it
+    stops as soon as the result is empty.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return _many_sets_inputs()
+
+    RETURN_TYPES = ("SET",)
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "intersection"
+
+    def intersection(self, **kwargs: Optional[set[Any]]) -> tuple[set[Any]]:
+        sets = sorted(_dynamic_sets(kwargs), key=len)
+        if not sets:
+            return (set(),)
+        result = set(sets[0])
+        for other in sets[1:]:
+            if not result:
+                break
+            result.intersection_update(other)
+        return (result,)
+
+
+class SetDifferenceMany(ComfyNodeABC):
+    """
+    Returns the elements of the first SET that are in none of the other SETs.
+
+    This node takes a dynamic number of SETs and removes the elements of all the
+    other SETs from a copy of the first one. It stops as soon as the result is empty.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return _many_sets_inputs()
+
+    RETURN_TYPES = ("SET",)
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "difference"
+
+    def difference(self, **kwargs: Optional[set[Any]]) -> tuple[set[Any]]:
+        sets = _dynamic_sets(kwargs)
+        if not sets:
+            return (set(),)
+        result = set(sets[0])
+        for other in sets[1:]:
+            if not result:
+                break
+            result = result.difference(other)  # only checks the elements of result when other is larger
+        return (result,)
+
+
+class SetSymmetricDifferenceMany(ComfyNodeABC):
+    """
+    Returns the symmetric difference of any number of SETs.
+
+    This node takes a dynamic number of SETs and returns a new SET containing the
+    elements that are in an odd number of them, like chaining "symmetric difference".
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return _many_sets_inputs()
+
+    RETURN_TYPES = ("SET",)
+    CATEGORY = "Basic/SET"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "symmetric_difference"
+
+    def symmetric_difference(self, **kwargs: Optional[set[Any]]) -> tuple[set[Any]]:
+        sets = _dynamic_sets(kwargs)
+        result = set(sets[0]) if sets else set()
+        for other in sets[1:]:
+            result.symmetric_difference_update(other)
+        return (result,)
+
+
 class SetToDataList(ComfyNodeABC):
     """
     Converts a SET object into a ComfyUI data list.
@@ -736,9 +934,15 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: SetPop": SetPop,
     "Basic data handling: SetPopRandom": SetPopRandom,
     "Basic data handling: SetRemove": SetRemove,
+    "Basic data handling: SetSample": SetSample,
+    "Basic data handling: SetStatistics": SetStatistics,
     "Basic data handling: SetSum": SetSum,
     "Basic data handling: SetSymmetricDifference": SetSymmetricDifference,
     "Basic data handling: SetUnion": SetUnion,
+    "Basic data handling: SetUnionMany": SetUnionMany,
+    "Basic data handling: SetIntersectionMany": SetIntersectionMany,
+    "Basic data handling: SetDifferenceMany": SetDifferenceMany,
+    "Basic data handling: SetSymmetricDifferenceMany": SetSymmetricDifferenceMany,
     "Basic data handling: SetToDataList": SetToDataList,
     "Basic data handling: SetToList": SetToList,
 }
@@ -764,9 +968,15 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: SetPop": "pop",
     "Basic data handling: SetPopRandom": "pop random",
     "Basic data handling: SetRemove": "remove",
+    "Basic data handling: SetSample": "sample",
+    "Basic data handling: SetStatistics": "statistics",
     "Basic data handling: SetSum": "sum",
     "Basic data handling: SetSymmetricDifference": "symmetric difference",
     "Basic data handling: SetUnion": "union",
+    "Basic data handling: SetUnionMany": "union of many",
+    "Basic data handling: SetIntersectionMany": "intersection of many",
+    "Basic data handling: SetDifferenceMany": "difference of many",
+    "Basic data handling: SetSymmetricDifferenceMany": "symmetric difference of many",
     "Basic data handling: SetToDataList": "convert to Data List",
     "Basic data handling: SetToList": "convert to LIST",
 }
@@ -1,4 +1,6 @@
 from inspect import cleandoc
+from itertools import islice, repeat
+from typing import Any, Callable, Iterable
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -12,6 +14,97 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._json_io import atomic_writer
+from ._regex_cache import compile_pattern
+from ._replace import build_replacer
+from ._template import MISSING_POLICIES, compile_template
+
+def _fillchar(text: str) -> str:
+    return text[0] if text else " "
+
+
+def _join_to_file(strings: Iterable[Any], sep: str, path: str, chunk_size: int, encoding: str, create_dirs: bool) -> int:
+    """
+    Writes the joined strings to a file, `chunk_size` strings at a time, and returns the number of bytes.
+
+    Only one chunk is joined in memory at a time, so the size of the result is not limited by memory.
+    The file is only replaced when all strings were written.
+    """
+    if not path:
+        raise ValueError("No path specified to write the joined strings to")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    separator = sep.encode(encoding)
+    size = 0
+    iterator = map(str, strings)
+    with atomic_writer(path, create_dirs) as f:
+        first = True
+        while chunk := list(islice(iterator, chunk_size)):
+            data = sep.join(chunk).encode(encoding)
+            if not first:
+                data = separator + data
+            first = False
+            size += f.write(data)
+    return size
+
+
+def _regex_splitter(pattern: str, maxsplit: int) -> Callable[[str], list[str]]:
+    split = compile_pattern(pattern).split
+    maxsplit = max(maxsplit, 0)  # re uses 0 for no limit
+    return lambda string: split(string, maxsplit)
+
+
+# Split mode -> factory that binds the parameters once and returns the function that splits a single string
+_SPLIT_MODES: dict[str, Callable[[str, int, bool], Callable[[str], list[str]]]] = {
+    "split": lambda sep, maxsplit, keepends: lambda string: string.split(sep or None, maxsplit),
+    "rsplit": lambda sep, maxsplit, keepends: lambda string: string.rsplit(sep or None, maxsplit),
+    "splitlines": lambda sep, maxsplit, keepends: lambda string: string.splitlines(keepends),
+    "regex": lambda sep, maxsplit, keepends: _regex_splitter(sep, maxsplit),
+}
+
+# Operation name -> factory that binds the parameters once and returns the function for a single string
+_STRING_MAP_OPERATIONS: dict[str, Callable[[str, str, int, int], Callable[[str], str]]] = {
+    "capitalize": lambda text, new_text, count, width: str.capitalize,
+    "casefold": lambda text, new_text, count, width: str.casefold,
+    "lower": lambda text, new_text, count, width: str.lower,
+    "swapcase": lambda text, new_text, count, width: str.swapcase,
+    "title": lambda text, new_text, count, width: str.title,
+    "upper": lambda text, new_text, count, width: str.upper,
+    "strip": lambda text, new_text, count, width: lambda string: string.strip(text or None),
+    "lstrip": lambda text, new_text, count, width: lambda string: string.lstrip(text or None),
+    "rstrip": lambda text, new_text, count, width: lambda string: string.rstrip(text or None),
+    "removeprefix": lambda text, new_text, count, width: lambda string: string.removeprefix(text),
+    "removesuffix": lambda text, new_text, count, width: lambda string: string.removesuffix(text),
+    "add prefix": lambda text, new_text, count, width: lambda string: text + string,
+    "add suffix": lambda text, new_text, count, width: lambda string: string + text,
+    "replace": lambda text, new_text, count, width: lambda string: string.replace(text, new_text, count),
+    "center": lambda text, new_text, count, width: lambda string: string.center(width, _fillchar(text)),
+    "ljust": lambda text, new_text, count, width: lambda string: string.ljust(width, _fillchar(text)),
+    "rjust": lambda text, new_text, count, width: lambda string: string.rjust(width, _fillchar(text)),
+    "zfill": lambda text, new_text, count, width: lambda string: string.zfill(width),
+}
+
+_STRING_TEST_OPERATIONS: dict[str, Callable[[str], Callable[[str], bool]]] = {
+    "contains": lambda text: lambda string: text in string,
+    "equals": lambda text: lambda string: string == text,
+    "startswith": lambda text: lambda string: string.startswith(text),
+    "endswith": lambda text: lambda string: string.endswith(text),
+    "isalnum": lambda text: str.isalnum,
+    "isalpha": lambda text: str.isalpha,
+    "isascii": lambda text: str.isascii,
+    "isdecimal": lambda text: str.isdecimal,
+    "isdigit": lambda text: str.isdigit,
+    "isidentifier": lambda text: str.isidentifier,
+    "islower": lambda text: str.islower,
+    "isnumeric": lambda text: str.isnumeric,
+    "isprintable": lambda text: str.isprintable,
+    "isspace": lambda text: str.isspace,
+    "istitle": lambda text: str.istitle,
+    "isupper": lambda text: str.isupper,
+}
+
+
 class StringCapitalize(ComfyNodeABC):
     """Converts the first character of the input string to uppercase and all other characters to lowercase."""
     @classmethod
@@ -350,7 +443,7 @@ class StringFormatMap(ComfyNodeABC):
 
     def format_map(self, template, mapping):
         try:
-            result = template.format_map(mapping)
+            result = compile_template(template).render(mapping)
             return (result,)
         except KeyError as e:
             return (f"Key error: {str(e)} not found in mapping",)
@@ -701,6 +794,48 @@ class StringLength(ComfyNodeABC):
         return (len(string),)
 
 
+class StringDataListFormatMap(ComfyNodeABC):
+    """
+    Formats a template with every DICT of a data list in a single call.
+
+    This node does the same as "format map" for a whole data list of mappings and returns
+    a data list with one string for each mapping. The template is parsed only once
+    and the parsed template is cached, so rendering many mappings is much faster than
+    running "format map" for each of them.
+
+    The missing parameter decides what happens with a placeholder whose key isn't in a
+    mapping: "error" stops with an error, "empty" inserts an empty string, "default"
+    inserts the default string and "keep" keeps the placeholder unchanged.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "mappings": ("DICT", {"forceInput": True}),
+                "template": (IO.STRING, {"default": "Hello, {key}"}),
+            },
+            "optional": {
+                "missing": (list(MISSING_POLICIES), {"default": "error"}),
+                "default": (IO.STRING, {"default": ""}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "format_map"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def format_map(self, **kwargs: list[Any]) -> tuple[list[str]]:
+        template = compile_template(kwargs.get('template', [""])[0])
+        return (template.render_all(
+            kwargs.get('mappings', []),
+            kwargs.get('missing', ["error"])[0],
+            kwargs.get('default', [""])[0],
+        ),)
+
+
 class StringDataListJoin(ComfyNodeABC):
     """
     Joins strings from a data list with a specified separator.
@@ -729,6 +864,218 @@ class StringDataListJoin(ComfyNodeABC):
         return (separator.join(strings),)
 
 
+class StringDataListJoinToFile(ComfyNodeABC):
+    """
+    Joins strings from a data list with a separator and writes the result to a file.
+
+    This node does the same as "join (from data list)", but streams the result to the
+    file at path instead of building it in memory. The strings are joined and written
+    chunk_size strings at a time through a buffered writer, so very large texts can be
+    assembled with bounded memory. Values that are not strings are converted with str().
+    It returns the number of bytes written and the path of the file.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "sep": (IO.STRING, {"default": " "}),
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "chunk_size": (IO.INT, {"default": 1024, "min": 1}),
+                "encoding": (IO.STRING, {"default": "utf-8"}),
+                "create_dirs": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT, IO.STRING)
+    RETURN_NAMES = ("bytes", "path")
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "join_to_file"
+    INPUT_IS_LIST = True
+    OUTPUT_NODE = True
+
+    def join_to_file(self, **kwargs: list[Any]) -> tuple[int, str]:
+        path = kwargs.get('path', [""])[0]
+        size = _join_to_file(
+            kwargs.get('strings', []),
+            kwargs.get('sep', [" "])[0],
+            path,
+            kwargs.get('chunk_size', [1024])[0],
+            kwargs.get('encoding', ["utf-8"])[0],
+            kwargs.get('create_dirs', [True])[0],
+        )
+        return size, path
+
+
+class StringDataListMap(ComfyNodeABC):
+    """
+    Applies a string operation to every string of a data list in a single call.
+
+    This node does the same as the individual STRING nodes, but processes the whole
+    data list at once and returns a data list with the results. This avoids that
+    ComfyUI has to run a node for each string, which is much faster for long lists.
+
+    Depending on the operation these parameters are used:
+    - text: the characters for strip/lstrip/rstrip (empty for whitespace), the prefix or
+      suffix to remove or to add, the substring to replace or the fill character
+    - new_text: the replacement for replace
+    - count: the maximum number of replacements for replace (-1 for all)
+    - width: the width for center, ljust, rjust and zfill
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "operation": (list(_STRING_MAP_OPERATIONS.keys()), {"default": "lower"}),
+            },
+            "optional": {
+                "text": (IO.STRING, {"default": ""}),
+                "new_text": (IO.STRING, {"default": ""}),
+                "count": (IO.INT, {"default": -1, "min": -1}),
+                "width": (IO.INT, {"default": 0, "min": 0}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "map"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def map(self, **kwargs: list[Any]) -> tuple[list[str]]:
+        operation = kwargs.get('operation', ["lower"])[0]
+        function = _STRING_MAP_OPERATIONS[operation](
+            kwargs.get('text', [""])[0],
+            kwargs.get('new_text', [""])[0],
+            kwargs.get('count', [-1])[0],
+            kwargs.get('width', [0])[0],
+        )
+        return (list(map(function, kwargs.get('strings', []))),)
+
+
+class StringDataListReplaceMany(ComfyNodeABC):
+    """
+    Replaces many substrings in every string of a data list in a single pass per string.
+
+    This node does the same as "replace many" for a whole data list. The replacements
+    are compiled once and applied to all strings in a single call.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "replacements": ("DICT", {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "replace"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def replace(self, **kwargs: list[Any]) -> tuple[list[str]]:
+        replacer = build_replacer(kwargs.get('replacements', [{}])[0])
+        return (list(map(replacer, kwargs.get('strings', []))),)
+
+
+class StringDataListSplit(ComfyNodeABC):
+    """
+    Splits every string of a data list and returns all parts as one flattened data list.
+
+    This node replaces running a split node for each string followed by flattening
+    the results. Next to the parts it returns a data list with the index of the source
+    string of each part and a data list with the number of parts of each source string,
+    so the parts can be matched to and regrouped by their source.
+
+    The mode selects how the strings are split:
+    - split / rsplit: at sep (any whitespace if empty), at most maxsplit times (-1 for no limit)
+    - splitlines: at line boundaries, keeping the line breaks if keepends is set
+    - regex: at each match of the regular expression in sep, at most maxsplit times
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "mode": (list(_SPLIT_MODES.keys()), {"default": "split"}),
+            },
+            "optional": {
+                "sep": (IO.STRING, {"default": ""}),
+                "maxsplit": (IO.INT, {"default": -1, "min": -1}),
+                "keepends": (IO.BOOLEAN, {"default": False}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING, IO.INT, IO.INT)
+    RETURN_NAMES = ("parts", "source_index", "counts")
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "split"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True, True, True)
+
+    def split(self, **kwargs: list[Any]) -> tuple[list[str], list[int], list[int]]:
+        mode = kwargs.get('mode', ["split"])[0]
+        split = _SPLIT_MODES[mode](
+            kwargs.get('sep', [""])[0],
+            kwargs.get('maxsplit', [-1])[0],
+            kwargs.get('keepends', [False])[0],
+        )
+        parts: list[str] = []
+        source_index: list[int] = []
+        counts: list[int] = []
+        for index, string in enumerate(kwargs.get('strings', [])):
+            string_parts = split(string)
+            parts.extend(string_parts)
+            source_index.extend(repeat(index, len(string_parts)))
+            counts.append(len(string_parts))
+        return parts, source_index, counts
+
+
+class StringDataListTest(ComfyNodeABC):
+    """
+    Tests every string of a data list in a single call.
+
+    This node does the same as the individual STRING check nodes, but processes the whole
+    data list at once and returns a data list of BOOLEANs that can be used directly
+    by "filter" or "filter select".
+
+    The text parameter is the prefix, suffix or substring for startswith, endswith,
+    contains and equals. It isn't used by the other tests.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": (IO.STRING, {"forceInput": True}),
+                "operation": (list(_STRING_TEST_OPERATIONS.keys()), {"default": "contains"}),
+            },
+            "optional": {
+                "text": (IO.STRING, {"default": ""}),
+            }
+        }
+
+    RETURN_TYPES = (IO.BOOLEAN,)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "test"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def test(self, **kwargs: list[Any]) -> tuple[list[bool]]:
+        operation = kwargs.get('operation', ["contains"])[0]
+        function = _STRING_TEST_OPERATIONS[operation](kwargs.get('text', [""])[0])
+        return (list(map(function, kwargs.get('strings', []))),)
+
+
 class StringListJoin(ComfyNodeABC):
     """
     Joins strings from a LIST with a specified separator.
@@ -756,6 +1103,43 @@ class StringListJoin(ComfyNodeABC):
         return (separator.join(strings),)
 
 
+class StringListJoinToFile(ComfyNodeABC):
+    """
+    Joins strings from a LIST with a separator and writes the result to a file.
+
+    This node does the same as "join (from LIST)", but streams the result to the
+    file at path instead of building it in memory. The strings are joined and written
+    chunk_size strings at a time through a buffered writer, so very large texts can be
+    assembled with bounded memory. Values that are not strings are converted with str().
+    It returns the number of bytes written and the path of the file.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "strings": ("LIST", {"forceInput": True}),
+                "sep": (IO.STRING, {"default": " "}),
+                "path": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "chunk_size": (IO.INT, {"default": 1024, "min": 1}),
+                "encoding": (IO.STRING, {"default": "utf-8"}),
+                "create_dirs": (IO.BOOLEAN, {"default": True}),
+            }
+        }
+
+    RETURN_TYPES = (IO.INT, IO.STRING)
+    RETURN_NAMES = ("bytes", "path")
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "join_to_file"
+    OUTPUT_NODE = True
+
+    def join_to_file(self, strings: list[Any], sep: str, path: str, chunk_size: int = 1024, encoding: str = "utf-8",
+                     create_dirs: bool = True) -> tuple[int, str]:
+        return _join_to_file(strings, sep, path, chunk_size, encoding, create_dirs), path
+
+
 class StringLjust(ComfyNodeABC):
     """
     Left-aligns the string within a field of a given width.
@@ -988,6 +1372,33 @@ class StringReplace(ComfyNodeABC):
         return (string.replace(old, new, count),)
 
 
+class StringReplaceMany(ComfyNodeABC):
+    """
+    Replaces many substrings at once, using a DICT that maps old to new substrings.
+
+    All replacements are done in a single pass over the string, instead of chaining
+    one "replace" node per substring. At each position the longest matching key is
+    replaced and replaced text isn't scanned again, so e.g. {"a": "b", "b": "a"}
+    swaps the two characters. The compiled replacements are cached for the DICT.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "string": (IO.STRING, {"default": ""}),
+                "replacements": ("DICT", {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "replace"
+
+    def replace(self, string: str, replacements: dict[str, Any]) -> tuple[str]:
+        return (build_replacer(replacements)(string),)
+
+
 class StringRfind(ComfyNodeABC):
     """
     Finds the highest index of the substring in the string.
@@ -1370,6 +1781,33 @@ class StringSwapcase(ComfyNodeABC):
         return (string.swapcase(),)
 
 
+class StringTemplateFields(ComfyNodeABC):
+    """
+    Returns the names of the fields that a template needs, without rendering it.
+
+    This node parses a template with the same placeholder syntax as "format map" and
+    returns a LIST with the keys that a mapping must provide, in the order of their
+    first use. For "{user.name} has {count:{width}}" the fields are
+    ["user", "count", "width"].
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "template": (IO.STRING, {"default": "Hello, {key}"}),
+            }
+        }
+
+    RETURN_TYPES = ("LIST",)
+    RETURN_NAMES = ("fields",)
+    CATEGORY = "Basic/STRING"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "fields"
+
+    def fields(self, template: str) -> tuple[list[str]]:
+        return (list(compile_template(template).fields),)
+
+
 class StringTitle(ComfyNodeABC):
     """
     Converts the string to titlecase.
@@ -1470,14 +1908,22 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: StringIsTitle": StringIsTitle,
     "Basic data handling: StringIsUpper": StringIsUpper,
     "Basic data handling: StringLength": StringLength,
+    "Basic data handling: StringDataListFormatMap": StringDataListFormatMap,
     "Basic data handling: StringDataListJoin": StringDataListJoin,
+    "Basic data handling: StringDataListJoinToFile": StringDataListJoinToFile,
+    "Basic data handling: StringDataListMap": StringDataListMap,
+    "Basic data handling: StringDataListReplaceMany": StringDataListReplaceMany,
+    "Basic data handling: StringDataListSplit": StringDataListSplit,
+    "Basic data handling: StringDataListTest": StringDataListTest,
     "Basic data handling: StringListJoin": StringListJoin,
+    "Basic data handling: StringListJoinToFile": StringListJoinToFile,
     "Basic data handling: StringLjust": StringLjust,
     "Basic data handling: StringLower": StringLower,
     "Basic data handling: StringLstrip": StringLstrip,
     "Basic data handling: StringRemoveprefix": StringRemoveprefix,
     "Basic data handling: StringRemovesuffix": StringRemovesuffix,
     "Basic data handling: StringReplace": StringReplace,
+    "Basic data handling: StringReplaceMany": StringReplaceMany,
     "Basic data handling: StringRfind": StringRfind,
     "Basic data handling: StringRjust": StringRjust,
     "Basic data handling: StringRsplitDataList": StringRsplitDataList,
@@ -1490,6 +1936,7 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: StringStartswith": StringStartswith,
     "Basic data handling: StringStrip": StringStrip,
     "Basic data handling: StringSwapcase": StringSwapcase,
+    "Basic data handling: StringTemplateFields": StringTemplateFields,
     "Basic data handling: StringTitle": StringTitle,
     "Basic data handling: StringUnescape": StringUnescape,
     "Basic data handling: StringUpper": StringUpper,
@@ -1523,14 +1970,22 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: StringIsTitle": "istitle",
     "Basic data handling: StringIsUpper": "isupper",
     "Basic data handling: StringLength": "length",
+    "Basic data handling: StringDataListFormatMap": "format map each (data list)",
     "Basic data handling: StringDataListJoin": "join (from data list)",
+    "Basic data handling: StringDataListJoinToFile": "join to file (from data list)",
+    "Basic data handling: StringDataListMap": "apply to each (data list)",
+    "Basic data handling: StringDataListReplaceMany": "replace many in each (data list)",
+    "Basic data handling: StringDataListSplit": "split each (data list)",
+    "Basic data handling: StringDataListTest": "test each (data list)",
     "Basic data handling: StringListJoin": "join (from LIST)",
+    "Basic data handling: StringListJoinToFile": "join to file (from LIST)",
     "Basic data handling: StringLjust": "ljust",
     "Basic data handling: StringLower": "lower",
     "Basic data handling: StringLstrip": "lstrip",
     "Basic data handling: StringRemoveprefix": "removeprefix",
     "Basic data handling: StringRemovesuffix": "removesuffix",
     "Basic data handling: StringReplace": "replace",
+    "Basic data handling: StringReplaceMany": "replace many",
     "Basic data handling: StringRfind": "rfind",
     "Basic data handling: StringRjust": "rjust",
     "Basic data handling: StringRsplitDataList": "rsplit (from data list)",
@@ -1543,6 +1998,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: StringStartswith": "startswith",
     "Basic data handling: StringStrip": "strip",
     "Basic data handling: StringSwapcase": "swapcase",
+    "Basic data handling: StringTemplateFields": "template fields",
     "Basic data handling: StringTitle": "title",
     "Basic data handling: StringUnescape": "unescape",
     "Basic data handling: StringUpper": "upper",
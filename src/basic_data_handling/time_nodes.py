@@ -1,6 +1,11 @@
 from inspect import cleandoc
 import datetime
+from functools import lru_cache
 import time
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from ._time_parse import ISO_FORMAT, build_parser
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -20,6 +25,24 @@ IO.DATETIME = "DATETIME"
 IO.TIMEDELTA = "TIMEDELTA"
 
 
+@lru_cache(maxsize=None)
+def get_timezone(name: str) -> datetime.tzinfo:
+    """
+    Returns the timezone for an IANA name like "Europe/Berlin" or "UTC".
+
+    The zones are cached for the whole process, so the tzdata files are only read once per zone.
+    """
+    name = name.strip()
+    if name.upper() == "UTC":
+        return datetime.timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        # Systems without a timezone database, like Windows, need the `tzdata` package
+        raise ValueError(f"Unknown timezone {name!r}, expected an IANA name like 'Europe/Berlin' or 'UTC' "
+                         f"(without a system timezone database the 'tzdata' package must be installed)") from None
+
+
 class TimeNow(ComfyNodeABC):
     """
     Returns the current time and date as a DATETIME object.
@@ -134,6 +157,93 @@ class UnixToTime(ComfyNodeABC):
         return (datetime.datetime.fromtimestamp(unix_timestamp),)
 
 
+class TimeConvertTimezone(ComfyNodeABC):
+    """
+    Converts a DATETIME object to another timezone, keeping the moment in time.
+    The timezone is an IANA name like "Europe/Berlin", "America/New_York" or "UTC".
+    A DATETIME without timezone is taken as local system time.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "datetime": (IO.DATETIME, {}),
+                "timezone": (IO.STRING, {"default": "UTC"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.DATETIME,)
+    RETURN_NAMES = ("datetime",)
+    CATEGORY = "Basic/time"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+
+    def convert(self, datetime: datetime.datetime, timezone: str) -> tuple[datetime.datetime]:
+        """
+        Converts the datetime object to the given timezone.
+        """
+        return (datetime.astimezone(get_timezone(timezone)),)
+
+
+class TimeDataListConvertTimezone(ComfyNodeABC):
+    """
+    Converts every DATETIME object of a data list to another timezone, keeping the moments in time.
+    The timezone is an IANA name like "Europe/Berlin", "America/New_York" or "UTC".
+    DATETIMEs without timezone are taken as local system time.
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "datetimes": (IO.DATETIME, {"forceInput": True}),
+                "timezone": (IO.STRING, {"default": "UTC"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.DATETIME,)
+    RETURN_NAMES = ("datetimes",)
+    CATEGORY = "Basic/time"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "convert"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def convert(self, **kwargs: list[Any]) -> tuple[list[datetime.datetime]]:
+        """
+        Converts a data list of datetime objects to the given timezone.
+        """
+        zone = get_timezone(kwargs.get('timezone', ["UTC"])[0])
+        return ([value.astimezone(zone) for value in kwargs.get('datetimes', [])],)
+
+
+class TimeLocalize(ComfyNodeABC):
+    """
+    Sets the timezone of a DATETIME object without changing its date and time.
+    This is used to tell in which timezone a DATETIME without timezone, e.g. a parsed
+    time string, was recorded. The timezone is an IANA name like "Europe/Berlin" or "UTC".
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "datetime": (IO.DATETIME, {}),
+                "timezone": (IO.STRING, {"default": "UTC"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.DATETIME,)
+    RETURN_NAMES = ("datetime",)
+    CATEGORY = "Basic/time"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "localize"
+
+    def localize(self, datetime: datetime.datetime, timezone: str) -> tuple[datetime.datetime]:
+        """
+        Replaces the timezone of the datetime object.
+        """
+        return (datetime.replace(tzinfo=get_timezone(timezone)),)
+
+
 class TimeFormat(ComfyNodeABC):
     """
     Formats a DATETIME object into a string using a specified format code.
@@ -184,7 +294,74 @@ class TimeParse(ComfyNodeABC):
         """
         Parses a string into a datetime object.
         """
-        return (datetime.datetime.strptime(time_string, format_string),)
+        return (build_parser(format_string)(time_string),)
+
+
+class TimeDataListParse(ComfyNodeABC):
+    """
+    Parses every string of a data list into a DATETIME object, using one format code for all.
+
+    The format is analysed once. Formats that only use zero padded numbers, like
+    "%Y-%m-%d %H:%M:%S", are parsed by a fast specialized parser and the format
+    "ISO-8601" parses ISO 8601 strings like "2024-01-31T12:30:00+01:00".
+    All other formats use the same parsing as "Parse Time String".
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "time_strings": (IO.STRING, {"forceInput": True}),
+                "format_string": (IO.STRING, {"default": "%Y-%m-%d %H:%M:%S"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.DATETIME,)
+    RETURN_NAMES = ("datetimes",)
+    CATEGORY = "Basic/time"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "parse_times"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def parse_times(self, **kwargs: list[Any]) -> tuple[list[datetime.datetime]]:
+        """
+        Parses a data list of strings into datetime objects.
+        """
+        parse = build_parser(kwargs.get('format_string', ["%Y-%m-%d %H:%M:%S"])[0])
+        return (list(map(parse, kwargs.get('time_strings', []))),)
+
+
+class TimeDataListFormat(ComfyNodeABC):
+    """
+    Formats every DATETIME object of a data list into a string, using one format code for all.
+    The format "ISO-8601" creates ISO 8601 strings like "2024-01-31T12:30:00".
+    """
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "datetimes": (IO.DATETIME, {"forceInput": True}),
+                "format_string": (IO.STRING, {"default": "%Y-%m-%d %H:%M:%S"}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING,)
+    RETURN_NAMES = ("formatted_strings",)
+    CATEGORY = "Basic/time"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "format_times"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def format_times(self, **kwargs: list[Any]) -> tuple[list[str]]:
+        """
+        Formats a data list of datetime objects into strings.
+        """
+        format_string = kwargs.get('format_string', ["%Y-%m-%d %H:%M:%S"])[0]
+        datetimes = kwargs.get('datetimes', [])
+        if format_string == ISO_FORMAT:
+            return ([value.isoformat() for value in datetimes],)
+        return ([value.strftime(format_string) for value in datetimes],)
 
 
 class TimeDelta(ComfyNodeABC):
@@ -322,8 +499,13 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: TimeNowUTC": TimeNowUTC,
     "Basic data handling: TimeToUnix": TimeToUnix,
     "Basic data handling: UnixToTime": UnixToTime,
+    "Basic data handling: TimeConvertTimezone": TimeConvertTimezone,
+    "Basic data handling: TimeDataListConvertTimezone": TimeDataListConvertTimezone,
+    "Basic data handling: TimeLocalize": TimeLocalize,
     "Basic data handling: TimeFormat": TimeFormat,
     "Basic data handling: TimeParse": TimeParse,
+    "Basic data handling: TimeDataListParse": TimeDataListParse,
+    "Basic data handling: TimeDataListFormat": TimeDataListFormat,
     "Basic data handling: TimeDelta": TimeDelta,
     "Basic data handling: TimeAddDelta": TimeAddDelta,
     "Basic data handling: TimeSubtractDelta": TimeSubtractDelta,
@@ -336,8 +518,13 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: TimeNowUTC": "Time Now (UTC)",
     "Basic data handling: TimeToUnix": "Time to Unix Timestamp",
     "Basic data handling: UnixToTime": "Unix Timestamp to Time",
+    "Basic data handling: TimeConvertTimezone": "Convert Timezone",
+    "Basic data handling: TimeDataListConvertTimezone": "Convert Timezone (data list)",
+    "Basic data handling: TimeLocalize": "Set Timezone",
     "Basic data handling: TimeFormat": "Format Time String",
     "Basic data handling: TimeParse": "Parse Time String",
+    "Basic data handling: TimeDataListParse": "Parse Time Strings (data list)",
+    "Basic data handling: TimeDataListFormat": "Format Time Strings (data list)",
     "Basic data handling: TimeDelta": "Create Time Delta",
     "Basic data handling: TimeAddDelta": "Add Time Delta",
     "Basic data handling: TimeSubtractDelta": "Subtract Time Delta",
@@ -0,0 +1,84 @@
+import pickle
+import pytest
+from typing import Any
+from src.basic_data_handling.bitset_nodes import (
+    BitSetContains,
+    BitSetCreate,
+    BitSetCreateFromRange,
+    BitSetDifference,
+    BitSetFromDataList,
+    BitSetFromSet,
+    BitSetIntersection,
+    BitSetLength,
+    BitSetSymmetricDifference,
+    BitSetToDataList,
+    BitSetToSet,
+    BitSetUnion,
+)
+from src.basic_data_handling.data_list_nodes import DataListRange
+
+
+def test_bitset_create():
+    # The last dynamic input is the empty one for adding more items
+    assert BitSetCreate().create_bitset(item_0=5, item_1=1, item_2="3", item_3="")[0] == {1, 3, 5}
+    assert BitSetCreate().create_bitset()[0] == set()
+    with pytest.raises(ValueError):
+        BitSetCreate().create_bitset(item_0=-1, item_1="")
+    # The memory depends on the largest value, so it is limited
+    assert BitSetLength().length(BitSetCreate().create_bitset(item_0=2**26 - 1, item_1="")[0]) == (1,)
+    with pytest.raises(ValueError):
+        BitSetCreate().create_bitset(item_0=2**32 - 1, item_1="")
+
+
+def test_bitset_create_from_range():
+    node = BitSetCreateFromRange()
+    assert node.create_range(start=2, stop=6)[0] == {2, 3, 4, 5}
+    assert node.create_range(start=0, stop=10, step=3)[0] == {0, 3, 6, 9}
+    assert node.create_range(start=9, stop=0, step=-4)[0] == {9, 5, 1}
+    assert node.create_range(start=5, stop=5)[0] == set()
+    assert BitSetLength().length(node.create_range(start=0, stop=10**7)[0]) == (10**7,)
+    with pytest.raises(ValueError):
+        node.create_range(start=0, stop=10, step=0)
+    # A descending range that crosses 0 and ranges beyond the largest value are rejected
+    with pytest.raises(ValueError):
+        node.create_range(start=5, stop=-5, step=-1)
+    with pytest.raises(ValueError):
+        node.create_range(start=5, stop=-10**12, step=-3)
+    with pytest.raises(ValueError):
+        node.create_range(start=0, stop=2**40)
+
+
+def test_bitset_conversion():
+    data_list = list(DataListRange().create_range(start=3, stop=8)[0])  # ComfyUI merges it into a plain list
+    bitset = BitSetFromDataList().convert(list=data_list)[0]
+    assert bitset == {3, 4, 5, 6, 7}
+    assert BitSetFromDataList().convert(list=[7, 2, 7, 0])[0] == {0, 2, 7}
+    assert BitSetToDataList().convert(bitset) == ([3, 4, 5, 6, 7],)
+    assert BitSetToSet().convert(bitset) == ({3, 4, 5, 6, 7},)
+    assert BitSetFromSet().convert({100, 8, 0})[0] == {0, 8, 100}
+    invalid: Any
+    for invalid in [{-1}, {1.5}, {"a"}, {2**40}]:
+        with pytest.raises(ValueError):
+            BitSetFromSet().convert(invalid)
+    assert pickle.loads(pickle.dumps(bitset)) == bitset
+
+
+def test_bitset_operations():
+    a = BitSetFromSet().convert({1, 2, 3, 64, 1000})[0]
+    b = BitSetFromSet().convert({2, 3, 4, 1000})[0]
+    c = BitSetFromSet().convert({3, 1000, 5000})[0]
+    assert BitSetUnion().union(a, b)[0] == {1, 2, 3, 4, 64, 1000}
+    assert BitSetUnion().union(a, b, c)[0] == {1, 2, 3, 4, 64, 1000, 5000}
+    assert BitSetIntersection().intersection(a, b)[0] == {2, 3, 1000}
+    assert BitSetIntersection().intersection(a, b, None, c)[0] == {3, 1000}
+    assert BitSetDifference().difference(a, b)[0] == {1, 64}
+    assert BitSetSymmetricDifference().symmetric_difference(a, b)[0] == {1, 4, 64}
+    assert BitSetContains().contains(a, 64) == (True,)
+    assert BitSetContains().contains(a, 65) == (False,)
+    assert BitSetContains().contains(a, -1) == (False,)
+    assert BitSetLength().length(a) == (5,)
+    # The same results as with SETs
+    large1, large2 = set(range(0, 200_000, 3)), set(range(0, 200_000, 5))
+    bitset1, bitset2 = BitSetFromSet().convert(large1)[0], BitSetFromSet().convert(large2)[0]
+    assert BitSetToSet().convert(BitSetUnion().union(bitset1, bitset2)[0]) == (large1 | large2,)
+    assert BitSetToDataList().convert(BitSetDifference().difference(bitset1, bitset2)[0]) == (sorted(large1 - large2),)
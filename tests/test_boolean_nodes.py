@@ -90,3 +90,36 @@ def test_generic_and():
     # A couple of 3xAND cases
     assert node.and_operation(False, item_0=True, item_1=True, item_2=True) == (True,)
     assert node.and_operation(False, item_0=True, item_1=False, item_2=True) == (False,)
+
+
+def test_generic_or_lazy_status():
+    node = GenericOr()
+    # Inputs are requested one at a time, in order of their number
+    assert node.check_lazy_status(False, item_1=None, item_0=None, item_2=None) == ["item_0"]
+    assert node.check_lazy_status(False, item_0=False, item_1=None, item_2=None) == ["item_1"]
+    # The first true value decides, the remaining inputs are never requested
+    assert node.check_lazy_status(False, item_0=False, item_1=True, item_2=None) == []
+    assert node.check_lazy_status(True, item_0=False, item_1=False) == []
+    assert node.or_operation(False, item_0=False, item_1=True, item_2=None) == (True,)
+    # An input that was evaluated to None is false, the next input is requested instead of it again
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == ["item_0"]
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == ["item_1"]
+    assert node.check_lazy_status(False, item_0=None, item_1=True) == []
+    assert node.or_operation(False, item_0=None, item_1=True) == (True,)
+    # The next execution requests the inputs again
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == ["item_0"]
+
+
+def test_generic_and_lazy_status():
+    node = GenericAnd()
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == ["item_0"]
+    assert node.check_lazy_status(False, item_0=True, item_1=None, item_10=None, item_2=None) == ["item_1"]
+    assert node.check_lazy_status(False, item_0=True, item_1=True, item_10=None, item_2=None) == ["item_2"]
+    # The first false value decides, the remaining inputs are never requested
+    assert node.check_lazy_status(False, item_0=True, item_1=0, item_2=None) == []
+    assert node.and_operation(False, item_0=True, item_1=0, item_2=None) == (False,)
+    # An input that was evaluated to None is false and decides the result
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == ["item_0"]
+    assert node.check_lazy_status(False, item_0=None, item_1=None) == []
+    assert node.and_operation(False, item_0=None, item_1=None) == (False,)
+
@@ -1,6 +1,8 @@
 import pytest
+from typing import Any
 from src.basic_data_handling.casting_nodes import (CastToString, CastToInt, CastToFloat, CastToBoolean,
-                           CastToList, CastToSet, CastToDict)
+                           CastToList, CastToSet, CastToDict, CastDataListItems, CastListItems)
+from src.basic_data_handling.list_nodes import ListRange
 
 
 def test_cast_to_string():
@@ -11,6 +13,14 @@ def test_cast_to_string():
     assert node.convert_to_string("hello") == ("hello",)
 
 
+def test_cast_range_to_string():
+    # A lazy range is converted to the same STRING as the list it replaces
+    lazy_range = ListRange().create_range(start=0, stop=3)[0]
+    assert CastToString().convert_to_string(lazy_range) == ("[0, 1, 2]",)
+    assert f"{lazy_range}" == "[0, 1, 2]"
+    assert CastToString().convert_to_string(lazy_range[:0]) == ("[]",)
+
+
 def test_cast_to_int():
     node = CastToInt()
     assert node.convert_to_int("123") == (123,)
@@ -46,6 +56,10 @@ def test_cast_to_list():
     assert node.convert_to_list([1, 2, 3]) == ([1, 2, 3],)
     assert node.convert_to_list("hello") == (["hello"],)
     assert node.convert_to_list(None) == ([None],)
+    # A lazy range stays lazy
+    lazy_range: Any = ListRange().create_range(start=0, stop=10**9)[0]
+    assert CastToList().convert_to_list(lazy_range)[0] is lazy_range
+    assert CastToSet().convert_to_set(lazy_range[:3]) == ({0, 1, 2},)
 
 
 def test_cast_to_set():
@@ -64,3 +78,29 @@ def test_cast_to_dict():
         node.convert_to_dict(123)
     with pytest.raises(ValueError):
         node.convert_to_dict("string")
+
+
+def test_cast_data_list_items():
+    node = CastDataListItems()
+    assert node.convert_items(values=["1", "2", 3.7], type=["INT"], on_error=["raise"]) == ([1, 2, 3], [])
+    assert node.convert_items(values=[1, "2.5"], type=["FLOAT"], on_error=["raise"]) == ([1.0, 2.5], [])
+    assert node.convert_items(values=[0, "", "x"], type=["BOOLEAN"], on_error=["raise"]) == ([False, False, True], [])
+    assert node.convert_items(values=[1, None], type=["STRING"], on_error=["raise"]) == (["1", "None"], [])
+    with pytest.raises(ValueError, match="index 1"):
+        node.convert_items(values=["1", "abc"], type=["INT"], on_error=["raise"])
+    # Items that fail are replaced or dropped and their indices are returned
+    values = ["1", "abc", None, "4", float("inf")]
+    assert node.convert_items(values=values, type=["INT"], on_error=["default"]) == ([1, 0, 0, 4, 0], [1, 2, 4])
+    assert node.convert_items(values=values, type=["INT"], on_error=["default"], default=[-1]) == ([1, -1, -1, 4, -1], [1, 2, 4])
+    assert node.convert_items(values=values, type=["INT"], on_error=["drop"]) == ([1, 4], [1, 2, 4])
+    assert node.convert_items(values=[], type=["INT"], on_error=["raise"]) == ([], [])
+
+
+def test_cast_list_items():
+    node = CastListItems()
+    assert node.convert_items(["1", "x", "2.5"], "FLOAT", "drop") == ([1.0, 2.5], [1])
+    lazy_range: Any = ListRange().create_range(start=0, stop=3)[0]
+    assert node.convert_items(lazy_range, "STRING") == (["0", "1", "2"], [])
+    with pytest.raises(ValueError):
+        node.convert_items([1], "COMPLEX")
+
@@ -10,6 +10,9 @@ from src.basic_data_handling.comparison_nodes import (
     NumberInRange,
     IsNull,
     CompareLength,
+    DataListCompare,
+    DataListNumberInRange,
+    DataListStringComparison,
 )
 
 
@@ -185,3 +188,52 @@ def test_compare_length():
     # Error case with invalid operator
     with pytest.raises(ValueError):
         node.compare_length([1, 2, 3], "invalid", 3)
+
+
+def test_data_list_compare():
+    node = DataListCompare()
+    assert node.compare(values=[1, 5, 10], operator=[">"], value2=[5]) == ([False, False, True],)
+    assert node.compare(values=[1, 5, 10], operator=["<="], value2=[5]) == ([True, True, False],)
+    assert node.compare(values=[1, 5, 10], operator=["=="], value2=[1, 4, 10]) == ([True, False, True],)  # pairwise
+    assert node.compare(values=["a", None], operator=["=="], value2=["a"]) == ([True, False],)
+    assert node.compare(values=[], operator=[">"], value2=[0]) == ([],)
+    with pytest.raises(ValueError):
+        node.compare(values=[1, 2, 3], operator=[">"], value2=[1, 2])
+
+
+def test_data_list_compare_numpy():
+    node = DataListCompare()
+    values = [i * 0.5 for i in range(1000)]
+    expected = [value >= 100 for value in values]
+    result = node.compare(values=values, operator=[">="], value2=[100])[0]
+    assert result == expected
+    assert all(type(value) is bool for value in result)
+    assert node.compare(values=values, operator=["!="], value2=values)[0] == [False] * 1000
+    # Mixed types use the Python comparison
+    assert node.compare(values=values + ["x"], operator=["=="], value2=["x"])[0] == [False] * 1000 + [True]
+    # INTs beyond 2**53 would lose precision as float64, they are also compared by Python
+    assert node.compare(values=[2**53 + 1] * 40, operator=[">"], value2=[float(2**53)])[0] == [True] * 40
+    assert node.compare(values=[float(2**53)] * 40, operator=["<"], value2=[2**53 + 1])[0] == [True] * 40
+    assert node.compare(values=[0.5] * 40 + [2**53 + 1], operator=[">"], value2=[float(2**53)])[0] == [False] * 40 + [True]
+
+
+def test_data_list_number_in_range():
+    node = DataListNumberInRange()
+    values = [0, 5, 10, 15]
+    assert node.check_range(values=values, min_value=[0], max_value=[10]) == ([True, True, True, False],)
+    assert node.check_range(values=values, min_value=[0], max_value=[10], include_min=[False], include_max=[False]) == (
+        [False, True, False, False],)
+    values = list(range(100))
+    assert node.check_range(values=values, min_value=[10], max_value=[20], include_max=[False])[0] == [
+        10 <= value < 20 for value in values]
+
+
+def test_data_list_string_comparison():
+    node = DataListStringComparison()
+    strings = ["apple", "Banana", "cherry"]
+    assert node.compare(strings=strings, string2=["banana"], operator=["=="]) == ([False, False, False],)
+    assert node.compare(strings=strings, string2=["banana"], operator=["=="], case_sensitive=[False]) == (
+        [False, True, False],)
+    assert node.compare(strings=strings, string2=["b"], operator=[">"]) == ([False, False, True],)
+    assert node.compare(strings=strings, string2=["apple", "x", "cherry"], operator=["=="]) == ([True, False, True],)
+
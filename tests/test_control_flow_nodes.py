@@ -1,6 +1,12 @@
-#import pytest
+import gc
+import os
+import stat
+import torch
+from typing import Any
+from src.basic_data_handling._content_hash import PROMPT_HASHES
+from src.basic_data_handling._memo_cache import private_spill_directory
 from src.basic_data_handling.control_flow_nodes import (
-    IfElse, SwitchCase, IfElifElse, ContinueFlow, FlowSelect, ForceCalculation, ExecutionOrder, IsConnected
+    Cache, IfElse, SwitchCase, SwitchKey, IfElifElse, ContinueFlow, FlowSelect, ForceCalculation, ExecutionOrder, IsConnected
 )
 
 
@@ -71,6 +77,129 @@ def test_switch_case_lazy_status():
     assert node.check_lazy_status(select=0, case_a="val") == []
 
 
+def test_switch_key():
+    node = SwitchKey()
+    cases = {"case_key_0": "cat", "case_value_0": "meow", "case_key_1": "dog", "case_value_1": "woof",
+             "case_key_2": "3", "case_value_2": "three"}
+    assert node.execute(key="dog", **cases) == ("woof",)
+    assert node.execute(key="cat", **cases) == ("meow",)
+    assert node.execute(key=3, **cases) == ("three",)  # INT keys match the text of the case key
+    assert node.execute(key="cow", **cases) == (None,)
+    assert node.execute(key="cow", default="silence", **cases) == ("silence",)
+    # The first case wins for duplicate keys and changed case keys are used right away
+    assert node.execute(key="cat", case_key_1="cat", case_value_1="purr", case_key_0="cat", case_value_0="meow") == ("meow",)
+    assert node.execute(key="cat", case_key_0="lion", case_value_0="roar", case_key_1="cat", case_value_1="purr") == ("purr",)
+
+def test_switch_key_lazy_status():
+    node = SwitchKey()
+    cases: dict[str, Any] = {f"case_key_{i}": f"key{i}" for i in range(200)}
+    cases.update({f"case_value_{i}": None for i in range(200)})
+    # Only the selected case is requested
+    assert node.check_lazy_status(key="key150", **cases) == ["case_value_150"]
+    assert node.check_lazy_status(key="key150", **{**cases, "case_value_150": "value"}) == []
+    # The case keys are indexed once and the index is reused by execute
+    index = node._index
+    assert node.execute(key="key150", **{**cases, "case_value_150": "value"}) == ("value",)
+    assert node._index is index
+    # Without a match only the default is requested
+    assert node.check_lazy_status(key="other", default=None, **cases) == ["default"]
+    assert node.check_lazy_status(key="other", **cases) == []
+    # A case value that isn't connected falls back to the default
+    assert node.check_lazy_status(key="x", case_key_0="x", default=None) == ["default"]
+
+def test_cache():
+    node = Cache()
+    # A miss needs the value and stores it
+    assert node.check_lazy_status(None, key_0="a", key_1=[1, 2], unique_id="test_cache") == ["value"]
+    assert node.execute("expensive", key_0="a", key_1=[1, 2], unique_id="test_cache") == ("expensive", False)
+    # A hit doesn't need the value
+    assert node.check_lazy_status(None, key_0="a", key_1=[1, 2], unique_id="test_cache") == []
+    assert node.execute(None, key_0="a", key_1=[1, 2], unique_id="test_cache") == ("expensive", True)
+    assert node.check_lazy_status(None, key_0="a", key_1=[1, 3], unique_id="test_cache") == ["value"]
+    # The key only depends on the content, e.g. not on the order of DICT items
+    node.execute("dict", key_0={"x": 1, "y": {2, 3}}, unique_id="test_cache")
+    assert node.execute(None, key_0={"y": {3, 2}, "x": 1}, unique_id="test_cache") == ("dict", True)
+    # Tensors are keyed by their dtype, shape and data
+    node.execute("tensor", key_0=torch.ones(2, 3), unique_id="test_cache")
+    assert node.execute(None, key_0=torch.ones(2, 3), unique_id="test_cache") == ("tensor", True)
+    assert node.check_lazy_status(None, key_0=torch.ones(3, 2), unique_id="test_cache") == ["value"]
+    # Other cache nodes have their own values
+    assert node.check_lazy_status(None, key_0="a", key_1=[1, 2], unique_id="test_cache_other") == ["value"]
+    # The same node id in a workflow with other nodes connected to value has its own cache
+    prompt_a = {"5": {"class_type": "Cache", "inputs": {"value": ["3", 0]}}, "3": {"class_type": "LoadA", "inputs": {"x": 1}}}
+    prompt_b = {"5": {"class_type": "Cache", "inputs": {"value": ["3", 0]}}, "3": {"class_type": "LoadB", "inputs": {"x": 1}}}
+    assert node.execute("a", key_0="k", unique_id="5", prompt=prompt_a) == ("a", False)
+    assert node.check_lazy_status(None, key_0="k", unique_id="5", prompt=prompt_b) == ["value"]
+    assert node.execute("b", key_0="k", unique_id="5", prompt=prompt_b) == ("b", False)
+    assert node.execute(None, key_0="k", unique_id="5", prompt=dict(prompt_a)) == ("a", True)
+    # ... but both workflows share the max_entries of the node
+    assert node.execute("c", key_0="k", unique_id="5", prompt=prompt_a, max_entries=1) == ("a", True)
+    assert node.check_lazy_status(None, key_0="k", unique_id="5", prompt=prompt_b, max_entries=1) == ["value"]
+    # clear empties the cache
+    assert node.check_lazy_status(None, key_0="a", key_1=[1, 2], clear=True, unique_id="test_cache") == ["value"]
+
+
+
+def test_cache_key_hash_memo(monkeypatch):
+    node = Cache()
+    monkeypatch.setattr("src.basic_data_handling._content_hash._prompt_scope", lambda: "prompt 1")
+    PROMPT_HASHES.hash([], "other prompt")  # starts empty
+    key = list(range(10))
+    # check_lazy_status remembers the hash of the key for execute, that releases it again
+    assert node.check_lazy_status(None, key_0=key, unique_id="test_cache_memo") == ["value"]
+    assert len(PROMPT_HASHES) == 1
+    assert node.execute("value", key_0=key, unique_id="test_cache_memo") == ("value", False)
+    assert len(PROMPT_HASHES) == 0
+    # Tensors are only referenced weakly
+    tensor = torch.ones(3)
+    node.check_lazy_status(None, key_0=tensor, unique_id="test_cache_memo")
+    assert len(PROMPT_HASHES) == 1
+    del tensor
+    gc.collect()
+    assert len(PROMPT_HASHES) == 0
+    # The graph connected to the value input is also only hashed once per prompt
+    calls = []
+
+    def upstream_signature(*args: Any) -> str:
+        calls.append(args)
+        return ""
+
+    monkeypatch.setattr("src.basic_data_handling.control_flow_nodes._upstream_signature", upstream_signature)
+    prompt = {"7": {"class_type": "Cache", "inputs": {"value": ["3", 0]}}, "3": {"class_type": "Load", "inputs": {}}}
+    node.check_lazy_status(None, key_0=1, unique_id="7", prompt=prompt)
+    node.execute("value", key_0=1, unique_id="7", prompt=prompt)
+    assert len(calls) == 1
+
+def test_cache_limits(monkeypatch):
+    node = Cache()
+    for i in range(3):
+        node.execute(f"value {i}", key_0=i, max_entries=2, unique_id="test_cache_limits")
+    assert node.check_lazy_status(None, key_0=0, max_entries=2, unique_id="test_cache_limits") == ["value"]  # evicted
+    assert node.execute(None, key_0=2, max_entries=2, unique_id="test_cache_limits") == ("value 2", True)
+
+    now = [1000.0]
+    monkeypatch.setattr("src.basic_data_handling._memo_cache.time.monotonic", lambda: now[0])
+    node.execute("fresh", key_0="t", ttl=10.0, unique_id="test_cache_ttl")
+    now[0] += 5
+    assert node.execute(None, key_0="t", ttl=10.0, unique_id="test_cache_ttl") == ("fresh", True)
+    now[0] += 10
+    assert node.check_lazy_status(None, key_0="t", ttl=10.0, unique_id="test_cache_ttl") == ["value"]  # expired
+
+
+def test_cache_spill():
+    node = Cache()
+    value = {"data": list(range(1000))}
+    assert node.execute(value, key_0="big", spill_mb=0.001, unique_id="test_cache_spill") == (value, False)
+    result = node.execute(None, key_0="big", spill_mb=0.001, unique_id="test_cache_spill")
+    assert result == (value, True)
+    assert result[0] is not value  # loaded again from the pickle file
+    # The spill files are in a private directory of the process
+    directory = private_spill_directory()
+    assert len(os.listdir(directory)) >= 1
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    assert node.check_lazy_status(None, key_0="big", clear=True, unique_id="test_cache_spill") == ["value"]
+
 def test_if_elif_else():
     node = IfElifElse()
     # if is True
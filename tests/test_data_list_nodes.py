@@ -3,6 +3,7 @@ from src.basic_data_handling.data_list_nodes import (
     DataListAll,
     DataListAny,
     DataListAppend,
+    DataListChunk,
     DataListContains,
     DataListCount,
     DataListCreate,
@@ -28,13 +29,16 @@ from src.basic_data_handling.data_list_nodes import (
     DataListRange,
     DataListRemove,
     DataListReverse,
+    DataListSample,
     DataListSetItem,
     DataListShuffle,
     DataListSlice,
     DataListSort,
+    DataListStatistics,
     DataListSum,
     DataListToList,
     DataListToSet,
+    DataListUnchunk,
     DataListZip,
 )
 
@@ -114,6 +118,27 @@ def test_slice():
     assert node.slice(list=["a", "b", "c"], start=[-2], stop=[3]) == (["b", "c"],)
 
 
+def test_chunk():
+    node = DataListChunk()
+    assert node.chunk(list=[1, 2, 3, 4, 5], size=[2]) == ([[1, 2], [3, 4], [5]],)
+    assert node.chunk(list=[1, 2, 3, 4], size=[2]) == ([[1, 2], [3, 4]],)
+    assert node.chunk(list=[1, 2, 3], size=[10]) == ([[1, 2, 3]],)
+    assert node.chunk(list=[], size=[3]) == ([],)
+    with pytest.raises(ValueError):
+        node.chunk(list=[1, 2], size=[0])
+
+
+def test_unchunk():
+    node = DataListUnchunk()
+    assert node.unchunk(chunks=[[1, 2], [3, 4], [5]]) == ([1, 2, 3, 4, 5],)
+    assert node.unchunk(chunks=[[], ["a"]]) == (["a"],)
+    assert node.unchunk(chunks=[]) == ([],)
+
+    # Round trip
+    chunks = DataListChunk().chunk(list=list(range(1000)), size=[256])[0]
+    assert node.unchunk(chunks=chunks) == (list(range(1000)),)
+
+
 def test_get_item():
     node = DataListGetItem()
     assert node.get_item(list=[1, 2, 3], index=[1]) == (2,)
@@ -304,6 +329,49 @@ def test_pop_random():
     assert node.pop_random_element(list=[]) == ([], None)
 
 
+def test_pop_random_seeded():
+    node = DataListPopRandom()
+    original_list = list(range(100))
+    result1 = node.pop_random_element(list=original_list, seed=[42])
+    result2 = node.pop_random_element(list=original_list, seed=[42])
+    assert result1 == result2  # Same seed, same output
+    assert original_list == list(range(100))  # Input is not modified
+    assert DataListPopRandom.IS_CHANGED(list=original_list, seed=[42]) == 42
+
+
+def test_sample():
+    node = DataListSample()
+    original_list = list(range(1000))
+    result = node.sample(list=original_list, count=[10], seed=[7])[0]
+    assert len(result) == 10
+    assert len(set(result)) == 10  # Without replacement
+    assert all(item in original_list for item in result)
+    assert node.sample(list=original_list, count=[10], seed=[7]) == (result,)  # Reproducible
+
+    # Count larger than the list returns a permutation of all items
+    assert sorted(node.sample(list=[1, 2, 3], count=[5], seed=[1])[0]) == [1, 2, 3]
+    assert node.sample(list=[1, 2, 3], count=[0]) == ([],)
+    assert node.sample(list=[], count=[3]) == ([],)
+
+
+def test_statistics():
+    node = DataListStatistics()
+    count, total, minimum, maximum, mean, stddev = node.statistics(list=[2, 4, 4, 4, 5, 5, 7, 9])
+    assert (count, total, minimum, maximum, mean) == (8, 40, 2, 9, 5.0)
+    assert isinstance(total, int)
+    assert stddev == pytest.approx(2.0)
+    assert node.statistics(list=[1, 2, 3, 4], stddev=["sample"])[5] == pytest.approx(1.2909944487)
+    assert node.statistics(list=[1.5, 2.5]) == (2, 4.0, 1.5, 2.5, 2.0, 0.5)
+    assert node.statistics(list=[]) == (0, 0, None, None, None, None)
+
+    # Compensated summation keeps precision
+    assert node.statistics(list=[0.1] * 10)[1] == 1.0
+    assert node.statistics(list=[1e16, 1.0, -1e16])[1] == 1.0
+
+    with pytest.raises(ValueError):
+        node.statistics(list=[1, "a"])
+
+
 def test_first():
     node = DataListFirst()
     assert node.get_first_element(list=[1, 2, 3]) == (1,)
@@ -111,6 +111,13 @@ def test_dict_pop_random():
     assert empty_success is False
 
 
+def test_dict_pop_random_seeded():
+    node = DictPopRandom()
+    my_dict = {f"key{i}": i for i in range(100)}
+    assert node.pop_random(my_dict, seed=5) == node.pop_random(my_dict, seed=5)
+    assert len(my_dict) == 100  # Input is not modified
+    assert DictPopRandom.IS_CHANGED(input_dict=my_dict, seed=5) == 5
+
 
 def test_dict_keys():
     node = DictKeys()
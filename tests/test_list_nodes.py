@@ -1,4 +1,5 @@
 import pytest
+from typing import Any
 from src.basic_data_handling.list_nodes import (
     ListAll,
     ListAny,
@@ -25,10 +26,12 @@ from src.basic_data_handling.list_nodes import (
     ListRange,
     ListRemove,
     ListReverse,
+    ListSample,
     ListSetItem,
     ListShuffle,
     ListSlice,
     ListSort,
+    ListStatistics,
     ListSum,
     ListToDataList,
     ListToSet,
@@ -88,6 +91,24 @@ def test_list_pop_random():
     assert node.pop_random_element([]) == ([], None)
 
 
+def test_list_pop_random_seeded():
+    node = ListPopRandom()
+    original_list = list(range(100))
+    assert node.pop_random_element(original_list, seed=3) == node.pop_random_element(original_list, seed=3)
+    assert original_list == list(range(100))  # Input is not modified
+
+
+def test_list_sample():
+    node = ListSample()
+    original_list = list(range(1000))
+    result = node.sample(original_list, 10, seed=7)[0]
+    assert len(result) == 10
+    assert len(set(result)) == 10  # Without replacement
+    assert node.sample(original_list, 10, seed=7) == (result,)  # Reproducible
+    assert sorted(node.sample(["a", "b"], 3)[0]) == ["a", "b"]
+    assert node.sample([], 3) == ([],)
+
+
 def test_list_first():
     node = ListFirst()
     assert node.get_first_element([1, 2, 3]) == (1,)
@@ -159,6 +180,15 @@ def test_list_set_item():
         node.set_item([1, 2, 3], 3, 42) == ([1, 2, 3],)  # Out of range
 
 
+def test_list_statistics():
+    node = ListStatistics()
+    count, total, minimum, maximum, mean, stddev = node.statistics([2, 4, 4, 4, 5, 5, 7, 9])
+    assert (count, total, minimum, maximum, mean) == (8, 40, 2, 9, 5.0)
+    assert stddev == pytest.approx(2.0)
+    assert node.statistics([3], "sample") == (1, 3, 3, 3, 3.0, 0.0)
+    assert node.statistics([]) == (0, 0, None, None, None, None)
+
+
 def test_shuffle():
     node = ListShuffle()
 
@@ -289,6 +319,24 @@ def test_list_range():
         node.create_range(start=0, stop=5, step=0)
 
 
+def test_list_range_is_lazy():
+    big: Any = ListRange().create_range(start=0, stop=10**12, step=1)[0]  # a RangeList used as a LIST
+    assert ListLength().length(big) == (10**12,)
+    assert ListGetItem().get_item(big, -1) == (10**12 - 1,)
+    assert ListSlice().slice(big, start=5, stop=10) == ([5, 6, 7, 8, 9],)
+    assert ListSlice().slice(big, start=0, stop=10, step=3)[0] == [0, 3, 6, 9]
+    assert ListContains().contains(big, 123456789) == (True,)
+    assert ListIndex().index(big, 42) == (42,)
+    assert ListIndex().index(big, 42, start=50) == (-1,)
+
+    # Modifying nodes return a regular LIST
+    small: Any = ListRange().create_range(start=0, stop=3)[0]
+    assert ListAppend().append(small, 3) == ([0, 1, 2, 3],)
+    assert ListExtend().extend(small, [3]) == ([0, 1, 2, 3],)
+    assert ListReverse().reverse(small) == ([2, 1, 0],)
+    assert ListToSet().convert(small) == ({0, 1, 2},)
+
+
 def test_list_all():
     node = ListAll()
     # All true values
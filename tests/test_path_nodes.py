@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 import platform
@@ -5,13 +6,15 @@ import numpy as np
 import torch
 from PIL import Image
 
+from src.basic_data_handling._range_list import RangeList
 from src.basic_data_handling.path_nodes import (
     PathJoin, PathAbspath, PathExists, PathIsFile, PathIsDir, PathGetSize,
     PathSplit, PathSplitExt, PathBasename, PathDirname, PathGetExtension,
     PathSetExtension, PathNormalize, PathRelative, PathGlob, PathExpandVars, PathGetCwd,
     PathListDir, PathIsAbsolute, PathCommonPrefix, PathLoadStringFile, PathSaveStringFile,
     PathLoadImageRGB, PathSaveImageRGB, PathLoadImageRGBA, PathSaveImageRGBA,
-    PathLoadMaskFromAlpha, PathLoadMaskFromGreyscale,
+    PathLoadMaskFromAlpha, PathLoadMaskFromGreyscale, PathLoadJSON, PathLoadJSONLines, PathSaveJSON, PathSaveJSONLines,
+    PathLoadCSV,
 )
 
 
@@ -58,6 +61,105 @@ def test_path_load_save_string_file(tmp_path):
     assert load_node.load_text(str(tmp_path / "nonexistent.txt")) == ("", False)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_path_load_save_json(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("src.basic_data_handling._json_io.orjson", None)
+    value = {"name": "ñ 你好", "items": [1, 2.5, None, True], "nested": {"a": []}}
+    for indent in [0, 2]:
+        path = str(tmp_path / f"indent{indent}" / "value.json")
+        assert PathSaveJSON().save_json(value, path, indent=indent) == (True,)
+        assert PathLoadJSON().load_json(path) == (value, True)
+    assert "\n" not in (tmp_path / "indent0" / "value.json").read_text(encoding="utf-8")
+    assert "\n  " in (tmp_path / "indent2" / "value.json").read_text(encoding="utf-8")
+
+    # A LIST is written item by item
+    path = str(tmp_path / "list.json")
+    assert PathSaveJSON().save_json([{"a": 1}, [], "x"], path, indent=0) == (True,)
+    assert (tmp_path / "list.json").read_text(encoding="utf-8") == '[{"a":1},[],"x"]'
+    # The lazy RangeList of the range nodes is saved as an array, also nested and indented
+    lazy_range = RangeList(0, 3)
+    for indent in [0, 2]:
+        path = str(tmp_path / f"range{indent}.json")
+        assert PathSaveJSON().save_json({"ids": lazy_range, "all": [lazy_range]}, path, indent=indent) == (True,)
+        assert PathLoadJSON().load_json(path) == ({"ids": [0, 1, 2], "all": [[0, 1, 2]]}, True)
+        assert PathSaveJSON().save_json(lazy_range, path, indent=indent) == (True,)
+        assert PathLoadJSON().load_json(path) == ([0, 1, 2], True)
+    # NaN and infinity are saved as null with every encoding, so the file stays valid JSON
+    for indent in [0, 2]:
+        path = str(tmp_path / f"nan{indent}.json")
+        assert PathSaveJSON().save_json({"a": [float("nan"), 1.5], "b": float("-inf")}, path, indent=indent) == (True,)
+        assert json.loads((tmp_path / f"nan{indent}.json").read_text(encoding="utf-8")) == {"a": [None, 1.5], "b": None}
+    # A failed save keeps the existing file
+    (tmp_path / "keep.json").write_text('"old"', encoding="utf-8")
+    assert PathSaveJSON().save_json([1, {3}], str(tmp_path / "keep.json"), indent=0) == (False,)
+    assert PathSaveJSONLines().save_json_lines(records=[1, {3}], path=[str(tmp_path / "keep.json")]) == (False, 0)
+    assert (tmp_path / "keep.json").read_text(encoding="utf-8") == '"old"'
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]  # no temporary files are left
+    assert PathSaveJSON().save_json({1, 2}, str(tmp_path / "set.json")) == (False,)  # not JSON serializable
+    assert PathLoadJSON().load_json(str(tmp_path / "missing.json")) == (None, False)
+    (tmp_path / "invalid.json").write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError):
+        PathLoadJSON().load_json(str(tmp_path / "invalid.json"))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_path_load_save_json_lines(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("src.basic_data_handling._json_io.orjson", None)
+    records = [{"id": i, "prompt": f"prompt {i}"} for i in range(5)]
+    path = str(tmp_path / "records.jsonl")
+    assert PathSaveJSONLines().save_json_lines(records=records, path=[path]) == (True, 5)
+    assert PathLoadJSONLines().load_json_lines(path) == (records, True)
+    assert PathLoadJSONLines().load_json_lines(path, start=1, limit=2) == (records[1:3], True)
+    assert PathLoadJSONLines().load_json_lines(path, start=4, limit=10) == (records[4:], True)
+    assert PathLoadJSONLines().load_json_lines(str(tmp_path / "missing.jsonl")) == ([], False)
+
+    # Empty lines are skipped, invalid lines report their line number
+    (tmp_path / "gaps.jsonl").write_text('1\n\n"two"\nnot json\n', encoding="utf-8")
+    assert PathLoadJSONLines().load_json_lines(str(tmp_path / "gaps.jsonl"), limit=2) == ([1, "two"], True)
+    with pytest.raises(ValueError, match="line 4"):
+        PathLoadJSONLines().load_json_lines(str(tmp_path / "gaps.jsonl"))
+
+
+def test_path_load_csv(tmp_path):
+    node = PathLoadCSV()
+    path = tmp_path / "manifest.csv"
+    path.write_text(
+        'path,prompt,seed,cfg,upscale,note\n'
+        'a.png,"a cat, sitting",1,7.5,true,x\n'
+        'b.png,"a ""quoted"" dog",2,8,false\n'
+        'c.png,"multi\nline",3,6.5,True,z\n',
+        encoding="utf-8",
+    )
+    # All columns, up to the number of outputs, with inferred types
+    result = node.load_csv(str(path))
+    assert result[0] == ["a.png", "b.png", "c.png"]
+    assert result[1] == ["a cat, sitting", 'a "quoted" dog', "multi\nline"]
+    assert result[2] == [1, 2, 3]
+    assert result[3] == [7.5, 8.0, 6.5]
+    assert result[4] == [True, False, True]
+    assert result[5:] == (["path", "prompt", "seed", "cfg", "upscale"], 3)
+
+    # Selected columns by name and number, a row range and no type inference
+    result = node.load_csv(str(path), columns="seed, 0, note", start=1, limit=1, infer_types=False)
+    assert result == (["2"], ["b.png"], [""], [], [], ["seed", "path", "note"], 1)
+
+    # Without a header the first row is data and the columns are named by their number
+    tsv = tmp_path / "data.tsv"
+    tsv.write_text("1\t2\n3\t4\n", encoding="utf-8")
+    assert node.load_csv(str(tsv), has_header=False, delimiter="\\t") == ([1, 3], [2, 4], [], [], [], ["0", "1"], 2)
+
+    with pytest.raises(ValueError, match="Unknown CSV column"):
+        node.load_csv(str(path), columns="missing")
+    with pytest.raises(ValueError, match="column 12 doesn't exist"):
+        node.load_csv(str(path), columns="path, 12")
+    with pytest.raises(ValueError, match="column 2 doesn't exist"):
+        node.load_csv(str(tsv), columns="2", has_header=False, delimiter="\\t")
+    with pytest.raises(ValueError, match="At most 5"):
+        node.load_csv(str(path), columns="0,1,2,3,4,5")
+
+
 def test_path_abspath():
     node = PathAbspath()
     assert node.get_abspath(".") == (os.path.abspath("."),)
@@ -518,6 +620,13 @@ def test_path_glob(tmp_path):
     no_match_result = node.glob_paths(str(tmp_path / "nomatch*.txt"))
     assert len(no_match_result[0]) == 0
 
+    # IS_CHANGED only changes when the matching paths change
+    pattern = str(tmp_path / "*.txt")
+    assert PathGlob.IS_CHANGED(pattern) == PathGlob.IS_CHANGED(pattern)
+    before = PathGlob.IS_CHANGED(pattern)
+    (tmp_path / "file4.txt").write_text("content")
+    assert PathGlob.IS_CHANGED(pattern) != before
+
 
 def test_path_expand_vars(monkeypatch):
     node = PathExpandVars()
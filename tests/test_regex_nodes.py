@@ -1,4 +1,4 @@
-#import pytest
+import pytest
 from src.basic_data_handling.regex_nodes import (
     RegexSearchGroupsDataList,
     RegexGroupDict,
@@ -8,7 +8,12 @@ from src.basic_data_handling.regex_nodes import (
     RegexTest,
     RegexFindallList,
     RegexSearchGroupsList,
-    RegexSplitList
+    RegexSplitList,
+    RegexCacheInfo,
+    RegexDataListFindall,
+    RegexDataListSub,
+    RegexDataListTest,
+    RegexMatchPatternSet,
 )
 
 def test_regex_search_groups():
@@ -84,3 +89,101 @@ def test_regex_test():
     assert node.test(r"def", "a quick abc") == (False,)
     assert node.test(r"\d+", "contains 456") == (True,)
     assert node.test(r"^\s*$", "") == (True,)  # Empty string matches whitespace pattern
+
+
+def test_regex_flags():
+    assert RegexTest().test(r"hello", "HELLO world", ignorecase=True) == (True,)
+    assert RegexTest().test(r"hello", "HELLO world") == (False,)
+    assert RegexFindallList().findall(r"^\w+", "one\ntwo", multiline=True) == (["one", "two"],)
+    assert RegexSearchGroupsList().search_groups(r"a(.)b", "a\nb", dotall=True) == (["\n"],)
+    assert RegexSub().sub(r"\d + # digits", "#", "a1 b22", verbose=True) == ("a# b#",)
+
+
+def test_regex_cache_info():
+    node = RegexCacheInfo()
+    node.cache_info(clear=True)
+    RegexTest().test(r"cache_test_\d", "cache_test_1")
+    RegexTest().test(r"cache_test_\d", "cache_test_2")
+    RegexTest().test(r"cache_test_\d", "CACHE_TEST_3", ignorecase=True)
+    hits, misses, size, max_size = node.cache_info()
+    assert (hits, misses, size) == (1, 2, 2)
+
+    # Shrinking the cache drops the least recently used patterns
+    assert node.cache_info(max_size=1)[2:] == (1, 1)
+    node.cache_info(clear=True)
+    assert node.cache_info() == (0, 0, 0, 1024)
+
+
+def test_regex_data_list_test():
+    node = RegexDataListTest()
+    strings = ["a cat", "a dog", "Cat"]
+    assert node.test(strings=strings, pattern=[r"cat"]) == ([True, False, False],)
+    assert node.test(strings=strings, pattern=[r"cat"], ignorecase=[True]) == ([True, False, True],)
+    assert node.test(strings=[], pattern=[r"cat"]) == ([],)
+
+
+def test_regex_data_list_sub():
+    node = RegexDataListSub()
+    strings = ["a1b2", "c3", "none"]
+    assert node.sub(strings=strings, pattern=[r"\d"], repl=["#"], count=[0]) == (["a#b#", "c#", "none"],)
+    assert node.sub(strings=strings, pattern=[r"\d"], repl=["#"], count=[1]) == (["a#b2", "c#", "none"],)
+
+
+def test_regex_data_list_findall():
+    node = RegexDataListFindall()
+    assert node.findall(strings=["a1b2", "c3", "x"], pattern=[r"\d"]) == ([["1", "2"], ["3"], []],)
+
+
+def test_regex_match_pattern_set_literal():
+    node = RegexMatchPatternSet()
+    keywords = ["cat", "cats", "dog", "at", "bird"]
+    assert node.match("two cats", keywords) == (["cat", "cats", "at"], True, 3)
+    assert node.match("a fish", keywords) == ([], False, 0)
+    assert node.match("A DOG", keywords, ignorecase=True) == (["dog"], True, 1)
+    assert node.match("a dog and a cat", {"cat", "dog", "cow"}) == (["cat", "dog"], True, 2)
+    assert node.match("anything", []) == ([], False, 0)
+    # Regex characters are taken literally
+    assert node.match("1+1", ["1+1", "a.b"]) == (["1+1"], True, 1)
+
+
+def test_regex_match_pattern_set_regex():
+    node = RegexMatchPatternSet()
+    patterns = [r"cat", r"cats?", r"\d+", r"^two"]
+    assert node.match("two cats 42", patterns, mode="regex") == (patterns, True, 4)
+    assert node.match("a cat", patterns, mode="regex") == ([r"cat", r"cats?"], True, 2)
+    assert node.match("TWO", patterns, mode="regex", ignorecase=True) == ([r"^two"], True, 1)
+    # A pattern that matches first doesn't hide the others at the same position, also with groups
+    patterns = [r"a", r"ab", r"(?P<first>b)(c)", r"x|c$"]
+    assert node.match("abc", patterns, mode="regex") == (patterns, True, 4)
+    # Patterns with backreferences, conditionals or inline flags are searched on their own
+    assert node.match("zzxx", [r"a", r"(x)\1"], mode="regex") == ([r"(x)\1"], True, 1)
+    patterns = [r"(?P<q>q)(?P=q)", r"(a)?(?(1)b|z)", r"(?i)Z", r"x"]
+    assert node.match("zzqq", patterns, mode="regex") == ([r"(?P<q>q)(?P=q)", r"(a)?(?(1)b|z)", r"(?i)Z"], True, 3)
+    # A pattern that matches everywhere doesn't stop the others from being found
+    assert node.match("e " * 100 + "cat", [r"e", r"cat", r"dog"], mode="regex") == ([r"e", r"cat"], True, 2)
+
+
+def test_regex_timeout_stops_catastrophic_backtracking():
+    node = RegexTest()
+    with pytest.raises(TimeoutError):
+        node.test(r"(a+)+$", "a" * 40 + "b", timeout=0.5)
+
+
+def test_regex_timeout_returns_results():
+    assert RegexFindallList().findall(r"\d", "a1b2", timeout=10.0) == (["1", "2"],)
+    assert RegexSub().sub(r"\d", "#", "a1b2", count=1, timeout=10.0) == ("a#b2",)
+    assert RegexGroupDict().groupdict(r"(?P<n>\d+)", "x42", timeout=10.0) == ({"n": "42"},)
+    assert RegexDataListTest().test(strings=["A", "b"], pattern=["a"], ignorecase=[True], timeout=[10.0]) == ([True, False],)
+
+
+def test_regex_check_pattern():
+    node = RegexTest()
+    with pytest.raises(ValueError):
+        node.test(r"(a+)+$", "aaa", check_pattern=True)
+    with pytest.raises(ValueError):
+        node.test(r"(\w+\s?)*x", "aaa", check_pattern=True)
+    with pytest.raises(ValueError):
+        RegexDataListFindall().findall(strings=["aaa"], pattern=[r"(?:a|b*)*"], check_pattern=[True])
+    # Bounded and sequential quantifiers are fine
+    assert node.test(r"(a{1,3})+b", "aab", check_pattern=True) == (True,)
+    assert node.test(r"a+b+c*", "abc", check_pattern=True) == (True,)
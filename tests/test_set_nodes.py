@@ -1,4 +1,7 @@
-#import pytest
+import random
+import timeit
+import pytest
+from typing import Any, Callable
 from src.basic_data_handling.set_nodes import (
     SetAdd,
     SetAll,
@@ -10,9 +13,11 @@ from src.basic_data_handling.set_nodes import (
     SetCreateFromInt,
     SetCreateFromString,
     SetDifference,
+    SetDifferenceMany,
     SetDiscard,
     SetEnumerate,
     SetIntersection,
+    SetIntersectionMany,
     SetIsDisjoint,
     SetIsSubset,
     SetIsSuperset,
@@ -20,11 +25,15 @@ from src.basic_data_handling.set_nodes import (
     SetPop,
     SetPopRandom,
     SetRemove,
+    SetSample,
+    SetStatistics,
     SetSum,
     SetSymmetricDifference,
+    SetSymmetricDifferenceMany,
     SetToDataList,
     SetToList,
     SetUnion,
+    SetUnionMany,
 )
 
 def test_set_create():
@@ -133,6 +142,27 @@ def test_set_pop_random():
     assert node.pop_random_element(empty_set) == (set(), None)
 
 
+def test_set_sample():
+    node = SetSample()
+    original_set = set(range(1000))
+    result = node.sample(original_set, 10, seed=7)[0]
+    assert len(result) == 10
+    assert len(set(result)) == 10  # Without replacement
+    assert set(result) <= original_set
+    assert node.sample(original_set, 10, seed=7) == (result,)  # Reproducible
+    assert sorted(node.sample({1, 2, 3}, 5)[0]) == [1, 2, 3]  # Smaller than count
+    assert node.sample(set(), 2) == ([],)
+    assert node.sample({1, 2}, 0) == ([],)
+
+
+def test_set_statistics():
+    node = SetStatistics()
+    count, total, minimum, maximum, mean, stddev = node.statistics({1, 2, 3, 4})
+    assert (count, total, minimum, maximum, mean) == (4, 10, 1, 4, 2.5)
+    assert node.statistics({1, 2, 3, 4}, "sample")[5] == pytest.approx(1.2909944487)
+    assert node.statistics(set()) == (0, 0, None, None, None, None)
+
+
 def test_set_union():
     node = SetUnion()
     assert node.union({1, 2}, {3, 4}) == ({1, 2, 3, 4},)
@@ -151,6 +181,64 @@ def test_set_intersection():
     assert node.intersection(set(), {1, 2, 3}) == (set(),)  # Empty set intersection
 
 
+def test_set_operations_many():
+    assert SetUnionMany().union(set_0={1, 2}, set_1={2, 3}, set_2={5}) == ({1, 2, 3, 5},)
+    assert SetIntersectionMany().intersection(set_0={1, 2, 3}, set_1={2, 3, 4}, set_2={3, 2, 9}) == ({2, 3},)
+    assert SetIntersectionMany().intersection(set_0={1}, set_1={2}, set_2={1, 2}) == (set(),)
+    assert SetDifferenceMany().difference(set_0={1, 2, 3, 4}, set_1={2}, set_2={4, 5}) == ({1, 3},)
+    assert SetSymmetricDifferenceMany().symmetric_difference(set_0={1, 2}, set_1={2, 3}, set_2={3, 4}) == ({1, 4},)
+    # Inputs are used in the order of their numbers, unconnected ones are skipped
+    assert SetDifferenceMany().difference(set_1={2}, set_0={1, 2}, set_2=None) == ({1},)
+    for node, function in [(SetUnionMany(), "union"), (SetIntersectionMany(), "intersection"),
+                           (SetDifferenceMany(), "difference"), (SetSymmetricDifferenceMany(), "symmetric_difference")]:
+        assert getattr(node, function)() == (set(),)
+        single = {1, 2}
+        result = getattr(node, function)(set_0=single)[0]
+        assert result == single and result is not single  # the input isn't changed later on
+
+
+def test_set_operations_many_match_chained_nodes():
+    # The same results as chaining the two SET nodes, for 100k element SETs
+    sets = [set(range(start, start + 100_000)) for start in (0, 20_000, 50_000, 90_000)]
+    kwargs = {f"set_{i}": s for i, s in enumerate(sets)}
+    for many, chained in [(SetUnionMany().union, SetUnion().union),
+                          (SetIntersectionMany().intersection, SetIntersection().intersection),
+                          (SetDifferenceMany().difference, SetDifference().difference),
+                          (SetSymmetricDifferenceMany().symmetric_difference, SetSymmetricDifference().symmetric_difference)]:
+        expected = sets[0]
+        for other in sets[1:]:
+            expected = chained(expected, other)[0]
+        assert many(**kwargs) == (expected,)
+
+
+@pytest.mark.benchmark
+def test_set_operations_many_benchmark(record_property: Callable[[str, object], None]) -> None:
+    # Compares the timings with chaining the two SET nodes, for 10 random SETs of 100k down to 10k
+    # elements that overlap, so the intersection doesn't get empty right away. Run with `-m benchmark`,
+    # the timings are recorded as properties of the test, e.g. for `-o junit_family=xunit1 --junitxml=...`.
+    rng = random.Random(0)
+    sets = [set(rng.sample(range(200_000), 100_000 - 10_000 * i)) for i in range(10)]
+    kwargs = {f"set_{i}": s for i, s in enumerate(sets)}
+
+    def chain(function: Callable[[set[Any], set[Any]], tuple[set[Any]]]) -> Callable[[], set[Any]]:
+        def run() -> set[Any]:
+            result = sets[0]
+            for other in sets[1:]:
+                result = function(result, other)[0]
+            return result
+        return run
+
+    def best_time(function: Callable[[], Any]) -> float:
+        return min(timeit.repeat(function, number=1, repeat=3))
+
+    for name, many, chained in [("union", SetUnionMany().union, SetUnion().union),
+                                ("intersection", SetIntersectionMany().intersection, SetIntersection().intersection),
+                                ("difference", SetDifferenceMany().difference, SetDifference().difference)]:
+        assert many(**kwargs) == (chain(chained)(),)
+        record_property(f"{name}_ms", round(best_time(lambda: many(**kwargs)) * 1000, 1))
+        record_property(f"{name}_chained_ms", round(best_time(chain(chained)) * 1000, 1))
+
+
 def test_set_difference():
     node = SetDifference()
     assert node.difference({1, 2, 3}, {2, 3, 4}) == ({1},)
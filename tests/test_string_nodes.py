@@ -1,4 +1,5 @@
-#import pytest
+import os
+import pytest
 
 from src.basic_data_handling.string_nodes import (
     StringCapitalize,
@@ -6,7 +7,13 @@ from src.basic_data_handling.string_nodes import (
     StringCenter,
     StringConcat,
     StringCount,
+    StringDataListFormatMap,
     StringDataListJoin,
+    StringDataListJoinToFile,
+    StringDataListMap,
+    StringDataListReplaceMany,
+    StringDataListSplit,
+    StringDataListTest,
     StringDecode,
     StringEncode,
     StringEndswith,
@@ -29,12 +36,14 @@ from src.basic_data_handling.string_nodes import (
     StringIsUpper,
     StringLength,
     StringListJoin,
+    StringListJoinToFile,
     StringLjust,
     StringLower,
     StringLstrip,
     StringRemoveprefix,
     StringRemovesuffix,
     StringReplace,
+    StringReplaceMany,
     StringRfind,
     StringRjust,
     StringRsplitDataList,
@@ -47,6 +56,7 @@ from src.basic_data_handling.string_nodes import (
     StringStartswith,
     StringStrip,
     StringSwapcase,
+    StringTemplateFields,
     StringTitle,
     StringUnescape,
     StringUpper,
@@ -230,6 +240,90 @@ def test_join():
     assert node_list.join([""], ["a", "b", "c"]) == ("abc",)
     assert node_list.join(["-"], []) == ("",)  # Empty list
 
+def test_join_to_file(tmp_path):
+    path = str(tmp_path / "sub" / "joined.txt")
+    node = StringDataListJoinToFile()
+    strings = [f"caption {i}" for i in range(10)] + ["äö"]
+    assert node.join_to_file(strings=strings, sep=[", "], path=[path], chunk_size=[3]) == (len(", ".join(strings).encode()), path)
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == ", ".join(strings)
+    assert node.join_to_file(strings=[], sep=[", "], path=[path]) == (0, path)
+
+    node_list = StringListJoinToFile()
+    assert node_list.join_to_file([1, "b", 2.5], "-", path, chunk_size=2) == (7, path)
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "1-b-2.5"
+    with pytest.raises(ValueError):
+        node_list.join_to_file(["a"], "-", "")
+    # A failed write keeps the existing file
+    with pytest.raises(UnicodeEncodeError):
+        node_list.join_to_file(["a", "b", "ä"], "-", path, chunk_size=1, encoding="ascii")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "1-b-2.5"
+    assert os.listdir(tmp_path / "sub") == ["joined.txt"]
+
+def test_data_list_map():
+    node = StringDataListMap()
+    strings = ["  Hello ", "wORLD", ""]
+    assert node.map(strings=strings, operation=["upper"]) == (["  HELLO ", "WORLD", ""],)
+    assert node.map(strings=strings, operation=["strip"]) == (["Hello", "wORLD", ""],)
+    assert node.map(strings=["xxaxx"], operation=["strip"], text=["x"]) == (["a"],)
+    assert node.map(strings=["a-b-c", "d"], operation=["replace"], text=["-"], new_text=["+"]) == (["a+b+c", "d"],)
+    assert node.map(strings=["a-b-c"], operation=["replace"], text=["-"], new_text=["+"], count=[1]) == (["a+b-c"],)
+    assert node.map(strings=["img_1", "2"], operation=["removeprefix"], text=["img_"]) == (["1", "2"],)
+    assert node.map(strings=["cat", "dog"], operation=["add suffix"], text=[", photo"]) == (["cat, photo", "dog, photo"],)
+    assert node.map(strings=["7", "42"], operation=["zfill"], width=[3]) == (["007", "042"],)
+    assert node.map(strings=["ab"], operation=["center"], width=[6], text=["*"]) == (["**ab**"],)
+    assert node.map(strings=[], operation=["lower"]) == ([],)
+
+
+def test_data_list_format_map():
+    node = StringDataListFormatMap()
+    mappings = [{"name": "cat", "n": 1}, {"name": "dog", "n": 2.5}]
+    assert node.format_map(mappings=mappings, template=["{name}: {n:.2f}"]) == (["cat: 1.00", "dog: 2.50"],)
+    assert node.format_map(mappings=[{"a": {"b": [1, 2]}}], template=["{a[b][1]}!r {a!r:>4}"]) == (["2!r {'b': [1, 2]}"],)
+    assert node.format_map(mappings=[{"x": 5, "w": 4}], template=["{x:>{w}}|{{x}}"]) == (["   5|{x}"],)
+    assert node.format_map(mappings=[], template=["{x}"]) == ([],)
+
+    mappings = [{"name": "cat"}, {}]
+    with pytest.raises(KeyError):
+        node.format_map(mappings=mappings, template=["a {name}"])
+    assert node.format_map(mappings=mappings, template=["a {name}"], missing=["empty"]) == (["a cat", "a "],)
+    assert node.format_map(mappings=mappings, template=["a {name}"], missing=["default"], default=["thing"]) == (["a cat", "a thing"],)
+    assert node.format_map(mappings=mappings, template=["a {name!s:>3}"], missing=["keep"]) == (["a cat", "a {name!s:>3}"],)
+    with pytest.raises(ValueError):
+        node.format_map(mappings=mappings, template=["{0}"])
+
+
+def test_data_list_replace_many():
+    node = StringDataListReplaceMany()
+    strings = ["a cat", "a dog", ""]
+    assert node.replace(strings=strings, replacements=[{"cat": "dog", "dog": "cat"}]) == (["a dog", "a cat", ""],)
+    assert node.replace(strings=strings, replacements=[{}]) == (strings,)
+    assert node.replace(strings=[], replacements=[{"a": "b"}]) == ([],)
+
+
+def test_data_list_split():
+    node = StringDataListSplit()
+    strings = ["a b c", "", "d  e"]
+    assert node.split(strings=strings, mode=["split"]) == (["a", "b", "c", "d", "e"], [0, 0, 0, 2, 2], [3, 0, 2])
+    assert node.split(strings=["a,b,c", "d"], mode=["rsplit"], sep=[","], maxsplit=[1]) == (["a,b", "c", "d"], [0, 0, 1], [2, 1])
+    assert node.split(strings=["l1\nl2", "l3\n"], mode=["splitlines"], keepends=[True]) == (["l1\n", "l2", "l3\n"], [0, 0, 1], [2, 1])
+    assert node.split(strings=["a1b22c", "x"], mode=["regex"], sep=[r"\d+"]) == (["a", "b", "c", "x"], [0, 0, 0, 1], [3, 1])
+    assert node.split(strings=[], mode=["split"]) == ([], [], [])
+
+
+def test_data_list_test():
+    node = StringDataListTest()
+    strings = ["a cat", "a dog", "cat"]
+    assert node.test(strings=strings, operation=["contains"], text=["cat"]) == ([True, False, True],)
+    assert node.test(strings=strings, operation=["startswith"], text=["a "]) == ([True, True, False],)
+    assert node.test(strings=strings, operation=["endswith"], text=["dog"]) == ([False, True, False],)
+    assert node.test(strings=strings, operation=["equals"], text=["cat"]) == ([False, False, True],)
+    assert node.test(strings=["123", "12a"], operation=["isdigit"]) == ([True, False],)
+    assert node.test(strings=[], operation=["isupper"]) == ([],)
+
+
 def test_ljust():
     node = StringLjust()
     assert node.ljust("test", 10) == ("test      ",)
@@ -268,6 +362,15 @@ def test_replace():
     assert node.replace("banana", "a", "o", 2) == ("bonona",)  # Limit replacement to 2 occurrences
     assert node.replace("no matches", "x", "y") == ("no matches",)  # No matches
 
+def test_replace_many():
+    node = StringReplaceMany()
+    assert node.replace("hello world", {"hello": "goodbye", "world": "moon"}) == ("goodbye moon",)
+    assert node.replace("abba", {"a": "b", "b": "a"}) == ("baab",)  # single pass, no cascading
+    assert node.replace("a_b c", {"_": " ", " ": ", "}) == ("a b, c",)  # single characters use translate
+    assert node.replace("catalog cat", {"cat": "dog", "catalog": "list"}) == ("list dog",)  # longest match
+    assert node.replace("1+1=2", {"1+1": "two", "": "x"}) == ("two=2",)  # literal keys, empty key ignored
+    assert node.replace("text", {}) == ("text",)
+
 def test_rfind():
     node = StringRfind()
     assert node.rfind("hello world hello", "hello") == (12,)
@@ -346,6 +449,13 @@ def test_swapcase():
     assert node.swapcase("") == ("",)  # Empty string
     assert node.swapcase("123") == ("123",)  # No cased characters
 
+def test_template_fields():
+    node = StringTemplateFields()
+    assert node.fields("{user.name} has {count:{width}} {user[id]}") == (["user", "count", "width"],)
+    assert node.fields("no {{fields}} here") == ([],)
+    with pytest.raises(ValueError):
+        node.fields("{}")
+
 def test_title():
     node = StringTitle()
     assert node.title("hello world") == ("Hello World",)
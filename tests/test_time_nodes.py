@@ -1,13 +1,18 @@
-#import pytest
+import pytest
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from src.basic_data_handling.time_nodes import (
     TimeNow,
     TimeNowUTC,
     TimeToUnix,
     UnixToTime,
+    TimeConvertTimezone,
+    TimeDataListConvertTimezone,
+    TimeLocalize,
     TimeFormat,
     TimeParse,
+    TimeDataListParse,
+    TimeDataListFormat,
     TimeDelta,
     TimeAddDelta,
     TimeSubtractDelta,
@@ -74,6 +79,29 @@ def test_unix_to_time():
     assert returned_dt.minute == 0
     assert returned_dt.second == 0
 
+def test_time_convert_timezone():
+    node = TimeConvertTimezone()
+    utc_time = datetime(2023, 7, 1, 12, 0, tzinfo=timezone.utc)
+    result = node.convert(utc_time, "Europe/Berlin")[0]
+    assert (result.hour, result.utcoffset()) == (14, timedelta(hours=2))
+    assert result == utc_time  # the same moment in time
+    assert node.convert(result, "utc")[0].tzinfo is timezone.utc
+    with pytest.raises(ValueError):
+        node.convert(utc_time, "Not/A_Zone")
+
+def test_time_data_list_convert_timezone():
+    node = TimeDataListConvertTimezone()
+    datetimes = [datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc), datetime(2023, 7, 1, 12, 0, tzinfo=timezone.utc)]
+    result = node.convert(datetimes=datetimes, timezone=["America/New_York"])[0]
+    assert [value.hour for value in result] == [7, 8]  # standard and daylight saving time
+    assert node.convert(datetimes=[], timezone=["UTC"]) == ([],)
+
+def test_time_localize():
+    node = TimeLocalize()
+    result = node.localize(datetime(2023, 1, 1, 12, 0), "Asia/Tokyo")[0]
+    assert result.hour == 12
+    assert result.utcoffset() == timedelta(hours=9)
+
 def test_time_format():
     node = TimeFormat()
     test_datetime = datetime(2023, 1, 1, 12, 30, 45)
@@ -110,6 +138,31 @@ def test_time_parse():
     assert parsed_datetime.hour == 12
     assert parsed_datetime.minute == 30
 
+def test_time_data_list_parse():
+    node = TimeDataListParse()
+    strings = ["2023-01-01 12:30:45", "2023-1-2 3:04:05", "1999-12-31 23:59:59"]  # not zero padded uses strptime
+    assert node.parse_times(time_strings=strings, format_string=["%Y-%m-%d %H:%M:%S"]) == (
+        [datetime(2023, 1, 1, 12, 30, 45), datetime(2023, 1, 2, 3, 4, 5), datetime(1999, 12, 31, 23, 59, 59)],)
+    assert node.parse_times(time_strings=["31/12/2023 01:02:03.25"], format_string=["%d/%m/%Y %H:%M:%S.%f"]) == (
+        [datetime(2023, 12, 31, 1, 2, 3, 250000)],)
+    assert node.parse_times(time_strings=["12:30"], format_string=["%H:%M"]) == ([datetime(1900, 1, 1, 12, 30)],)
+    assert node.parse_times(time_strings=["Jan 05 2024"], format_string=["%b %d %Y"]) == ([datetime(2024, 1, 5)],)
+    assert node.parse_times(time_strings=["2024-01-02T03:04:05Z", "2024-01-02"], format_string=["ISO-8601"]) == (
+        [datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), datetime(2024, 1, 2)],)
+    assert node.parse_times(time_strings=[], format_string=["%Y"]) == ([],)
+    with pytest.raises(ValueError):
+        node.parse_times(time_strings=["2023-02-30 00:00:00"], format_string=["%Y-%m-%d %H:%M:%S"])
+    with pytest.raises(ValueError):
+        node.parse_times(time_strings=["2023-01-01"], format_string=["%Y-%m-%d %H:%M:%S"])
+
+def test_time_data_list_format():
+    node = TimeDataListFormat()
+    datetimes = [datetime(2023, 1, 1, 12, 30, 45), datetime(2024, 2, 29)]
+    assert node.format_times(datetimes=datetimes, format_string=["%Y-%m-%d %H:%M:%S"]) == (
+        ["2023-01-01 12:30:45", "2024-02-29 00:00:00"],)
+    assert node.format_times(datetimes=datetimes, format_string=["ISO-8601"]) == (
+        ["2023-01-01T12:30:45", "2024-02-29T00:00:00"],)
+
 def test_time_delta():
     node = TimeDelta()
 